@@ -17,7 +17,8 @@
 
   Demo uses an event loop to manage threads that send MIDI sequences and
   other data via well-defined OSC paths.  One thread tracks the others and
-  posts state to stdout.
+  posts state to stdout.  Threads tick at subdivisions of one shared
+  music.BeatClock, so sequences stay aligned and do not drift.
 
 """
 
@@ -55,16 +56,13 @@ bpm  :float  = 25   #DEFAULT
 
 
 #
-lowThreadEnabled             :bool   = True
-lowSequenceEnabled           :bool   = False
 lowCount                     :float  = -1.0          #NB Initial value out of range.
 lowCountPrev                 :float  = lowCount
 lowSequenceSubdivision       :float  = 2.0
 lowSequenceOrnamentsEnabled  :bool   = False
 lowOrnament                  :str    = ""
+lowOrnaments                 :music.OrnamentGenerator  = music.OrnamentGenerator()
 
-highThreadEnabled        :bool   = True
-highSequenceEnabled      :bool   = False
 highCount                :float  = -1.0              #NB Initial value out of range.
 highCountPrev            :float  = highCount
 highSequenceSubdivision  :float  = 7.0
@@ -74,12 +72,19 @@ kapowString  :str  = ""
 
 
 #
-postThreadEnabled  :bool  = True
-postEventsEnabled  :bool  = True
-
 commonSequenceSubdivision  :float  = lowSequenceSubdivision * highSequenceSubdivision
 
 
+# Threads wait on tickers, which are enabled and disabled by hotkeys.
+#   Stopping the clock ends all threads.
+#
+clock  :music.BeatClock  = music.BeatClock(bpm)
+
+lowTicker   :music.BeatTicker  = clock.ticker(lowSequenceSubdivision, enabled=False)
+highTicker  :music.BeatTicker  = clock.ticker(highSequenceSubdivision, enabled=False)
+postTicker  :music.BeatTicker  = clock.ticker(commonSequenceSubdivision)
+
+
 
 
 #-------------------------------------- -o--
@@ -92,17 +97,14 @@ def  lowSequence(**kwargs:dict)  -> None:
 
     value    :int  = music.generateScaleSequence(**kwargs)
 
-    while  True:
-        if  not lowThreadEnabled:  break
-        if  not lowSequenceEnabled:  continue
-
+    while  lowTicker.wait():
         lowCount     = next(value)
         lowOrnament  = ""
 
         msg = client.cmixMessage("/lowSequence", [lowCount])
 
         if  lowSequenceOrnamentsEnabled:
-            ornamentBlob = music.generateOrnament(lowCount, kwargs["key"], kwargs["mode"], bpm)
+            ornamentBlob = lowOrnaments.generate(lowCount, kwargs["key"], kwargs["mode"], bpm)
 
             if  ornamentBlob:
                 ornamentName, ornamentBPM, ornamentSubdivision, ornament  = tuple(ornamentBlob)
@@ -110,7 +112,6 @@ def  lowSequence(**kwargs:dict)  -> None:
                 msg = client.cmixMessageAdd(msg, ornamentName, [ornamentBPM, ornamentSubdivision, ornament])
 
         client.send(msg)
-        sleepSubdivisionPerBeat(lowSequenceSubdivision)
 
 
 #                                               -o-
@@ -119,15 +120,10 @@ def  highSequence(**kwargs:dict)  -> None:
 
     value  :int  = music.generateScaleSequence(**kwargs)
 
-    while  True:
-        if  not highThreadEnabled:  break
-        if  not highSequenceEnabled:  continue
-
+    while  highTicker.wait():
         highCount = next(value)
         client.messageSend("/highSequence", [highCount])
 
-        sleepSubdivisionPerBeat(highSequenceSubdivision)
-
 
 #                                               -o-
 def  makeBoom()  -> None:
@@ -180,12 +176,8 @@ def  postOneEvent()  -> None:
 
 #                                               -o-
 def  postEvents()  -> None:
-    while  True:
-        if  not postThreadEnabled:  break
-        if  not postEventsEnabled:  continue
-
+    while  postTicker.wait():
         postOneEvent()
-        sleepSubdivisionPerBeat(commonSequenceSubdivision)
 
 
 #                                               -o-
@@ -312,6 +304,8 @@ if  "__main__" == __name__:
     #-------------------------------------------- -o-
     # Run event loop.
 
+    clock.start()
+
     lowThread.start()
     highThread.start()
     postThread.start()
@@ -331,6 +325,7 @@ if  "__main__" == __name__:
         #
         elif  'M' == ch:                # BPM up/down
             bpm += 1
+            clock.setBPM(bpm)
             log.info(f"BPM = {bpm}")
 
         elif  'm' == ch:
@@ -339,31 +334,34 @@ if  "__main__" == __name__:
                 bpm = 1
                 log.warning("bpm cannot DROP BELOW 1.")
 
+            clock.setBPM(bpm)
             log.info(f"BPM = {bpm}")
 
         elif  'o' == ch:                # OSC reporting on/off
             client.enablePathLogging  = not client.enablePathLogging
 
         elif  't' == ch:                # Timeline off/on
-            postEventsEnabled  = not postEventsEnabled
+            postTicker.toggle()
 
 
         #
         elif  'l' == ch:                # lowSequence on/off
-            lowSequenceEnabled  = not lowSequenceEnabled
+            lowTicker.toggle()
 
         elif  'L' == ch:                # lowSequence ornaments on/off
             ornamentStatus = "ENABLED"
 
             lowSequenceOrnamentsEnabled  = not lowSequenceOrnamentsEnabled
-            if  not lowSequenceOrnamentsEnabled:
-                music.generateOrnamentReset()
+            if  lowSequenceOrnamentsEnabled:
+                lowOrnaments.prepare(64)        # Decide ornaments for the next 64 beats, outside of lowSequence().
+            else:
+                lowOrnaments.reset()
                 ornamentStatus = "DISABLED"
 
             log.info(f"Ornaments for Low Sequence are {ornamentStatus}.")
 
         elif  'h' == ch:                # highSequence on/off
-            highSequenceEnabled  = not highSequenceEnabled
+            highTicker.toggle()
 
 
         #
@@ -377,13 +375,11 @@ if  "__main__" == __name__:
         #
         elif  'R' == ch:                # Reset state of highSequenceSound(). 
             client.messageSend("/resetScore")
-            music.generateOrnamentReset()
+            lowOrnaments.reset()
     
 
     #
-    lowThreadEnabled    = False
-    highThreadEnabled   = False
-    postThreadEnabled   = False
+    clock.stop()
 
     lowThread.join()
     highThread.join()
@@ -58,6 +58,9 @@ def handlerOSCMessagesForCMIX(*eventArgs):
 
 #                                                                    -o-
 def  handlerDestroyServer(*eventArgs):
+  if  cmdlineArgs.cmixWorkerPoolSize > 0:
+    server.destroyCMIXWorkerPool()
+
   server.destroyServer()
 
 
@@ -87,6 +90,12 @@ if  "__main__" == __name__:
         "help"            : "Score to load into CMIX.  (When CMIX build DOES NOT enable OSC.)",    
       },                                                        
 
+      { "option_strings"  : "--cmixWorkerPoolSize",                           
+        "default"         : 0,
+        "type"            : int,                              
+        "help"            : "Number of long-lived CMIX processes, if CMIX supports them.  Zero (0) runs CMIX once per OSC message.",    
+      },                                                        
+
     ] )
 
 
@@ -100,6 +109,18 @@ if  "__main__" == __name__:
 
   server.createServer(cmdlineArgs.hostname, cmdlineArgs.port)
 
+  # NB  CMIX worker pool is used only if the local CMIX runs MinC 
+  #     directives as they arrive on stdin.  Otherwise, run CMIX once 
+  #     per OSC message.
+  #
+  if  cmdlineArgs.cmixWorkerPoolSize > 0:
+    if  mosRTcmix.testCMIXRunsDirectivesFromStdin():
+      mosRTcmix.enableCMIXWorkerPool = True
+      server.createCMIXWorkerPool(cmdlineArgs.pathToCMIXScore, cmdlineArgs.cmixWorkerPoolSize)
+    else:
+      mosRTcmix.log.warning("Running CMIX once per OSC message, WITHOUT worker pool.")
+      cmdlineArgs.cmixWorkerPoolSize = 0
+
 
   # OSC paths defined by OSC client and CMIX score.  
   #   See soundsAndSequences_OSCClient.py and soundsAndSequences.sco.
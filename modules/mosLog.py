@@ -5,6 +5,16 @@
     Log messages at different log levels in context of <class>.<method>.
     Use inspect to find class, module, function or script names.
 
+    Caller signatures are resolved from sys._getframe() and cached per 
+    code object and line.  scriptName() is resolved once per process.
+
+    Disabled levels return before any work is done.  Message strings are
+    created only when a record is emitted.  See isEnabledFor(), deferred().
+
+    Optionally, route records through a bounded queue to a background 
+    writer thread, so slow terminals or pipes do not stall the caller.  
+    See enableQueuedOutput().
+
     Each level has its own method.  
         * standard levels -- debug(), info(), warning(), error(), critical()
         * MOS levels -- mark(), osc()
@@ -32,13 +42,15 @@
 
 version  :str  = "0.7"   #RELEASE
 
-USAGE  :str  = "[logTime:bool], [logDate:bool]"   
+USAGE  :str  = "[logTime:bool], [logDate:bool], [useQueuedOutput:bool]"   
 
 
 
 #----------------------------------------- -o--
 # Modules.
 
+import atexit
+import copy
 import inspect
 
 # NB  Relative to logging module lowest level DEBUG=10.
@@ -48,10 +60,15 @@ logging.MOS_LOGGER_LEVEL_MARK      = 11   # DEBUG=10
 logging.MOS_LOGGER_LEVEL_MESSAGE   = 21   # INFO=20
 logging.MOS_LOGGER_LEVEL_OSC       = 22
 
+import logging.handlers
 import os
+import queue
 import sys
+import threading
 
-from typing import Any, List, Tuple
+from types import CodeType
+import time
+from typing import Any, Dict, List, Tuple
 
 
 
@@ -85,6 +102,16 @@ class  MOSLog:
         moduleName()  -- Generally works where className() fails.
         defName()     -- For both script functions and class methods.
         scriptName()  -- Returns the filename, optionally stripping basename.
+
+    Convenience methods to avoid work when a log level is disabled--
+        isEnabledFor()  -- Guard expensive preparation of log arguments.
+        deferred()      -- Create log strings only when the record is emitted.
+
+    Methods to manage queued output (shared by all instances)--
+        enableQueuedOutput()
+        disableQueuedOutput()
+        flushQueuedOutput()
+        queuedOutputStatistics()
     """
 
 
@@ -94,34 +121,42 @@ class  MOSLog:
 
     #                                                                    -o-
     def  mark(self, *args)  -> None:                          
-        logging.log( logging.MOS_LOGGER_LEVEL_MARK,                \
-                     "%s %s",                                      \
-                        self._makeSignature(inspect.stack()[1]),   \
-                        self._processArguments(args)               \
+        if  not self.isEnabledFor(logging.MOS_LOGGER_LEVEL_MARK):  return
+
+        logging.log( logging.MOS_LOGGER_LEVEL_MARK,                     \
+                     "%s %s",                                           \
+                        self._makeSignature(),                          \
+                        _DeferredMessage(self._processArguments, args)  \
                    )
 
     #                                                                    -o-
     def  message(self, *args)  -> None:
+        if  not self.isEnabledFor(logging.MOS_LOGGER_LEVEL_MESSAGE):  return
+
         logging.log( logging.MOS_LOGGER_LEVEL_MESSAGE, 
-                     self._processArguments(args, isMessage=True) )
+                     _DeferredMessage(self._processArguments, args, isMessage=True) )
 
     #                                                                    -o-
     def  osc(self, *args)  -> None:
-        s = " ".join(str(x) for x in args)
-        logging.log(logging.MOS_LOGGER_LEVEL_OSC, s)
+        if  not self.isEnabledFor(logging.MOS_LOGGER_LEVEL_OSC):  return
+
+        logging.log(logging.MOS_LOGGER_LEVEL_OSC, _DeferredMessage(self._joinArguments, args))
 
 
     #                                                                    -o-
     def  debug(self, *args)  -> None:                                 
-        logging.debug("%s %s", self._makeSignature(inspect.stack()[1]), self._processArguments(args))
+        if  not self.isEnabledFor(logging.DEBUG):  return
+        logging.debug("%s %s", self._makeSignature(), _DeferredMessage(self._processArguments, args))
 
     #                                                                    -o-
     def  info(self, *args)  -> None:                                
-        logging.info("%s %s", self._makeSignature(inspect.stack()[1]), self._processArguments(args))
+        if  not self.isEnabledFor(logging.INFO):  return
+        logging.info("%s %s", self._makeSignature(), _DeferredMessage(self._processArguments, args))
 
     #                                                                    -o-
     def  warning(self, *args)  -> None:                           
-        logging.warning("%s %s", self._makeSignature(inspect.stack()[1]), self._processArguments(args))
+        if  not self.isEnabledFor(logging.WARNING):  return
+        logging.warning("%s %s", self._makeSignature(), _DeferredMessage(self._processArguments, args))
 
     #                                                                    -o-
     def  error(self, *args)  -> None:                                
@@ -129,9 +164,11 @@ class  MOSLog:
         NB  *args may be a single Exception, -OR-
             variable arguments in the form: formatString, [formatElements, ...]
         """
+        if  not self.isEnabledFor(logging.ERROR):  return
+
         args = self._processException(args)
         #args = _processException(args)
-        logging.error("%s %s", self._makeSignature(inspect.stack()[1]), self._processArguments(args))
+        logging.error("%s %s", self._makeSignature(), _DeferredMessage(self._processArguments, args))
 
     #                                                                    -o-
     def  critical(self, *args, exitValue:int=1)  -> None:                           
@@ -140,18 +177,157 @@ class  MOSLog:
         NB  *args may be a single Exception, -OR-
             variable arguments in the form: formatString, [formatElements, ...]
         """
-        stack  = inspect.stack()[1]
-        args   = self._processException(args)
+        signature  :str  = None
 
-        logging.critical("%s %s", self._makeSignature(stack), self._processArguments(args))
+        if  self.isEnabledFor(logging.CRITICAL):
+            signature  = self._makeSignature()
+            args       = self._processException(args)
+
+            logging.critical("%s %s", signature, _DeferredMessage(self._processArguments, args))
 
         if  exitValue:
-            print( f"\n{self.scriptName()}: {self._makeSignature(stack)} -- Exiting...  ({exitValue})",
+            if  None is signature:  signature = self._makeSignature()
+
+            print( f"\n{self.scriptName()}: {signature} -- Exiting...  ({exitValue})",
                    file=sys.stderr )
             sys.exit(exitValue)
 
 
 
+    #                                                                    -o-
+    def  isEnabledFor(self, level:int)  -> bool:
+        """
+        True if a record at level would be processed by the logging package.
+        Use to guard expensive preparation of log arguments.
+        """
+        return  logging.root.isEnabledFor(level)
+
+
+    #                                                                    -o-
+    def  deferred(self, formatStringOrFunction, *args)  -> "_DeferredMessage":
+        """
+        Defer creation of a log string until the record is emitted.
+        Use as an argument to any logging method.  Eg:
+
+            log.osc(log.deferred("%s %s", oscPath, log.deferred(z.c2s, oscArgs)))
+
+        If formatStringOrFunction is a string, it is formatted with args.
+        Otherwise, it is called with args and the result is converted to string.
+        If the record is filtered out, neither happens.
+        """
+        if  isinstance(formatStringOrFunction, str):
+            return  _DeferredMessage(_formatDeferred, formatStringOrFunction, args)
+
+        return  _DeferredMessage(formatStringOrFunction, *args)
+
+
+
+    #                                                                    -o-
+    def  enableQueuedOutput(  self,
+                              queueSize      :int   = None,
+                              blockWhenFull  :bool  = None,
+                           )  -> None:
+        """
+        Route all log records through a bounded queue to a background
+        writer thread.  Affects the entire application, like the first 
+        instance of MOSLog.
+
+        queueSize      -- Maximum number of pending records.  (DEFAULT: 1024)
+        blockWhenFull  -- If True, callers wait for space in the queue.
+                          If False (DEFAULT), records are dropped and counted.
+                          See queuedOutputStatistics().
+
+        Pending records are written at exit.  See also flushQueuedOutput().
+        """
+
+        if  not queueSize:      queueSize      = 1024
+        if  not blockWhenFull:  blockWhenFull  = False
+
+        if      not isinstance(queueSize, int)  or  (queueSize < 1)    \
+            or  not isinstance(blockWhenFull, bool):
+            self.error(f"queueSize or blockWhenFull IS INVALID.  ({queueSize}, {blockWhenFull})")
+            return
+
+        with  MOSLog._queueLock:
+            if  MOSLog._queueHandler:
+                self.warning("Queued output is ALREADY ENABLED.")
+                return
+
+            rootLogger      = logging.getLogger()
+            streamHandlers  = list(rootLogger.handlers)
+            recordQueue     = queue.Queue(maxsize=queueSize)
+
+            MOSLog._queueHandler   = _BoundedQueueHandler(recordQueue, blockWhenFull)
+            MOSLog._queueListener  = _DrainingQueueListener(recordQueue, *streamHandlers, respect_handler_level=True)
+
+            for handler in streamHandlers:  
+                rootLogger.removeHandler(handler)
+            rootLogger.addHandler(MOSLog._queueHandler)
+
+            MOSLog._queueListener.start()
+
+            if  not MOSLog._isQueueExitHookRegistered:
+                atexit.register(MOSLog._disableQueuedOutputAtExit)
+                MOSLog._isQueueExitHookRegistered = True
+
+
+    #                                                                    -o-
+    def  disableQueuedOutput(self)  -> None:
+        """
+        Write all pending records, stop the writer thread and restore 
+        direct output to streams.
+        """
+
+        with  MOSLog._queueLock:
+            if  not MOSLog._queueHandler:
+                return
+
+            rootLogger  = logging.getLogger()
+
+            MOSLog._queueListener.stop()                # NB  Drains the queue.
+
+            rootLogger.removeHandler(MOSLog._queueHandler)
+            for handler in MOSLog._queueListener.handlers:
+                rootLogger.addHandler(handler)
+
+            MOSLog._queueHandler   = None
+            MOSLog._queueListener  = None
+
+
+    #                                                                    -o-
+    def  flushQueuedOutput(self)  -> None:
+        """
+        Wait until the writer thread has written all pending records.
+        """
+        listener  = MOSLog._queueListener
+
+        if  not listener:  return
+
+        listener.queue.join()
+
+        for handler in listener.handlers:
+            handler.flush()
+
+
+    #                                                                    -o-
+    def  queuedOutputStatistics(self)  -> Dict[str,int]:
+        """
+        RETURNS  Dictionary with keys: enqueued, dropped, pending, queueSize.
+                 Values are zero (0) if queued output is not enabled.
+        """
+        handler  = MOSLog._queueHandler
+
+        if  not handler:
+            return  { "enqueued": 0, "dropped": 0, "pending": 0, "queueSize": 0 }
+
+        return  { "enqueued"   : handler.enqueuedCount,
+                  "dropped"    : handler.droppedCount,
+                  "pending"    : handler.queue.qsize(),
+                  "queueSize"  : handler.queue.maxsize,
+                }
+
+
+
     #                                                                    -o-
     def  className(self, additionalFrameDepth:int=None)  -> str:
         """
@@ -201,11 +377,20 @@ class  MOSLog:
     #                                                                    -o-
     def  scriptName(self, excludeSuffix:bool=False)  -> str:
         """
-        NB  Look for filename, at the top of the stack.
+        NB  Look for filename of __main__, otherwise at the top of the stack.
+            Computed once per process.
         """
-        stack      :list  = inspect.stack()
-        stackSize  :int   = len(stack)
-        basename   :str   = os.path.basename(stack[stackSize-1][1])   #filename
+        basename  :str  = MOSLog._scriptName
+
+        if  None is basename:
+            filename  = getattr(sys.modules.get("__main__"), "__file__", None)
+
+            if  not filename:
+                frame = sys._getframe()
+                while  frame.f_back:  frame = frame.f_back
+                filename = frame.f_code.co_filename
+
+            basename = MOSLog._scriptName = os.path.basename(filename)
 
         if  excludeSuffix:  basename = basename.rsplit(".", 1)[0]
 
@@ -214,6 +399,25 @@ class  MOSLog:
 
 
 
+    #----------------------------------------------- -o--
+    # Protected attributes.
+
+    _scriptName  :str  = None
+        # Cached by scriptName().
+
+    _signatureCache  :Dict[Tuple[CodeType,int], Tuple[str,bool]]  = {}
+        # Cached by _makeSignature().  
+        # Maps (code, line) to ("function:line", codeMayReferenceSelf).
+
+    _queueHandler                :"_BoundedQueueHandler"    = None
+    _queueListener               :"_DrainingQueueListener"  = None
+    _queueLock                   :threading.Lock            = threading.Lock()
+    _isQueueExitHookRegistered   :bool                      = False
+        # Managed by enableQueuedOutput() and disableQueuedOutput().
+
+
+
+
     #----------------------------------------------- -o--
     # Lifecycle.
 
@@ -222,10 +426,13 @@ class  MOSLog:
                         logTime                   :bool   =None, 
                         logDate                   :bool   =None, 
                         outputStreamBelowInfo             =None,
-                        outputStreamAboveInfo             =None
+                        outputStreamAboveInfo             =None,
+                        useQueuedOutput           :bool   =None,
                   ):
         """
         NB  First instance of MOSLog configures logging package for entire application. 
+            useQueuedOutput is the exception: any instance may enable queued output.
+            See enableQueuedOutput().
         """
 
         logFormatWithTime  = ""
@@ -239,13 +446,16 @@ class  MOSLog:
 
         # DEFAULTS.  Sanity check.
         #
-        if  not logTime:  logTime = False
-        if  not logDate:  logDate = False
+        if  not logTime:          logTime          = False
+        if  not logDate:          logDate          = False
+        if  not useQueuedOutput:  useQueuedOutput  = False
 
         if  not outputStreamBelowInfo:  outputStreamBelowInfo   = sys.stderr
         if  not outputStreamAboveInfo:  outputStreamAboveInfo   = sys.stdout
 
-        if  not (isinstance(logTime, bool)  and  isinstance(logDate, bool)):
+        if  not (      isinstance(logTime, bool)  
+                  and  isinstance(logDate, bool) 
+                  and  isinstance(useQueuedOutput, bool) ):
             print(usage, file=sys.stderr)
             sys.exit(1)
             return
@@ -311,6 +521,10 @@ class  MOSLog:
                                  stderrHandler
                                ]
                            )
+
+        if  useQueuedOutput:
+            self.enableQueuedOutput()
+
     #ENDDEF -- __init__
 
 
@@ -320,23 +534,42 @@ class  MOSLog:
     # Protected methods.
 
     #                                                                    -o-
-    def  _makeSignature(self, frameStackElement:List)  -> None:
+    def  _makeSignature(self, depth:int=2)  -> str:
         """
-        Alternate source for method or function name: sys._getframe(N).f_code.co_name
-        Where N = 2 from in this method context.
+        Signature of the form: [<class>.]<function>:<line>
+
+        depth -- Frames between _makeSignature() and the calling environment
+                 to be named.  DEFAULT assumes caller of a logging method.
+
+        Function name and line are cached per code object and line.
+        Class name is taken from "self", when the code object can see it.
         """
 
-        callingClass     :str  = self.className(2)
-        callingFunction  :str  = frameStackElement[3]   
-        callingLine      :str  = frameStackElement[2]
+        frame             = sys._getframe(depth)
+        code              = frame.f_code
+        lineNumber  :int  = frame.f_lineno
+        callingClass      = None
 
-        if  len(callingClass) > 0:
-            callingClass = callingClass + "."
+        signature  = MOSLog._signatureCache.get((code, lineNumber))
 
-        if  "<module>" == callingFunction:
-            callingFunction = self.scriptName(excludeSuffix=True)
+        if  None is signature:
+            callingFunction  :str  = code.co_name
 
-        return  callingClass + callingFunction + ":" + str(callingLine)
+            if  "<module>" == callingFunction:
+                callingFunction = self.scriptName(excludeSuffix=True)
+
+            signature = ( callingFunction + ":" + str(lineNumber),
+                          ("self" in code.co_varnames)  or  ("self" in code.co_cellvars)  
+                                                        or  ("self" in code.co_freevars) )
+            MOSLog._signatureCache[(code, lineNumber)] = signature
+
+        if  signature[1]:
+            callingClass = frame.f_locals.get("self")
+
+        if  None is callingClass:
+            return  signature[0]
+
+        return  callingClass.__class__.__name__ + "." + signature[0]
 
 
     #                                                                    -o-
@@ -357,6 +590,17 @@ class  MOSLog:
         return  (formatString % tuple(argsList))
 
 
+    #                                                                    -o-
+    @staticmethod
+    def  _disableQueuedOutputAtExit()  -> None:
+        MOSLog().disableQueuedOutput()
+
+
+    #                                                                    -o-
+    def  _joinArguments(self, argsList:Tuple[Any])  -> str:
+        return  " ".join(str(x) for x in argsList)
+
+
     #                                                                    -o-
     def  _processException(self, argsList:Tuple[Any])  -> str:
         """
@@ -393,3 +637,174 @@ class  MOSLog:
 
 #ENDCLASS -- MOSLog()
 
+
+
+
+#----------------------------------------------- -o--
+class  _DeferredMessage:
+    """
+    Log message argument whose string is created only when the logging
+    package formats the record, and then only once.
+    See MOSLog.deferred().
+    """
+
+    __slots__ = ("_function", "_args", "_kwargs", "_string")
+
+    def  __init__(self, function, *args, **kwargs):
+        self._function  = function
+        self._args      = args
+        self._kwargs    = kwargs
+        self._string    = None
+
+    def  __str__(self)  -> str:
+        if  None is self._string:
+            self._string = str(self._function(*self._args, **self._kwargs))
+        return  self._string
+
+#ENDCLASS -- _DeferredMessage()
+
+
+
+
+#----------------------------------------------- -o--
+class  _BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueue records for _DrainingQueueListener.  When the queue is full,
+    either block or drop the record and count it.
+    """
+
+    def  __init__(self, recordQueue:queue.Queue, blockWhenFull:bool):
+        super().__init__(recordQueue)
+
+        self.blockWhenFull  :bool            = blockWhenFull
+        self.enqueuedCount  :int             = 0
+        self.droppedCount   :int             = 0
+        self._countLock     :threading.Lock  = threading.Lock()
+
+    def  prepare(self, record:logging.LogRecord)  -> logging.LogRecord:
+        """
+        Resolve message in the calling thread, leave formatting to stream handlers.
+        """
+        message  :str  = record.getMessage()
+
+        if  record.exc_info:
+            message += "\n" + logging.Formatter().formatException(record.exc_info)
+
+        record = copy.copy(record)
+        record.msg       = message
+        record.args      = None
+        record.exc_info  = None
+        record.exc_text  = None
+
+        return  record
+
+    def  enqueue(self, record:logging.LogRecord)  -> None:
+        if  self.blockWhenFull:
+            self.queue.put(record)
+
+        else:
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                with  self._countLock:  self.droppedCount += 1
+                return
+
+        with  self._countLock:  self.enqueuedCount += 1
+
+#ENDCLASS -- _BoundedQueueHandler()
+
+
+#----------------------------------------------- -o--
+class  _DrainingQueueListener(logging.handlers.QueueListener):
+    """
+    NB  Wait for room in a full queue to post the stop sentinel,
+        rather than raising queue.Full.
+    """
+
+    def  enqueue_sentinel(self)  -> None:
+        self.queue.put(self._sentinel)
+
+#ENDCLASS -- _DrainingQueueListener()
+
+
+#                                                                    -o-
+def  _formatDeferred(formatString:str, formatElements:Tuple[Any])  -> str:
+    if  len(formatElements) <= 0:
+        return  formatString
+
+    return  formatString % formatElements
+
+
+
+
+#----------------------------------------------- -o--
+# Testing.
+
+#                                                                    -o-
+def  testSignatureBenchmark(iterations:int=20000)  -> None:
+    """
+    Compare cost of caller signature via inspect.stack() (previous method)
+    with cached signature via sys._getframe() (current method).
+    """
+
+    log  = MOSLog()
+
+    #
+    def  signatureViaStack()  -> str:
+        frameStackElement  = inspect.stack()[1]
+
+        callingClass     :str  = log.className(1)
+        callingFunction  :str  = frameStackElement[3]   
+        callingLine      :str  = frameStackElement[2]
+
+        if  len(callingClass) > 0:
+            callingClass = callingClass + "."
+
+        if  "<module>" == callingFunction:
+            callingFunction = os.path.basename(inspect.stack()[-1][1]).rsplit(".", 1)[0]
+
+        return  callingClass + callingFunction + ":" + str(callingLine)
+
+    def  signatureViaFrame()  -> str:
+        return  log._makeSignature()
+
+
+    #
+    class  Caller:
+        def  viaStack(self, count:int)  -> str:
+            for _ in range(count):  signature = signatureViaStack()
+            return  signature
+
+        def  viaFrame(self, count:int)  -> str:
+            for _ in range(count):  signature = signatureViaFrame()
+            return  signature
+
+    caller = Caller()
+
+
+    #
+    timeStart  = time.perf_counter()
+    stackSignature  = caller.viaStack(iterations)
+    stackSeconds  = time.perf_counter() - timeStart
+
+    timeStart  = time.perf_counter()
+    frameSignature  = caller.viaFrame(iterations)
+    frameSeconds  = time.perf_counter() - timeStart
+
+    log.info(f"inspect.stack()   {stackSeconds / iterations * 1e6:10.2f} usec/call   ({stackSignature})")
+    log.info(f"sys._getframe()   {frameSeconds / iterations * 1e6:10.2f} usec/call   ({frameSignature})")
+    log.info(f"Speedup           {stackSeconds / frameSeconds:10.1f}x")
+
+#ENDDEF -- testSignatureBenchmark()
+
+
+
+
+#-------------------------------------- -o--
+# Main, for testing.
+
+if  "__main__" == __name__:
+    testSignatureBenchmark()
+
+    sys.exit(0)
+
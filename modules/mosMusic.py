@@ -17,11 +17,29 @@
         * Ornaments
 
 
+    PUBLIC CLASSES--
+        * BeatClock
+        * BeatTicker
+
+
     HELPER FUNCTIONS--
         * subdivisionPerBeat()
         * findScaleForMode()
 
 
+    SCALE TABLE FUNCTIONS--
+        * buildScaleTables()
+        * buildOrnamentTable()
+        * scaleArray()
+        * scaleSequenceArray()
+        * scaleIndicesForMIDINotes()
+
+
+    GENERATOR CLASSES--
+        * OrnamentGenerator
+        * SequencePipeline
+
+
     GENERATOR FUNCTIONS--
         * generateScaleSequence()
         * generateOrnament()
@@ -29,14 +47,23 @@
 
 
     PROTECTED FUNCTIONS--
+        * _scaleTableRow()
         * _discoverMIDINoteScaleIndexInMode()
         * _translateOrnamentScaleToMIDI()
+        * _computeOrnamentTableEntry()
 
 
     TEST FUNCTIONS--
         * testIvoryModesViaOSC()
         * testScaleSequencer()
         * testOrnaments()
+        * testBeatClockDrift()
+        * testScaleTablesEquivalence()
+        * testScaleTablesBenchmark()
+        * testOrnamentTableEquivalence()
+        * testOrnamentTableBenchmark()
+        * testOrnamentGenerator()
+        * testSequencePipeline()
 
 """
 #---------------------------------------------------------------------
@@ -52,12 +79,19 @@ version  :str  = "0.2"   #RELEASE
 #----------------------------------------- -o--
 # Modules.
 
+import array
+import collections
 from enum import IntEnum
+import itertools
+import logging
+import math
 import random
+import socket
 import sys
+import threading
 import time
 
-from typing import Any, Dict, List, Union
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
 
 
 #
@@ -218,6 +252,13 @@ Ornaments  :Dict[str,List[Any]]  = {
   }
 
 
+# Ornament offsets, by (ornamentName, fromMIDINote, key, mode).
+#   Filled as ornaments are used, or all at once by buildOrnamentTable().
+#   See _translateOrnamentScaleToMIDI().
+#
+_ornamentTable  :Dict[Tuple[str, int, int, int], Tuple[int, Tuple[int], Tuple[Tuple[str, int]]]]  = {}
+
+
 # Used by generateOrnament*().
 #
 ornamentState  :Dict[str,int]  = {
@@ -253,52 +294,506 @@ def  findScaleForMode(mode:ModeNames) -> Union[List[int],None]:
 
 
 #----------------------------------------- -o--
-# Generators.
+# Scale tables.
+#
+# Scale lookups are precomputed for every key x mode x MIDI note, 
+#   for every mode in Modes and ModesAdditional.  Tables are built on 
+#   first use.  Call buildScaleTables() after changing Modes or 
+#   ModesAdditional.
+#
+# _scaleIndexTable  -- Scale index of each MIDI note (0-127), per
+#                        _discoverMIDINoteScaleIndexInMode(), or -1.
+# _scaleNoteTable   -- MIDI note of each scale index, ascending from 
+#                        _scaleTableLowestNote + key, for 
+#                        _scaleTableOctaves octaves.  Notes may fall 
+#                        outside of MIDI range, as they may in 
+#                        generateScaleSequence().
+#
+# _scaleTableRows maps (key, mode) to offsets of its rows in each table, 
+#   and to the length of the scale.
+#
+
+_scaleTableLowestNote  :int  = MIDINote.C1 - (7 * NOTES_PER_OCTAVE)
+_scaleTableOctaves     :int  = 22
+    # Range of generateScaleSequence() for any octave and octaveRange (1-6).
+
+_scaleIndexTable  :array.array                            = None
+_scaleNoteTable   :array.array                            = None
+_scaleTableRows   :Dict[Tuple[int, int], Tuple[int, int, int]]  = None
+
 
 #                                                                    -o-
-# RETURN  Infinite sequences of... scale starting at key within an
-#         octave, run up or down for range octaves.
-#
-def  generateScaleSequence(  key                  :Key         = Key.C,
-                             mode                 :ModeNames   = ModeNames.ionian,
-                             octave               :MIDINote    = MIDINote.C4, 
-                             octaveRange          :int         = 2,
-                             direction            :Direction   = Direction.UP,
-                             scaleEndBoundByRoot  :bool        = True,
-                           ) -> int:
-    lowNote       :int   = -1
-    scaleForMode  :list  = findScaleForMode(mode)
-    listOfNotes   :list  = []
+def  buildScaleTables()  -> None:
+    global  _scaleIndexTable, _scaleNoteTable, _scaleTableRows
 
+    modesAll    :Dict[ModeNames,List]  = { **ModesAdditional, **Modes }
+    rowLength   :int                   = max(len(_) for _ in modesAll.values()) * _scaleTableOctaves
+    indexTable  :array.array           = array.array("b")
+    noteTable   :array.array           = array.array("h")
+    rows        :Dict[Tuple[int, int], Tuple[int, int, int]]  = {}
+
+    #
+    for key in range(NOTES_PER_OCTAVE):
+        for mode, scale in modesAll.items():
+            rows[(key, int(mode))] = (len(indexTable), len(noteTable), len(scale))
+
+            # NB  Register is the nearest C at or below midiNote, within MIDINote range.
+            #
+            for midiNote in range(128):
+                register  = min(MIDINote.C8, MIDINote.C1 + (NOTES_PER_OCTAVE * ((midiNote - MIDINote.C1) // NOTES_PER_OCTAVE)))
+                offset    = midiNote - (register + key)
+                indexTable.append(scale.index(offset)  if offset in scale  else -1)
+
+            notes = [ _scaleTableLowestNote + key + (NOTES_PER_OCTAVE * octa) + pitch
+                            for octa in range(_scaleTableOctaves)  for pitch in scale ]
+            noteTable.extend(notes + ([0] * (rowLength - len(notes))))
+
+    #
+    _scaleIndexTable  = indexTable
+    _scaleNoteTable   = noteTable
+    _scaleTableRows   = rows
+
+    _ornamentTable.clear()                  # NB  Ornament offsets depend upon scales.
+
+
+#                                                                    -o-
+def  buildOrnamentTable()  -> int:
+    """
+    RETURNS  Number of entries in _ornamentTable.
+
+    Fill _ornamentTable for every ornament, key, mode and MIDI note 
+      in the mode.  Otherwise, entries are added as ornaments are used.
+      Call after changing Ornaments.
+    """
+
+    _ornamentTable.clear()
+
+    modesAll = list(Modes.keys()) + list(ModesAdditional.keys())
+
+    for ornamentName, key, mode in itertools.product(Ornaments.keys(), dict.fromkeys(Key), modesAll):
+        midiNotes       = range(MIDINote.C1, MIDINote.C8 + 1)
+        scaleIndices    = scaleIndicesForMIDINotes(midiNotes, key, mode)
+
+        for midiNote, scaleIndex in zip(midiNotes, scaleIndices):
+            if  scaleIndex < 0:  continue
+            _ornamentTable[(ornamentName, midiNote, key, mode)] = _computeOrnamentTableEntry(ornamentName, midiNote, key, mode)
+
+    return  len(_ornamentTable)
+
+
+#                                                                    -o-
+def  scaleArray(  key                  :Key         = Key.C,
+                  mode                 :ModeNames   = ModeNames.ionian,
+                  octave               :MIDINote    = MIDINote.C4, 
+                  octaveRange          :int         = 2,
+                  direction            :Direction   = Direction.UP,
+                  scaleEndBoundByRoot  :bool        = True,
+               ) -> array.array:
+    """
+    RETURNS  One pass of the scale sequence of generateScaleSequence(), 
+               same arguments, as array of MIDI notes.
+    """
+
+    row  :Tuple[int, int, int]  = None
 
     #
     if  (octaveRange < 1)  or  (octaveRange > 6):   #XXX
         log.critical(f"{log.defName()}: octaveRange OUT OF BOUNDS ({octaveRange}).")
 
-    if  None is scaleForMode:
+    row = _scaleTableRow(key, mode)
+    if  None is row:
         log.critical(f"mode is named, but NOT DEFINED.  ({mode})")
 
-    lowNote  = octave.value + key.value
+    _, noteOffset, scaleLength = row
 
 
     # Determine range, regardless of direction.
     #
+    lowOctave = octave.value
     if  direction in [Direction.DOWN, Direction.DOWNUP]:
-        lowNote -= (octaveRange * NOTES_PER_OCTAVE)
+        lowOctave -= (octaveRange * NOTES_PER_OCTAVE)
+
+    start  = noteOffset + (((lowOctave - _scaleTableLowestNote) // NOTES_PER_OCTAVE) * scaleLength)
+    end    = start + (octaveRange * scaleLength) + (1 if scaleEndBoundByRoot else 0)
 
-    for  octa  in range(lowNote, lowNote + (octaveRange * NOTES_PER_OCTAVE), NOTES_PER_OCTAVE):
-        for  pitch  in scaleForMode:
-            listOfNotes.append(octa + pitch)
+    notes = _scaleNoteTable[start:end]
 
-    if  scaleEndBoundByRoot:
-        listOfNotes.append(octa + NOTES_PER_OCTAVE)
+    if  direction in [Direction.DOWN, Direction.DOWNUP]:
+        notes.reverse()
 
+    return  notes
 
-    # Iterate.
+
+#                                                                    -o-
+def  scaleSequenceArray(  length  :int,
+                         **scaleArrayArgs  :Dict[str, Any],
+                       ) -> array.array:
+    """
+    RETURNS  First length notes of generateScaleSequence(**scaleArrayArgs),
+               as array of MIDI notes.
+    """
+
+    notes      :array.array  = scaleArray(**scaleArrayArgs)
+    direction  :Direction    = scaleArrayArgs.get("direction", Direction.UP)
+    cycle      :array.array  = notes
+
+    if  length <= 0:
+        return  array.array("h")
+
+    # UPDOWN and DOWNUP turn at each end, without repeating the end note.
     #
-    if  direction in [Direction.DOWN, Direction.DOWNUP]:
-        listOfNotes.reverse()
+    if  direction in [Direction.UPDOWN, Direction.DOWNUP]:
+        reversedNotes = notes[::-1]
+        cycle = reversedNotes[1:] + notes[1:]
+
+    sequence = notes + (cycle * (1 + ((length - len(notes)) // max(1, len(cycle)))))
+
+    return  sequence[:length]
+
+
+#                                                                    -o-
+def  scaleIndicesForMIDINotes(  midiNotes  :List[int],
+                                key        :Key,
+                                mode       :ModeNames,
+                             ) -> array.array:
+    """
+    RETURNS  Scale index of each MIDI note, per 
+               _discoverMIDINoteScaleIndexInMode(), or -1 if the note 
+               is not in the scale or is out of range.
+    """
+
+    row  :Tuple[int, int, int]  = _scaleTableRow(key, mode)
+
+    if  None is row:
+        log.error(f"mode is UNRECOGNIZED.  ({mode})")
+        return  None
+
+    indexOffset  = row[0]
+    table        = _scaleIndexTable
+
+    return  array.array("b", [ table[indexOffset + _]  if MIDINote.C1 <= _ <= MIDINote.C8  else -1 
+                                    for _ in midiNotes ])
+
+
+
+
+#----------------------------------------- -o--
+# Clock.
+
+#                                               -o-
+class  BeatClock:
+    """
+    One musical timeline, measured in beats, shared by any number of
+    BeatTicker instances, each of which ticks at its own subdivision of 
+    the beat.
+
+    Tick deadlines are absolute points on the timeline, computed from 
+    the tick index, so time spent between ticks does not accumulate as 
+    drift (as it does with time.sleep() after each event).  
+    Time is measured by time.monotonic_ns().
+
+    Changing BPM preserves the current beat, so tickers remain aligned
+    with one another.
+
+    Threads waiting for ticks block on a condition.  They are woken by 
+    their deadline, by a change to BPM, by enabling the ticker or by
+    stop().  Disabled tickers do not spin.
+
+      clock   = BeatClock(bpm)
+      ticker  = clock.ticker(subdivision)
+      clock.start()
+
+      while  ticker.wait():     # False after clock.stop().
+          ...
+
+    PUBLIC METHODS--
+        * start()
+        * stop()
+        * setBPM()
+        * beatNow()
+        * ticker()
+        * statistics()
+    """
+
+    #                                                                    -o-
+    def  __init__(self, bpm:float=60):
+        if  bpm <= 0:
+            log.critical(f"bpm MUST BE GREATER THAN ZERO.  ({bpm})")
+
+        self._condition   :threading.Condition  = threading.Condition()
+        self._bpm         :float                = float(bpm)
+        self._anchorNs    :int                  = 0
+        self._anchorBeat  :float                = 0.0
+        self._isStarted   :bool                 = False
+        self._isStopped   :bool                 = False
+        self._tickers     :List["BeatTicker"]   = []
+
+
+    #                                                                    -o-
+    @property
+    def  bpm(self)  -> float:
+        return  self._bpm
+
+    @property
+    def  isRunning(self)  -> bool:
+        return  self._isStarted  and  not self._isStopped
+
+
+    #                                                                    -o-
+    def  start(self)  -> None:
+        """
+        Beat zero (0) is now.  Tickers begin with their first tick after now.
+        """
+
+        with self._condition:
+            if  self._isStarted:
+                log.warning("Beat clock is ALREADY STARTED.")
+                return
+
+            self._anchorNs    = time.monotonic_ns()
+            self._anchorBeat  = 0.0
+            self._isStarted   = True
+            self._condition.notify_all()
+
+
+    #                                                                    -o-
+    def  stop(self)  -> None:
+        """
+        Wake all tickers.  BeatTicker.wait() returns False thereafter.
+        """
+
+        with self._condition:
+            self._isStopped = True
+            self._condition.notify_all()
+
+
+    #                                                                    -o-
+    def  setBPM(self, bpm:float)  -> None:
+        if  bpm <= 0:
+            log.critical(f"bpm MUST BE GREATER THAN ZERO.  ({bpm})")
+
+        with self._condition:
+            if  self._isStarted:
+                nowNs              = time.monotonic_ns()
+                self._anchorBeat   = self._beatAtNs(nowNs)
+                self._anchorNs     = nowNs
+
+            self._bpm = float(bpm)
+            self._condition.notify_all()
+
+
+    #                                                                    -o-
+    def  beatNow(self)  -> float:
+        with self._condition:
+            if  not self._isStarted:  
+                return  0.0
+            return  self._beatAtNs(time.monotonic_ns())
+
+
+    #                                                                    -o-
+    def  ticker(self, subdivision:float=1, enabled:bool=True)  -> "BeatTicker":
+        """
+        RETURNS  BeatTicker that ticks subdivision times per beat.
+        """
+
+        ticker = BeatTicker(self, subdivision, enabled)
+
+        with self._condition:
+            self._tickers.append(ticker)
+
+        return  ticker
+
+
+    #                                                                    -o-
+    def  statistics(self)  -> dict:
+        """
+        RETURNS  Dictionary: bpm, beat, tickers (list of BeatTicker.statistics()).
+        """
 
+        return  { "bpm"      : self._bpm,
+                  "beat"     : self.beatNow(),
+                  "tickers"  : [ _.statistics() for _ in self._tickers ],
+                }
+
+
+    #                                                                    -o-
+    def  _beatAtNs(self, monotonicNs:int)  -> float:
+        return  self._anchorBeat + ((monotonicNs - self._anchorNs) * self._bpm / (SECONDS_PER_MINUTE * 1_000_000_000))
+
+    def  _nsAtBeat(self, beat:float)  -> int:
+        return  self._anchorNs + int((beat - self._anchorBeat) * (SECONDS_PER_MINUTE * 1_000_000_000) / self._bpm)
+
+#ENDCLASS -- BeatClock()
+
+
+#                                               -o-
+class  BeatTicker:
+    """
+    Ticks subdivision times per beat of a BeatClock.  Create with 
+    BeatClock.ticker().
+
+    wait() blocks until the next tick.  If a tick is missed (because 
+    work between ticks took too long) wait() returns at once for the 
+    most recent tick, and the skipped ticks are counted.  
+    A ticker that is disabled, then enabled, resumes with the next tick 
+    on the shared timeline.
+
+    Public attributes tick and beat describe the most recent tick.
+
+    PUBLIC METHODS--
+        * wait()
+        * enable()
+        * toggle()
+        * statistics()
+    """
+
+    #                                                                    -o-
+    def  __init__(self, clock:BeatClock, subdivision:float=1, enabled:bool=True):
+        if  subdivision <= 0:
+            log.critical(f"subdivision MUST BE GREATER THAN ZERO.  ({subdivision})")
+
+        self.clock        :BeatClock  = clock
+        self.subdivision  :float      = subdivision
+
+        self.tick  :int    = -1
+        self.beat  :float  = -1.0
+
+        self._isEnabled      :bool  = enabled
+        self._nextTick       :int   = None
+
+        self._ticks          :int   = 0     # Ticks returned by wait().
+        self._missed         :int   = 0     # Ticks skipped because wait() was called too late.
+        self._latenessTotal  :int   = 0     # Nanoseconds, summed over all ticks.
+        self._latenessMax    :int   = 0
+        self._latenessLast   :int   = 0
+
+
+    #                                                                    -o-
+    @property
+    def  isEnabled(self)  -> bool:
+        return  self._isEnabled
+
+
+    #                                                                    -o-
+    def  enable(self, isEnabled:bool=True)  -> None:
+        with self.clock._condition:
+            self._isEnabled  = isEnabled
+            self._nextTick   = None
+            self.clock._condition.notify_all()
+
+    def  toggle(self)  -> bool:
+        """
+        RETURNS  New value of isEnabled.
+        """
+        self.enable(not self._isEnabled)
+        return  self._isEnabled
+
+
+    #                                                                    -o-
+    def  wait(self)  -> bool:
+        """
+        RETURNS  True at next tick, or False if clock is stopped.
+        Blocks while the clock is not started or the ticker is disabled.
+        """
+
+        clock      = self.clock
+        condition  = clock._condition
+
+        with condition:
+            while  True:
+                if  clock._isStopped:
+                    return  False
+
+                if  (not clock._isStarted)  or  (not self._isEnabled):
+                    condition.wait()
+                    continue
+
+                nowNs = time.monotonic_ns()
+
+                if  None is self._nextTick:
+                    self._nextTick = math.floor(clock._beatAtNs(nowNs) * self.subdivision) + 1
+
+                remainingNs = clock._nsAtBeat(self._nextTick / self.subdivision) - nowNs
+
+                if  remainingNs > 0:
+                    condition.wait(remainingNs / 1_000_000_000)
+                    continue
+
+                # Tick is due.  Skip to most recent tick, if others were missed.
+                #
+                currentTick = math.floor(clock._beatAtNs(nowNs) * self.subdivision)
+
+                if  currentTick > self._nextTick:
+                    self._missed    += currentTick - self._nextTick
+                    self._nextTick   = currentTick
+
+                latenessNs = nowNs - clock._nsAtBeat(self._nextTick / self.subdivision)
+
+                self.tick        = self._nextTick
+                self.beat        = self._nextTick / self.subdivision
+                self._nextTick  += 1
+
+                self._ticks          += 1
+                self._latenessTotal  += latenessNs
+                self._latenessLast    = latenessNs
+                if  latenessNs > self._latenessMax:
+                    self._latenessMax = latenessNs
+
+                return  True
+
+
+    #                                                                    -o-
+    def  statistics(self)  -> dict:
+        """
+        RETURNS  Dictionary: subdivision, ticks, missed, 
+                   latenessMeanUs, latenessMaxUs, latenessLastUs.
+
+        Lateness is the time wait() returned minus the tick deadline.
+          It does not accumulate from tick to tick, so latenessLastUs 
+          is also the drift of this ticker from the timeline.
+        """
+
+        latenessMeanUs  :float  = None
+
+        if  self._ticks > 0:
+            latenessMeanUs = self._latenessTotal / self._ticks / 1000
+
+        return  { "subdivision"     : self.subdivision,
+                  "ticks"           : self._ticks,
+                  "missed"          : self._missed,
+                  "latenessMeanUs"  : latenessMeanUs,
+                  "latenessMaxUs"   : self._latenessMax / 1000,
+                  "latenessLastUs"  : self._latenessLast / 1000,
+                }
+
+#ENDCLASS -- BeatTicker()
+
+
+
+
+#----------------------------------------- -o--
+# Generators.
+
+#                                                                    -o-
+# RETURN  Infinite sequences of... scale starting at key within an
+#         octave, run up or down for range octaves.
+#
+def  generateScaleSequence(  key                  :Key         = Key.C,
+                             mode                 :ModeNames   = ModeNames.ionian,
+                             octave               :MIDINote    = MIDINote.C4, 
+                             octaveRange          :int         = 2,
+                             direction            :Direction   = Direction.UP,
+                             scaleEndBoundByRoot  :bool        = True,
+                           ) -> int:
+    """
+    See scaleArray() and scaleSequenceArray() for the same sequence as arrays.
+    """
+
+    listOfNotes  :list  = list(scaleArray(key, mode, octave, octaveRange, direction, scaleEndBoundByRoot))
+
+
+    # Iterate.
+    #
     index = iter(listOfNotes)
 
     while  True:
@@ -318,6 +813,189 @@ def  generateScaleSequence(  key                  :Key         = Key.C,
 #ENDDEF -- generateScaleSequence
 
 
+#                                               -o-
+class  OrnamentGenerator:
+    """
+    Ornament state machine of generateOrnament(), held per instance.
+    Use one instance per voice or sequencer thread.  
+
+    Random choices are taken from rand, or from random.Random(seed).
+    Methods may be called from any thread.
+
+    Ornament decisions do not depend upon the note, so decisions for the 
+    next N beats may be made ahead of time by prepare(), outside of a 
+    real-time thread.  generate() then dequeues one decision per beat and 
+    translates it to MIDI offsets by table lookup.  generateBatch() does 
+    the same for a sequence of notes known in advance.
+
+    PUBLIC METHODS--
+        * generate()
+        * generateBatch()
+        * prepare()
+        * decide()
+        * reset()
+    """
+
+    #                                                                    -o-
+    def  __init__(  self, 
+                    seed   :Any            = None,
+                    rand   :random.Random  = None,
+                    state  :Dict[str,int]  = None,
+                 ):
+        """
+        state is updated in place.  DEFAULT is a new dictionary with the 
+          keys of ornamentState.
+        """
+
+        self.random  :random.Random  = rand  if rand  else random.Random(seed)
+
+        self._state      :Dict[str,int]      = state  if (None is not state)  else dict.fromkeys(ornamentState.keys(), 0)
+        self._decisions  :collections.deque  = collections.deque()
+        self._lock       :threading.Lock     = threading.Lock()
+
+
+    #                                                                    -o-
+    @property
+    def  pending(self)  -> int:
+        """
+        Number of decisions made by prepare() and not yet used.
+        """
+        return  len(self._decisions)
+
+
+    #                                                                    -o-
+    def  generate(self, fromMIDINote:int, key:Key, mode:ModeNames, bpm:float) -> Union[List[Any],None]:
+        """
+        Generate OSC arguments describing ornaments, with the form:
+
+            [ <ornamentName> <BPM> <beatSubdivision> [<listOfOrnamentNoteMIDIOffsets...>] ]
+
+        ...or None if there is no ornament on this beat.  
+        Uses next decision from prepare(), if any.  See generateOrnament().
+        """
+
+        try:
+            ornamentChoice = self._decisions.popleft()
+        except  IndexError:
+            ornamentChoice = self.decide()
+
+        if  not ornamentChoice:  return None
+
+
+        #
+        ornamentBlob  = _translateOrnamentScaleToMIDI(ornamentChoice, fromMIDINote, key, mode)
+        if  not ornamentBlob:  return None 
+
+        oscArgs = [ornamentChoice, bpm, ornamentBlob[0]]
+        oscArgs += ornamentBlob[1]
+
+        return  oscArgs
+
+
+    #                                                                    -o-
+    def  generateBatch(  self, 
+                         fromMIDINotes  :List[int], 
+                         key            :Key, 
+                         mode           :ModeNames, 
+                         bpm            :float,
+                      ) -> List[Union[List[Any],None]]:
+        """
+        RETURNS  generate() for each note, one beat per note.
+        """
+        return  [ self.generate(_, key, mode, bpm)  for _ in fromMIDINotes ]
+
+
+    #                                                                    -o-
+    def  prepare(self, beatCount:int)  -> int:
+        """
+        Make ornament decisions for the next beatCount beats.  
+        RETURNS  Number of decisions pending.
+        """
+
+        with self._lock:
+            for _ in range(beatCount):
+                self._decisions.append(self._decide())
+
+            return  len(self._decisions)
+
+
+    #                                                                    -o-
+    def  decide(self)  -> Union[str,None]:
+        """
+        RETURNS  Name of ornament for this beat, or None.  
+        Advances state by one beat.
+        """
+        with self._lock:
+            return  self._decide()
+
+
+    #                                                                    -o-
+    def  reset(self)  -> None:
+        """
+        Reset state in place, and discard decisions made by prepare().
+        """
+        with self._lock:
+            for name in self._state:
+                self._state[name] = 0
+            self._decisions.clear()
+
+
+    #                                                                    -o-
+    def  _decide(self)  -> Union[str,None]:
+        """
+        Random filters to manage internal state are arbitrary, specific and experimental.  YMMV.
+        """
+
+        ornamentChoice  :str  = None
+        fourCount       :int  = 4
+        state                 = self._state
+
+
+        #
+        if  state["sixteenthTripletTurnaround"] > 0:            # Check existing state.
+            state["sixteenthTripletTurnaround"] -= 1
+
+            if  state["sixteenthTripletTurnaround"] == 2:
+                if  (self.random.random() * 100) <= 35:
+                    ornamentChoice = "sixteenthPop"
+
+        if  not ornamentChoice:
+            if  (self.random.random() * 100) <= 70:  return None        # Frequency to bypass ornaments.
+            ornamentChoice  = self.random.choice(list(Ornaments.keys()))
+
+
+        #
+        if    "sixteenthLeadIn"             == ornamentChoice:  
+            pass
+
+        elif  "sixteenthPop"                == ornamentChoice:
+            if       state["sixteenthTripletTurnaround"] > 0    \
+                and  state["sixteenthTripletTurnaround"] != 2:
+                return  None
+
+        elif  "sixteenthTripletTurnaround"  == ornamentChoice:
+            # Generate no more often than once every fourCount.
+            # Optionally generate "sixteenthPop" at half-way (above).
+            #
+            if  state["sixteenthTripletTurnaround"] > 0:
+                return  None
+
+            state["sixteenthTripletTurnaround"] = fourCount 
+
+        else:
+            log.error(f"UNRECOGNIZED ornament choice.  ({ornamentChoice})")
+            return  None
+
+        return  ornamentChoice
+
+#ENDCLASS -- OrnamentGenerator()
+
+
+# Used by generateOrnament*().  Shares module random and ornamentState.
+#
+_ornamentGeneratorDefault  :OrnamentGenerator  = OrnamentGenerator(rand=random, state=ornamentState)
+
+
 #                                                                    -o-
 def  generateOrnament(fromMIDINote:int, key:Key, mode:ModeNames, bpm:float) -> Union[List[Any],None]:
     """
@@ -332,66 +1010,234 @@ def  generateOrnament(fromMIDINote:int, key:Key, mode:ModeNames, bpm:float) -> U
     Random filters to manage internal state are arbitrrary, specific and experimental.  YMMV.
 
     Call generateOrnamentReset() to reset ornament module internal state.
+
+    NB  Module state is shared by all callers.  For independent voices or 
+        threads, use one OrnamentGenerator per voice.
     """
+    return  _ornamentGeneratorDefault.generate(fromMIDINote, key, mode, bpm)
 
-    ornamentChoice  :str        = None
-    ornamentBlob    :List[Any]  = None
-    oscArgs         :List[Any]  = []
-    fourCount       :int        = 4
 
-    global  ornamentState
+#                                                                    -o-
+def  generateOrnamentReset()  -> None:
+    _ornamentGeneratorDefault.reset()
 
 
-    #
-    if  ornamentState["sixteenthTripletTurnaround"] > 0:        # Check existing state.
-        ornamentState["sixteenthTripletTurnaround"] -= 1
+#                                               -o-
+class  SequencePipeline:
+    """
+    Streaming pipeline for one voice--
+
+        notes  ->  ornaments  ->  messageBuilder  ->  bundles  ->  client
+
+    One note is taken from notes (eg, generateScaleSequence()) for each 
+    tick of clock at subdivision.  If ornaments is given, its ornament 
+    for the note is generated.  messageBuilder(note, ornament) returns 
+    one messageList, a list of messageLists, or None for a rest.
+
+    fill() builds the messages for every tick up to lookaheadBeats ahead 
+    of the clock, each in a bundle whose timetag is the time of its tick, 
+    and holds them in the lookahead buffer.  flush() sends the buffer 
+    as one batch.  run() does both every refillBeats, until clock.stop().
+    Message construction is thus off the timing-critical path.
+
+    By DEFAULT, each bundle is sent by client.send(), which holds 
+    bundles until their timetag when client.enableBundleScheduling is 
+    True, and which MOSRTcmix translates for CMIX.  If useBatchSend is 
+    True, bundles are sent by client.batchSend(), leaving timing to the 
+    receiver.  Receivers that ignore timetags then play each note up to 
+    lookaheadBeats early.
+
+    Ticks are timed by clock when they are filled, so changes to BPM 
+    apply only after lookaheadBeats.
+
+      clock     = BeatClock(bpm)
+      pipeline  = SequencePipeline(client, clock, 4, generateScaleSequence(), messageBuilder)
+      clock.start()
+      threading.Thread(target=pipeline.run).start()
+
+    PUBLIC METHODS--
+        * fill()
+        * flush()
+        * run()
+        * statistics()
+    """
 
-        if  ornamentState["sixteenthTripletTurnaround"] == 2:
-            if  z.percentTrue(35):
-                ornamentChoice = "sixteenthPop"
+    #                                                                    -o-
+    def  __init__(  self, 
+                    client          :"mosOSC.MOSOSC",
+                    clock           :BeatClock,
+                    subdivision     :float,
+                    notes           :Iterator[int],
+                    messageBuilder  :Callable[[int, Union[List[Any],None]], Union[List[Any],None]],
+                    ornaments       :OrnamentGenerator  = None,
+                    key             :Key                = Key.C,
+                    mode            :ModeNames          = ModeNames.ionian,
+                    lookaheadBeats  :float              = 2,
+                    refillBeats     :float              = 1,
+                    useBatchSend    :bool               = False,
+                 ):
+        if  subdivision <= 0:
+            log.critical(f"subdivision MUST BE GREATER THAN ZERO.  ({subdivision})")
+
+        if  (refillBeats <= 0)  or  (lookaheadBeats < refillBeats):
+            log.critical(f"refillBeats MUST BE GREATER THAN ZERO AND NO GREATER THAN lookaheadBeats.  ({refillBeats}, {lookaheadBeats})")
+
+        self.client          :"mosOSC.MOSOSC"     = client
+        self.clock           :BeatClock           = clock
+        self.subdivision     :float               = subdivision
+        self.notes           :Iterator[int]       = iter(notes)
+        self.messageBuilder  :Callable            = messageBuilder
+        self.ornaments       :OrnamentGenerator   = ornaments
+        self.key             :Key                 = key
+        self.mode            :ModeNames           = mode
+        self.lookaheadBeats  :float               = lookaheadBeats
+        self.refillBeats     :float               = refillBeats
+        self.useBatchSend    :bool                = useBatchSend
+
+        self._buffer        :collections.deque  = collections.deque()     # (tick, timestamp, OscBundleBuilder)
+        self._nextTick      :int                = None
+        self._isExhausted   :bool               = False
+
+        self._filled        :int   = 0      # Ticks filled, including rests.
+        self._sent          :int   = 0      # Bundles sent.
+        self._fillTotalNs   :int   = 0      # Time spent in fill(), summed.
+
+
+    #                                                                    -o-
+    @property
+    def  pending(self)  -> int:
+        """
+        Number of bundles filled and not yet sent.
+        """
+        return  len(self._buffer)
+
+
+    #                                                                    -o-
+    def  fill(self)  -> int:
+        """
+        Build bundles for ticks up to lookaheadBeats ahead of clock.
+        RETURNS  Number of ticks filled.  Zero (0) if clock is not 
+                   running, or notes is exhausted.
+        """
+
+        clock = self.clock
+
+        if  (not clock.isRunning)  or  self._isExhausted:  return 0
+
+        startNs = time.monotonic_ns()
+
+        with clock._condition:
+            horizonBeat  = clock._beatAtNs(startNs) + self.lookaheadBeats
+            tickNs       = {}
+
+            if  None is self._nextTick:
+                self._nextTick = math.floor(clock._beatAtNs(startNs) * self.subdivision) + 1
+
+            lastTick = math.floor(horizonBeat * self.subdivision)
+
+            for tick in range(self._nextTick, lastTick + 1):
+                tickNs[tick] = clock._nsAtBeat(tick / self.subdivision)
+
+            bpm = clock.bpm
 
-    if  not ornamentChoice:
-        if  z.percentTrue(70):  return None                     # Frequency to bypass ornaments.
-        ornamentChoice  = random.choice(list(Ornaments.keys()))
 
+        #
+        filledCount = 0
 
-    #
-    if    "sixteenthLeadIn"             == ornamentChoice:  
-        pass
+        for tick, dueNs in tickNs.items():
+            try:
+                note = next(self.notes)
+            except  StopIteration:
+                self._isExhausted = True
+                break
+
+            ornament = None
+            if  self.ornaments:
+                ornament = self.ornaments.generate(note, self.key, self.mode, bpm)
+
+            messages = self.messageBuilder(note, ornament)
+
+            self._nextTick  = tick + 1
+            filledCount    += 1
+
+            if  not messages:  continue                         # Rest.
+
+            if  isinstance(messages[0], str):
+                messages = [messages]
+
+            timestamp  = mosOSC.OSCBundleScheduler.timestampFromMonotonicNs(dueNs)
+            self._buffer.append((tick, timestamp, self.client.bundle(*messages, timestamp=timestamp)))
 
-    elif  "sixteenthPop"                == ornamentChoice:
-        if       ornamentState["sixteenthTripletTurnaround"] > 0    \
-            and  ornamentState["sixteenthTripletTurnaround"] != 2:
-            return  None
 
-    elif  "sixteenthTripletTurnaround"  == ornamentChoice:
-        # Generate no more often than once every fourCount.
-        # Optionally generate "sixteenthPop" at half-way (above).
         #
-        if  ornamentState["sixteenthTripletTurnaround"] > 0:
-            return  None
+        self._filled       += filledCount
+        self._fillTotalNs  += time.monotonic_ns() - startNs
 
-        ornamentState["sixteenthTripletTurnaround"] = fourCount 
+        return  filledCount
 
-    else:
-        log.error(f"UNRECOGNIZED ornament choice.  ({ornamentChoice})")
-        return  None
 
-   
-    #
-    ornamentBlob  = _translateOrnamentScaleToMIDI(ornamentChoice, fromMIDINote, key, mode)
-    if  not ornamentBlob:  return None 
+    #                                                                    -o-
+    def  flush(self)  -> int:
+        """
+        Send all bundles in the lookahead buffer.
+        RETURNS  Number of bundles sent.
+        """
 
-    oscArgs = [ornamentChoice, bpm, ornamentBlob[0]]
-    oscArgs += ornamentBlob[1]
+        if  len(self._buffer) <= 0:  return 0
 
-    return  oscArgs
+        bundles = [ _[2]  for _ in self._buffer ]
+        self._buffer.clear()
 
+        if  self.useBatchSend:
+            self.client.batchSend(*bundles)
+        else:
+            for bundle in bundles:
+                self.client.send(bundle)
 
-#                                                                    -o-
-def  generateOrnamentReset()  -> None:
-    global  ornamentState
-    ornamentState = ornamentState.fromkeys(ornamentState.keys(), 0)
+        self._sent += len(bundles)
+
+        return  len(bundles)
+
+
+    #                                                                    -o-
+    def  run(self)  -> None:
+        """
+        fill() and flush() every refillBeats, until clock.stop() 
+        or notes is exhausted.  Blocks until clock is started.
+        """
+
+        clock   = self.clock
+        ticker  = clock.ticker(1 / self.refillBeats)
+
+        with clock._condition:
+            while  (not clock._isStarted)  and  (not clock._isStopped):
+                clock._condition.wait()
+
+        while  True:
+            self.fill()
+            self.flush()
+
+            if  self._isExhausted  or  (not ticker.wait()):  break
+
+
+    #                                                                    -o-
+    def  statistics(self)  -> dict:
+        """
+        RETURNS  Dictionary: filled, sent, pending, fillMeanUs (per tick).
+        """
+
+        fillMeanUs  :float  = None
+
+        if  self._filled > 0:
+            fillMeanUs = self._fillTotalNs / self._filled / 1000
+
+        return  { "filled"      : self._filled,
+                  "sent"        : self._sent,
+                  "pending"     : len(self._buffer),
+                  "fillMeanUs"  : fillMeanUs,
+                }
+
+#ENDCLASS -- SequencePipeline()
 
 
 
@@ -399,6 +1245,23 @@ def  generateOrnamentReset()  -> None:
 #----------------------------------------- -o--
 # Protected functions.
 
+#                                                                    -o-
+def  _scaleTableRow(key:Key, mode:ModeNames) -> Union[Tuple[int, int, int],None]:
+    """
+    RETURN  (offset into _scaleIndexTable, offset into _scaleNoteTable, 
+               scale length) for key and mode, or None if mode is not defined.
+
+    Scale tables are built on first use.
+    """
+
+    if  None is _scaleTableRows:
+        buildScaleTables()
+
+    try:
+        return  _scaleTableRows.get((int(key), int(mode)))
+    except  (TypeError, ValueError):
+        return  None
+
 #                                                                    -o-
 def  _discoverMIDINoteScaleIndexInMode(midiNote:int, key:Key, mode:ModeNames) -> Union[int,None]:
     """
@@ -407,12 +1270,12 @@ def  _discoverMIDINoteScaleIndexInMode(midiNote:int, key:Key, mode:ModeNames) ->
     NB  Range of scale tone depends upon the mode (generally 0-7).  Zero(0) is root.
 
     Scale tone is also the index into scale array.
+
+    Scale tone is found in _scaleIndexTable.  See buildScaleTables().
     """
 
-    listOfRegisters  :list  = None
-    register         :int   = -1
-    scaleForMode     :List  = findScaleForMode(mode)
-    scaleIndex       :int   = 0
+    row         :Tuple[int, int, int]  = None
+    scaleIndex  :int                   = -1
 
 
     #
@@ -420,33 +1283,57 @@ def  _discoverMIDINoteScaleIndexInMode(midiNote:int, key:Key, mode:ModeNames) ->
         log.error(f"midiNote is OUT OF RANGE.  ({midiNote})")
         return  None
 
-    if  None is scaleForMode:
+    row = _scaleTableRow(key, mode)
+    if  None is row:
         log.error(f"mode is UNRECOGNIZED.  ({mode})")
         return  None
 
 
     #
-    listOfRegisters  = list(MIDINote)
-    register  = listOfRegisters.pop(0)
+    scaleIndex = _scaleIndexTable[row[0] + midiNote]
 
-    for reg in listOfRegisters:
-        if  midiNote < reg:  break
-        register = reg
+    if  scaleIndex < 0:
+        log.debug("hi3")
+        return  None
 
-    register += key
+    return  scaleIndex
 
-    while  scaleIndex < len(scaleForMode):
-        if  midiNote == (register + scaleForMode[scaleIndex]):
-            return  scaleIndex
-        scaleIndex += 1
 
-    log.debug("hi3")
-    return  None
+#                                                                    -o-
+def  _translateOrnamentScaleToMIDI(ornamentName:str, fromMIDINote:int, key:Key, mode:ModeNames) -> Union[List[Any],None]:
+    """
+    RETURN  [ornamentSubdivision, [listOfMIDIOffsets]] for ornamentName
+              beginning on fromMIDINote, in key and mode.  
+            None if inputs are invalid.
+
+    Offsets are found by _computeOrnamentTableEntry() once per input, 
+      then read from _ornamentTable.  Lists returned are new.
+    """
+
+    entry  :Tuple[int, Tuple[int], Tuple[Tuple[str, int]]]  = _ornamentTable.get((ornamentName, fromMIDINote, key, mode))
+
+    if  None is entry:
+        entry = _computeOrnamentTableEntry(ornamentName, fromMIDINote, key, mode)
+        if  None is entry:  return None 
+
+        _ornamentTable[(ornamentName, fromMIDINote, key, mode)] = entry
+
+    ornamentSubdivision, listOfMIDIOffsets, skippedIndices = entry
+
+    for error, oi in skippedIndices:
+        log.error(error)
+        log.error(f"SKIPPING ornament index.  ({oi})")
+
+    return  [ornamentSubdivision, [list(listOfMIDIOffsets)]]
 
 
 #                                                                    -o-
-def  _translateOrnamentScaleToMIDI(ornamentName:str, fromMIDINote:int, key:Key, mode:ModeNames) -> Union[List[Any],None]:
+def  _computeOrnamentTableEntry(ornamentName:str, fromMIDINote:int, key:Key, mode:ModeNames) -> Union[Tuple[int, Tuple[int], Tuple[Tuple[str, int]]],None]:
     """
+    RETURN  (ornamentSubdivision, MIDI offsets, skipped indices) for
+              _ornamentTable, or None if inputs are invalid.
+            Skipped indices are (error, ornament index) pairs.
+
     Goal: Find sequence of ornament notes, relative to both an arbitrary
           scale and an arbitrary starting pitch within that scale.
 
@@ -541,19 +1428,19 @@ def  _translateOrnamentScaleToMIDI(ornamentName:str, fromMIDINote:int, key:Key,
     #
     midiNoteNormalized = scaleAdjusted[midiNoteScaleIndex]
     listOfMIDIOffsets = []
+    skippedIndices = []
 
     # NB  Exceptions possible if ornament is used on a shorter scale, than expected.
     for oi in ornamentAdjusted:
         try:
             listOfMIDIOffsets.append( scaleAdjusted[oi] - midiNoteNormalized )
         except Exception as e:
-            log.error(e)
-            log.error(f"SKIPPING ornament index.  ({oi})")
+            skippedIndices.append((str(e), oi))
        
 
-    return  [ornamentSubdivision, [listOfMIDIOffsets]]
+    return  (ornamentSubdivision, tuple(listOfMIDIOffsets), tuple(skippedIndices))
 
-#ENDDEF -- _translateOrnamentScaleToMIDI
+#ENDDEF -- _computeOrnamentTableEntry
 
 
 
@@ -698,6 +1585,604 @@ def  testOrnaments():
     z.postAndExit("DONE.")
 
 
+#                                               -o-
+def  testBeatClockDrift(  bpm             :float  = 150,
+                          subdivisions    :Tuple[float]  = (2, 7),
+                          beatCount       :int    = 8,
+                          workInSeconds   :float  = 0.003,
+                       )  -> dict:
+    """
+    Run each subdivision for beatCount beats, with workInSeconds of work 
+    per tick, first as a time.sleep() sequencer (as in demos), then as 
+    BeatTickers sharing one BeatClock, each in its own thread.
+
+    Drift is time of the last tick minus its ideal time, in microseconds.
+    """
+    log.mark()
+
+    results  :Dict[str, Any]  = {}
+
+
+    # Sleep after work.
+    #
+    for subdivision in subdivisions:
+        tickCount  = int(beatCount * subdivision)
+        startNs    = time.monotonic_ns()
+
+        for _ in range(tickCount):
+            time.sleep(workInSeconds)
+            time.sleep(subdivisionPerBeat(bpm, subdivision))
+
+        idealNs = tickCount * subdivisionPerBeat(bpm, subdivision) * 1_000_000_000
+        results[f"sleepSubdivision{subdivision}DriftUs"] = (time.monotonic_ns() - startNs - idealNs) / 1000
+
+
+    # BeatClock.
+    #
+    clock    = BeatClock(bpm)
+    tickers  = [ clock.ticker(_)  for _ in subdivisions ]
+
+    def  runTicker(ticker:BeatTicker)  -> None:
+        while  ticker.wait():
+            time.sleep(workInSeconds)
+            if  ticker.beat >= beatCount:  break
+
+    threads = [ threading.Thread(target=runTicker, args=(_,))  for _ in tickers ]
+    clock.start()
+
+    for thread in threads:  thread.start()
+    for thread in threads:  thread.join()
+
+    clock.stop()
+
+    for ticker in tickers:
+        stats = ticker.statistics()
+        results[f"clockSubdivision{ticker.subdivision}DriftUs"]          = stats["latenessLastUs"]
+        results[f"clockSubdivision{ticker.subdivision}LatenessMeanUs"]   = stats["latenessMeanUs"]
+        results[f"clockSubdivision{ticker.subdivision}LatenessMaxUs"]    = stats["latenessMaxUs"]
+        results[f"clockSubdivision{ticker.subdivision}Missed"]           = stats["missed"]
+
+    for key, value in results.items():
+        log.info(f"{key:40} {value}")
+
+    return  results
+
+#ENDDEF -- testBeatClockDrift()
+
+
+#                                               -o-
+def  testScaleTablesEquivalence(sequenceLength:int=100)  -> bool:
+    """
+    Compare scale index lookup and scale sequences with fixed expected 
+    values, recorded from the implementations before scale tables.  
+    Cases cover modes of both tables, keys with and without offset, each 
+    direction, scaleEndBoundByRoot, and the ends of the MIDI note range.
+
+    Then, for every key, mode, octave, octaveRange, direction and 
+    scaleEndBoundByRoot, and for every MIDI note, check that per-call 
+    and batch functions agree.
+    """
+    log.mark()
+
+    indexCases  :List[Tuple[Key, ModeNames, int, List[int]]]  = [
+        # key, mode, first MIDI note, scale index of each note from first.  -1 if none.
+        ( Key.C,   ModeNames.ionian,         60,  [0, -1, 1, -1, 2, 3, -1, 4, -1, 5, -1, 6, 0] ),
+        ( Key.D,   ModeNames.dorian,         60,  [-1, -1, 0, -1, 1, 2, -1, 3, -1, 4, -1, 5, -1] ),
+        ( Key.A,   ModeNames.harmonicMinor,  69,  [0, -1, 1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 0] ),
+        ( Key.Fs,  ModeNames.pentatonic,     66,  [0, -1, 1, -1, 2, -1, -1, -1, -1, -1, -1, -1, 0] ),
+        ( Key.B,   ModeNames.locrian,       100,  [-1, -1, -1, -1, -1, -1, -1, 0, -1, -1, -1, -1] ),
+        ( Key.C,   ModeNames.ionian,         20,  [-1, -1, -1, -1, 0, -1, 1, -1] ),
+        ( Key.G,   ModeNames.mixolydian,    104,  [-1, 1, -1, 2, -1, -1, -1, -1] ),
+    ]
+
+    sequenceCases  :List[Tuple[Dict[str, Any], List[int]]]  = [
+        # generateScaleSequence() arguments, first 20 notes.
+        ( {},
+          [60, 62, 64, 65, 67, 69, 71, 72, 74, 76, 77, 79, 81, 83, 84, 60, 62, 64, 65, 67] ),
+        ( { "key" : Key.D, "mode" : ModeNames.dorian, "octaveRange" : 1, "direction" : Direction.UPDOWN },
+          [62, 64, 65, 67, 69, 71, 72, 74, 72, 71, 69, 67, 65, 64, 62, 64, 65, 67, 69, 71] ),
+        ( { "direction" : Direction.DOWN, "octaveRange" : 1, "scaleEndBoundByRoot" : False },
+          [59, 57, 55, 53, 52, 50, 48, 59, 57, 55, 53, 52, 50, 48, 59, 57, 55, 53, 52, 50] ),
+        ( { "key" : Key.A, "mode" : ModeNames.harmonicMinor, "octave" : MIDINote.C3, "octaveRange" : 2, "direction" : Direction.DOWNUP },
+          [57, 56, 53, 52, 50, 48, 47, 45, 44, 41, 40, 38, 36, 35, 33, 35, 36, 38, 40, 41] ),
+        ( { "key" : Key.Fs, "mode" : ModeNames.pentatonic, "octave" : MIDINote.C5, "octaveRange" : 1, "scaleEndBoundByRoot" : False },
+          [78, 80, 82, 84, 86, 88, 78, 80, 82, 84, 86, 88, 78, 80, 82, 84, 86, 88, 78, 80] ),
+        ( { "key" : Key.Bf, "mode" : ModeNames.lydian, "octave" : MIDINote.C1, "octaveRange" : 1, "direction" : Direction.DOWN },
+          [34, 33, 31, 29, 28, 26, 24, 22, 34, 33, 31, 29, 28, 26, 24, 22, 34, 33, 31, 29] ),
+        ( { "key" : Key.E, "mode" : ModeNames.phrygian, "octave" : MIDINote.C7, "octaveRange" : 1, 
+            "direction" : Direction.UPDOWN, "scaleEndBoundByRoot" : False },
+          [100, 101, 103, 105, 107, 108, 110, 108, 107, 105, 103, 101, 100, 101, 103, 105, 107, 108, 110, 108] ),
+    ]
+
+    isAllEqual  :bool  = True
+    caseCount   :int   = 0
+
+    modesAll  = list(Modes.keys()) + list(ModesAdditional.keys())
+    keys      = list(dict.fromkeys(Key))                        # NB  Without aliases.
+
+    logging.disable(logging.DEBUG)          # Squelch debug message for each note not in scale.
+
+    #
+    for key, mode, firstNote, indicesExpected in indexCases:
+        caseCount += 1
+        indices = list(scaleIndicesForMIDINotes(range(firstNote, firstNote + len(indicesExpected)), key, mode))
+
+        if  indices != indicesExpected:
+            log.error(f"Scale index MISMATCH:  {key!r} {mode!r} from {firstNote}\n    {indicesExpected}\n    {indices}")
+            isAllEqual = False
+
+    for args, sequenceExpected in sequenceCases:
+        caseCount += 1
+        sequence = list(itertools.islice(generateScaleSequence(**args), len(sequenceExpected)))
+
+        if  sequence != sequenceExpected:
+            log.error(f"Scale sequence MISMATCH:  {args}\n    {sequenceExpected}\n    {sequence}")
+            isAllEqual = False
+
+    for key, mode in itertools.product(keys, modesAll):
+        indices = scaleIndicesForMIDINotes(range(128), key, mode)
+
+        for midiNote in range(MIDINote.C1, MIDINote.C8 + 1):
+            caseCount += 1
+            index = _discoverMIDINoteScaleIndexInMode(midiNote, key, mode)
+            if  (-1 if None is index else index) != indices[midiNote]:
+                log.error(f"Scale index MISMATCH between per-call and batch:  {midiNote} {key!r} {mode!r}")
+                isAllEqual = False
+
+        for octave, octaveRange, direction, scaleEndBoundByRoot in itertools.product(MIDINote, range(1, 7), Direction, [True, False]):
+            caseCount += 1
+            args = { "key" : key, "mode" : mode, "octave" : octave, "octaveRange" : octaveRange, 
+                     "direction" : direction, "scaleEndBoundByRoot" : scaleEndBoundByRoot }
+
+            if  list(itertools.islice(generateScaleSequence(**args), sequenceLength)) != list(scaleSequenceArray(sequenceLength, **args)):
+                log.error(f"Scale sequence MISMATCH between generator and batch:  {args}")
+                isAllEqual = False
+
+    logging.disable(logging.NOTSET)
+
+    log.info(f"Scale tables equivalence: {'PASSED' if isAllEqual else 'FAILED'}  ({caseCount} cases)")
+
+    return  isAllEqual
+
+#ENDDEF -- testScaleTablesEquivalence()
+
+
+#                                               -o-
+def  testScaleTablesBenchmark(callCount:int=20000, sequenceLength:int=64)  -> dict:
+    """
+    Time scale index lookup and scale sequence creation, per call and 
+    in batch.
+    """
+    log.mark()
+
+    rand     = random.Random(1)
+    notes    = [ rand.randint(MIDINote.C1, MIDINote.C8)  for _ in range(callCount) ]
+    results  :Dict[str, float]  = {}
+
+    def  timeIt(function)  -> float:
+        timeStart = time.perf_counter()
+        function()
+        return  time.perf_counter() - timeStart
+
+    #
+    logging.disable(logging.DEBUG)
+
+    results["indexPerCallSeconds"]  = timeIt(lambda: [ _discoverMIDINoteScaleIndexInMode(_, Key.C, ModeNames.ionian)  for _ in notes ])
+    results["indexTableSeconds"]    = timeIt(lambda: [ _scaleIndexTable[_scaleTableRow(Key.C, ModeNames.ionian)[0] + _]  for _ in notes ])
+    results["indexBatchSeconds"]    = timeIt(lambda: scaleIndicesForMIDINotes(notes, Key.C, ModeNames.ionian))
+
+    logging.disable(logging.NOTSET)
+
+    sequenceCount = callCount // 10
+    results["sequenceGeneratorSeconds"]  = timeIt(lambda: [ list(itertools.islice(generateScaleSequence(octaveRange=3), sequenceLength))  for _ in range(sequenceCount) ])
+    results["sequenceBatchSeconds"]      = timeIt(lambda: [ scaleSequenceArray(sequenceLength, octaveRange=3)  for _ in range(sequenceCount) ])
+
+    for key, value in results.items():
+        log.info(f"{key:30} {value:.6f}")
+
+    return  results
+
+#ENDDEF -- testScaleTablesBenchmark()
+
+
+#                                               -o-
+def  testOrnamentTableEquivalence()  -> bool:
+    """
+    Compare output and logged errors of _translateOrnamentScaleToMIDI()
+    with fixed expected values, twice, so that the second pass reads 
+    _ornamentTable.  Cases cover every ornament, modes of both tables, 
+    and each error.  Expected values were recorded from the implementation 
+    before _ornamentTable.
+
+    Then, for every ornament, key, mode and MIDI note, check that the 
+    first pass and the pass from _ornamentTable agree.
+    """
+    log.mark()
+
+    literalCases  :List[Tuple[Tuple[str, int, Key, ModeNames], Union[List[Any],None], List[str]]]  = [
+        ( ("sixteenthLeadIn", 60, Key.C, ModeNames.ionian),
+          [4, [[-3, -1, 0]]],
+          [] ),
+        ( ("sixteenthLeadIn", 62, Key.D, ModeNames.dorian),
+          [4, [[-3, -2, 0]]],
+          [] ),
+        ( ("sixteenthLeadIn", 69, Key.A, ModeNames.harmonicMinor),
+          [4, [[-4, -1, 0]]],
+          [] ),
+        ( ("sixteenthLeadIn", 66, Key.Fs, ModeNames.pentatonic),
+          [4, [[-4, -2, 0]]],
+          [] ),
+        ( ("sixteenthTripletTurnaround", 60, Key.C, ModeNames.ionian),
+          [6, [[0, 2, 0, -1, -3, -5, 12, 11]]],
+          [] ),
+        ( ("sixteenthTripletTurnaround", 67, Key.G, ModeNames.mixolydian),
+          [6, [[0, 2, 0, -2, -3, -5, 12, 10]]],
+          [] ),
+        ( ("sixteenthTripletTurnaround", 66, Key.Fs, ModeNames.pentatonic),
+          [6, [[0, 2, 0, -2, -4, -6, 14, 12]]],
+          [] ),
+        ( ("sixteenthPop", 62, Key.D, ModeNames.dorian),
+          [4, [[0, 12, 12, 5, 9]]],
+          [] ),
+        ( ("sixteenthPop", 64, Key.E, ModeNames.phrygian),
+          [4, [[0, 12, 12, 5, 8]]],
+          [] ),
+        ( ("sixteenthPop", 71, Key.B, ModeNames.locrian),
+          [4, [[0, 12, 12, 5, 8]]],
+          [] ),
+        ( ("sixteenthLeadIn", 61, Key.C, ModeNames.ionian),
+          None,
+          [ 'fromMIDINote does NOT EXIST in mode "ionian".  (61)' ] ),
+        ( ("sixteenthLeadIn", 10, Key.C, ModeNames.ionian),
+          None,
+          [ "midiNote is OUT OF RANGE.  (10)", 'fromMIDINote does NOT EXIST in mode "ionian".  (10)' ] ),
+        ( ("sixteenthTripletTurnaround", 21, Key.A, ModeNames.aeolian),
+          None,
+          [ "midiNote is OUT OF RANGE.  (21)", 'fromMIDINote does NOT EXIST in mode "aeolian".  (21)' ] ),
+        ( ("sixteenthPop", 120, Key.C, ModeNames.ionian),
+          None,
+          [ "midiNote is OUT OF RANGE.  (120)", 'fromMIDINote does NOT EXIST in mode "ionian".  (120)' ] ),
+        ( ("sixteenthRoll", 60, Key.C, ModeNames.ionian),
+          None,
+          [ "Ornament DOES NOT EXIST.  (sixteenthRoll)" ] ),
+    ]
+
+    isAllEqual  :bool  = True
+    caseCount   :int   = 0
+    logError           = log.error
+
+    modesAll  = list(Modes.keys()) + list(ModesAdditional.keys())
+    sweeps    :List[List[Any]]  = []
+
+    logging.disable(logging.DEBUG)          # Squelch debug message for each note not in scale.
+    _ornamentTable.clear()
+
+    try:
+        for passIndex in range(2):
+            for call, outputExpected, errorsExpected in literalCases:
+                caseCount += 1
+
+                errors  :List[str]  = []
+                log.error = lambda message, *args: errors.append(str(message))
+                output = _translateOrnamentScaleToMIDI(*call)
+
+                if  (output != outputExpected)  or  (errors != errorsExpected):
+                    log.error = logError
+                    log.error(f"Ornament MISMATCH on pass {passIndex}:  {call}\n    {outputExpected} {errorsExpected}\n    {output} {errors}")
+                    isAllEqual = False
+
+            sweep  :List[Any]  = []
+
+            for ornamentName, key, mode, midiNote in itertools.product(Ornaments.keys(), dict.fromkeys(Key), modesAll, range(128)):
+                caseCount += 1
+
+                errors  :List[str]  = []
+                log.error = lambda message, *args: errors.append(str(message))
+                output = _translateOrnamentScaleToMIDI(ornamentName, midiNote, key, mode)
+
+                sweep.append(((ornamentName, midiNote, key, mode), output, errors))
+
+            sweeps.append(sweep)
+
+        log.error = logError
+
+        for first, second in zip(*sweeps):
+            if  first != second:
+                log.error(f"Ornament MISMATCH between first pass and _ornamentTable:  {first[0]}\n    {first[1:]}\n    {second[1:]}")
+                isAllEqual = False
+    finally:
+        log.error = logError
+        logging.disable(logging.NOTSET)
+
+    log.info(f"Ornament table equivalence: {'PASSED' if isAllEqual else 'FAILED'}  ({caseCount} cases, {len(_ornamentTable)} entries)")
+
+    return  isAllEqual
+
+#ENDDEF -- testOrnamentTableEquivalence()
+
+
+#                                               -o-
+def  testOrnamentTableBenchmark(callCount:int=50000, seed:int=1)  -> dict:
+    """
+    Time _translateOrnamentScaleToMIDI() with an empty _ornamentTable
+    (each new entry computed on first use) and after buildOrnamentTable(),
+    for random ornaments on notes in the mode.
+    """
+    log.mark()
+
+    rand     = random.Random(seed)
+    modes    = list(Modes.keys())
+    results  :Dict[str, float]  = {}
+    calls    :List[Tuple[str, int, Key, ModeNames]]  = []
+
+    while  len(calls) < callCount:
+        key   = rand.choice(list(dict.fromkeys(Key)))
+        mode  = rand.choice(modes)
+        note  = rand.randint(MIDINote.C2, MIDINote.C7)
+
+        if  scaleIndicesForMIDINotes([note], key, mode)[0] >= 0:
+            calls.append((rand.choice(list(Ornaments.keys())), note, key, mode))
+
+    #
+    _ornamentTable.clear()
+
+    timeStart = time.perf_counter()
+    for call in calls:  _translateOrnamentScaleToMIDI(*call)
+    results["coldTableSeconds"] = time.perf_counter() - timeStart
+
+    timeStart = time.perf_counter()
+    results["buildEntries"] = buildOrnamentTable()
+    results["buildSeconds"] = time.perf_counter() - timeStart
+
+    timeStart = time.perf_counter()
+    for call in calls:  _translateOrnamentScaleToMIDI(*call)
+    results["tableSeconds"] = time.perf_counter() - timeStart
+
+    for key, value in results.items():
+        log.info(f"{key:30} {value:.6f}")
+
+    return  results
+
+#ENDDEF -- testOrnamentTableBenchmark()
+
+
+#                                               -o-
+def  testOrnamentGenerator(beatCount:int=5000, seed:int=1)  -> bool:
+    """
+    Compare generateOrnament() and OrnamentGenerator with fixed expected 
+    values, for several seeds and modes of key C over 24 beats.  Expected 
+    ornaments were recorded from generateOrnament() before 
+    OrnamentGenerator.
+
+    Then, for beatCount and seed, compare generateOrnament() and 
+    OrnamentGenerator, one beat at a time, after prepare() and by 
+    generateBatch(), with one another.  Then run two OrnamentGenerators 
+    in separate threads and compare with the same generators run in one 
+    thread.
+    """
+    log.mark()
+
+    expectedCases  :List[Tuple[int, ModeNames, MIDINote, Dict[int, List[Any]]]]  = [
+        # seed, mode, octave, ornaments by beat index.
+        ( 1,  ModeNames.mixolydian,     MIDINote.C3,  {
+               1 : [ "sixteenthLeadIn",             60, 4, [-4, -2, 0] ],
+               6 : [ "sixteenthLeadIn",             60, 4, [-3, -1, 0] ],
+               8 : [ "sixteenthTripletTurnaround",  60, 6, [0, 2, 0, -2, -4, -5, 12, 10] ],
+              12 : [ "sixteenthLeadIn",             60, 4, [-4, -2, 0] ],
+              19 : [ "sixteenthPop",                60, 4, [0, 12, 12, 5, 8] ],
+            } ),
+        ( 2,  ModeNames.dorian,         MIDINote.C4,  {
+               0 : [ "sixteenthLeadIn",             60, 4, [-3, -2, 0] ],
+               4 : [ "sixteenthTripletTurnaround",  60, 6, [0, 2, 0, -2, -4, -5, 12, 10] ],
+               6 : [ "sixteenthPop",                60, 4, [0, 12, 12, 5, 9] ],
+               9 : [ "sixteenthPop",                60, 4, [0, 12, 12, 6, 9] ],
+              11 : [ "sixteenthPop",                60, 4, [0, 12, 12, 5, 8] ],
+              12 : [ "sixteenthPop",                60, 4, [0, 12, 12, 5, 8] ],
+              13 : [ "sixteenthPop",                60, 4, [0, 12, 12, 5, 9] ],
+              20 : [ "sixteenthPop",                60, 4, [0, 12, 12, 5, 9] ],
+            } ),
+        ( 7,  ModeNames.harmonicMinor,  MIDINote.C3,  {
+              13 : [ "sixteenthLeadIn",             60, 4, [-4, -3, 0] ],
+              14 : [ "sixteenthPop",                60, 4, [0, 12, 12, 5, 8] ],
+              16 : [ "sixteenthPop",                60, 4, [0, 12, 12, 5, 9] ],
+            } ),
+        ( 11, ModeNames.ionian,         MIDINote.C4,  {
+               2 : [ "sixteenthTripletTurnaround",  60, 6, [0, 1, 0, -2, -4, -5, 12, 10] ],
+               7 : [ "sixteenthLeadIn",             60, 4, [-3, -1, 0] ],
+              11 : [ "sixteenthPop",                60, 4, [0, 12, 12, 5, 9] ],
+              13 : [ "sixteenthTripletTurnaround",  60, 6, [0, 1, 0, -2, -4, -6, 12, 10] ],
+            } ),
+    ]
+
+    isAllEqual  :bool  = True
+    key         :Key   = Key.C
+    mode        :ModeNames  = ModeNames.mixolydian
+    notes       :List[int]  = list(scaleSequenceArray(beatCount, key=key, mode=mode, octave=MIDINote.C3, scaleEndBoundByRoot=False))
+
+    #
+    for caseSeed, caseMode, caseOctave, ornamentsExpected in expectedCases:
+        caseNotes = list(scaleSequenceArray(24, key=key, mode=caseMode, octave=caseOctave, scaleEndBoundByRoot=False))
+
+        random.seed(caseSeed)
+        generateOrnamentReset()
+        moduleOrnaments = { index : ornament  for index, ornament in enumerate(generateOrnament(_, key, caseMode, 60)  for _ in caseNotes)  if ornament }
+        generateOrnamentReset()
+
+        batchOrnaments = { index : ornament  for index, ornament in enumerate(OrnamentGenerator(caseSeed).generateBatch(caseNotes, key, caseMode, 60))  if ornament }
+
+        for name, ornaments in [ ("generateOrnament",  moduleOrnaments), 
+                                 ("generateBatch",     batchOrnaments) ]:
+            if  ornaments != ornamentsExpected:
+                log.error(f"Ornaments from {name}() DO NOT MATCH expected:  seed {caseSeed}, {caseMode!r}, {caseOctave!r}\n    {ornamentsExpected}\n    {ornaments}")
+                isAllEqual = False
+
+
+    #
+    random.seed(seed)
+    generateOrnamentReset()
+    moduleOutput = [ generateOrnament(_, key, mode, 60)  for _ in notes ]
+    generateOrnamentReset()
+
+    generator = OrnamentGenerator(seed)
+    instanceOutput = [ generator.generate(_, key, mode, 60)  for _ in notes ]
+
+    generator = OrnamentGenerator(seed)
+    generator.prepare(beatCount)
+    preparedOutput = [ generator.generate(_, key, mode, 60)  for _ in notes ]
+
+    batchOutput = OrnamentGenerator(seed).generateBatch(notes, key, mode, 60)
+
+    for name, output in [ ("generate",          instanceOutput), 
+                          ("prepare",           preparedOutput), 
+                          ("generateBatch",     batchOutput) ]:
+        if  output != moduleOutput:
+            log.error(f"Ornaments from {name}() DO NOT MATCH generateOrnament().")
+            isAllEqual = False
+
+
+    # Two voices, each with its own state, in one thread then in two.
+    #
+    expected = [ OrnamentGenerator(seed + _).generateBatch(notes, key, mode, 60)  for _ in range(2) ]
+    results  = [ None, None ]
+    voices   = [ OrnamentGenerator(seed + _)  for _ in range(2) ]
+
+    def  runVoice(index:int)  -> None:
+        results[index] = [ voices[index].generate(_, key, mode, 60)  for _ in notes ]
+
+    threads = [ threading.Thread(target=runVoice, args=(_,))  for _ in range(2) ]
+    for thread in threads:  thread.start()
+    for thread in threads:  thread.join()
+
+    if  results != expected:
+        log.error("Ornaments from concurrent OrnamentGenerators DO NOT MATCH.")
+        isAllEqual = False
+
+    #
+    ornamentCount = sum(1 for _ in moduleOutput if _)
+    log.info(f"OrnamentGenerator equivalence: {'PASSED' if isAllEqual else 'FAILED'}  ({beatCount} beats, {ornamentCount} ornaments)")
+
+    return  isAllEqual
+
+#ENDDEF -- testOrnamentGenerator()
+
+
+#                                               -o-
+def  testSequencePipeline(  bpm             :float  = 240,
+                            subdivision     :float  = 4,
+                            beatCount       :int    = 8,
+                            lookaheadBeats  :float  = 2,
+                            port            :int    = 50561,
+                         )  -> dict:
+    """
+    Run SequencePipeline for beatCount beats, with ornaments, against 
+    a local socket that ignores timetags.  First with batchSend(), then 
+    with send() and client.enableBundleScheduling.
+
+    Timetag error is the distance of each timetag from its tick on the 
+    clock timeline.  Jitter is time of arrival minus timetag.  
+    Both in microseconds.
+    """
+    log.mark()
+
+    arrivalsNs  :List[Tuple[int, bytes]]  = []
+
+    serverSocket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    serverSocket.bind(("127.0.0.1", port))
+    serverSocket.settimeout(1.0)
+
+    def  receive():
+        try:
+            while  True:
+                datagram = serverSocket.recv(65536)
+                arrivalsNs.append((time.monotonic_ns(), datagram))
+        except  OSError:
+            pass
+
+    #
+    client = mosOSC.MOSOSC()
+    client.enablePathLogging = False
+    client.createClient(port=port)
+
+    def  messageBuilder(note:int, ornament:Union[List[Any],None])  -> List[List[Any]]:
+        messages = [ ["/sequence", note] ]
+        if  ornament:
+            messages.append(["/ornament", note] + ornament)
+        return  messages
+
+    #
+    def  measure(useBatchSend:bool)  -> dict:
+        arrivalsNs.clear()
+        client.enableBundleScheduling = not useBatchSend
+
+        thread = threading.Thread(target=receive, daemon=True)
+        thread.start()
+
+        clock     = BeatClock(bpm)
+        pipeline  = SequencePipeline( client, clock, subdivision, 
+                                      generateScaleSequence(mode=ModeNames.dorian, direction=Direction.UPDOWN), 
+                                      messageBuilder, 
+                                      ornaments       = OrnamentGenerator(seed=1), 
+                                      mode            = ModeNames.dorian, 
+                                      lookaheadBeats  = lookaheadBeats,
+                                      useBatchSend    = useBatchSend )
+
+        runner = threading.Thread(target=pipeline.run)
+        runner.start()
+        clock.start()
+
+        time.sleep(beatCount * subdivisionPerBeat(bpm, 1))
+        clock.stop()
+        runner.join()
+        thread.join()
+
+        #
+        periodNs        = subdivisionPerBeat(bpm, subdivision) * 1_000_000_000
+        timetagErrorUs  = []
+        jitterUs        = []
+        ticks           = []
+
+        for arrivalNs, datagram in arrivalsNs:
+            bundle = mosOSC.osc_bundle.OscBundle(datagram)
+
+            for message in bundle:
+                if  "/sequence" != message.address:  continue
+
+                dueNs     = mosOSC.OSCBundleScheduler.monotonicNsFromTimestamp(bundle.timestamp)
+                tickReal  = (dueNs - clock._anchorNs) / periodNs
+
+                ticks.append(round(tickReal))
+                timetagErrorUs.append(abs(tickReal - round(tickReal)) * periodNs / 1000)
+                jitterUs.append((arrivalNs - dueNs) / 1000)
+
+        if  not jitterUs:
+            return  { "received" : 0 }
+
+        jitterUs.sort()
+
+        return  { "received"             : len(jitterUs),
+                  "ticksContiguous"      : ticks == list(range(ticks[0], ticks[0] + len(ticks))),
+                  "timetagErrorMaxUs"    : max(timetagErrorUs),
+                  "jitterMedianUs"       : jitterUs[len(jitterUs) // 2],
+                  "jitterMaximumUs"      : jitterUs[-1],
+                  "fillMeanUsPerTick"    : pipeline.statistics()["fillMeanUs"],
+                }
+
+    #
+    results = { "batchSend"     : measure(True),
+                "scheduled"     : measure(False),
+              }
+
+    client.destroyClient()
+    serverSocket.close()
+
+    for name, value in results.items():
+        log.info(f"{name:12} {value}")
+
+    return  results
+
+#ENDDEF -- testSequencePipeline()
+
+
 
 
 #-------------------------------------- -o--
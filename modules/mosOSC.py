@@ -39,9 +39,37 @@ USAGE  :str  = "[hostname:str], [port:int]"
 #----------------------------------------- -o--
 # Modules.
 
-from typing import Any, List, Tuple, Union
+import asyncio
+import collections
+import errno
+import heapq
+import io
+import itertools
+import logging
+from multiprocessing import resource_tracker
+from multiprocessing import shared_memory
+import os
+import platform
+import queue
+import random
+import re
+import select
+import socket
+import socketserver
+import statistics
+import struct
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Tuple, Union
 from types import FunctionType
 
+try:
+    import fcntl                        # NB  POSIX only.  Used by Transport.SHAREDMEMORY.
+except  ImportError:
+    fcntl = None
+
 
 #
 from pythonosc import udp_client
@@ -53,6 +81,8 @@ from pythonosc.osc_message_builder import OscMessageBuilder
 from pythonosc.osc_bundle_builder import OscBundleBuilder
 from pythonosc import osc_message 
 from pythonosc import osc_bundle 
+from pythonosc import osc_packet
+from pythonosc.parsing import osc_types
 
 
 #
@@ -62,6 +92,35 @@ log = mosLog.MOSLog(logTime=True, logDate=False)
 
 import mosZ as z
 import mosDump as dump
+from mosClass import StringEnum
+
+
+
+
+#----------------------------------------- -o--
+# Enums.
+
+#                                               -o-
+class  ServerMode(StringEnum):
+    """
+    How MOSOSC server receives datagrams and runs OSC path handlers.
+    See MOSOSC.createServer().
+    """
+    THREADING  = "threading"    # ThreadingOSCUDPServer: one thread per datagram.  (DEFAULT)
+    ASYNCIO    = "asyncio"      # AsyncIOOSCUDPServer: one event loop, supports coroutine handlers.
+    WORKERPOOL = "workerpool"   # One receive thread feeds OSCServerWorkerPool, sharded by OSC path.
+
+
+#                                               -o-
+class  Transport(StringEnum):
+    """
+    How MOSOSC client and server exchange packets.
+    See MOSOSC.createClient() and MOSOSC.createServer().
+    """
+    UDP           = "udp"             # UDP socket.  (DEFAULT)
+    SHAREDMEMORY  = "sharedmemory"    # OSCSharedMemoryRing.  Same host, MOSOSC at both ends.
+    TCP           = "tcp"             # TCP connection, SLIP framed.  See OSCSLIPStream.
+    UNIX          = "unix"            # Unix domain socket, SLIP framed.  Same host.
 
 
 
@@ -72,6 +131,7 @@ class  MOSOSC:
     SHARED ATTRIBUTES--
         * hostname
         * port
+        * transport
 
         * enablePathLogging 
 
@@ -87,11 +147,22 @@ class  MOSOSC:
         * bundle()
         * bundleAdd()
         * bundleSend()
+        * bundleNode()
 
         * send()
 
+        * messageTemplate()
+        * templateSend()
+
+        * batchSend()
+
         * postOSCArgs()
 
+        * bundleSchedulerStatistics()
+
+    CLIENT ATTRIBUTES--
+        * enableBundleScheduling
+
 
     SERVER METHODS--
         * createServer()      
@@ -101,15 +172,82 @@ class  MOSOSC:
         * stopServer()        
 
         * addPathHandler()
+        * addEventHandler()
         * removePathHandler()
         * listPathHandlers() 
 
         * parseEventArgs()       
 
+        * serverWorkerPoolStatistics()
+
     SERVER ATTRIBUTES--
         * enablePathHandlerDefault
         * pathHandlerDefaultFunction 
         * enableSourceAddrLogging
+        * serverMode
+
+        * serverWorkerCount
+        * serverWorkerQueueDepth
+        * serverWorkerBlockWhenFull
+
+        * sharedMemoryRingSize
+
+
+    SERVER MODES (ServerMode)--
+        * THREADING -- Each datagram is handled in a new thread.
+            Handlers may block without delaying other datagrams, but
+            thread creation is paid on every datagram and ordering 
+            between datagrams is not guaranteed.  At high message rates
+            the cost of thread creation dominates and latency grows 
+            less predictable as threads compete.
+
+        * ASYNCIO -- All datagrams are handled in one event loop thread.
+            No per-datagram thread is created, so throughput is higher and
+            latency is lower and steadier at high message rates, and 
+            datagrams are handled in order of arrival.  Handlers MUST NOT 
+            block; a slow handler delays every datagram that follows.  
+            Coroutine handlers are scheduled as tasks on the loop, so waits
+            within them overlap.
+
+        * WORKERPOOL -- One thread receives datagrams and queues each 
+            message to one of a fixed number of worker threads.  Messages
+            are sharded by OSC path, so messages to the same path are handled
+            in order of arrival, by the same worker.  Handlers may block,
+            delaying only messages that share their worker.  
+            When a worker queue is full, messages are dropped and counted
+            (DEFAULT), or the receive thread waits for room (backpressure),
+            per serverWorkerBlockWhenFull.  
+            See serverWorkerPoolStatistics().
+
+        See testServerModeBenchmark() to compare modes on a given host.
+
+
+    TRANSPORTS (Transport)--
+        * UDP -- (DEFAULT) Client and server may be on any host.  
+            Required to reach CMIX and other OSC applications.
+
+        * SHAREDMEMORY -- Client and server are MOSOSC on the same host,
+            in separate processes or the same one.  Packets are the same
+            encoded OSC, carried by OSCSharedMemoryRing instead of the 
+            loopback network stack.  Handlers are unchanged.  
+            ServerMode.ASYNCIO is not supported.  
+            One client process per server.  x86-64 only; createClient() 
+            and createServer() refuse it on other machines.  
+            See OSCSharedMemoryRing.
+
+        * TCP, UNIX -- OSC 1.1 stream transport.  Packets are framed by 
+            OSCSLIPStream on a persistent connection, over TCP or over
+            a Unix domain socket on the same host.  Packets are not 
+            limited by datagram size, are not fragmented by IP and are 
+            not lost while the connection holds, so large payloads, such
+            as long free lists, arrive whole and in order.  A slow server
+            slows the client instead of losing packets, unless serverMode 
+            is WORKERPOOL and serverWorkerBlockWhenFull is False.
+            Each connection is read by its own thread.  
+            ServerMode.ASYNCIO is not supported.  
+
+        See testTransportBenchmark() to compare transports on a given host,
+        and testLargePayloadBenchmark() to compare them for large payloads.
 
 
     NB  All OSC paths must begin with slash and be at least 
@@ -119,6 +257,24 @@ class  MOSOSC:
             message() + [messageAdd()] + send()
         ...or just one call: messageSend().  Bundles are similar.
 
+    NB  Bundle timetags are honored by the receiver, per OSC standard.
+        If enableBundleScheduling is True, delayed bundles are also held 
+        by the client and sent at their timetag, so timing holds even when
+        the receiver ignores timetags.  See OSCBundleScheduler.
+
+    NB  Bundles are built as OSCBundleNode, which is encoded once from 
+        the datagrams of its contents.  Nested bundles are not encoded 
+        again when composed.  Bundles sent repeatedly may be built once 
+        with bundleNode().
+
+    NB  Messages sent repeatedly with the same OSC path and argument types
+        may be encoded once with messageTemplate(), then sent with new
+        argument values by templateSend().  See OSCMessageTemplate.
+
+    NB  Handlers added by addEventHandler() receive one OSCEvent, parsed
+        by the dispatcher, instead of the eventArgs tuple that handlers 
+        added by addPathHandler() pass to parseEventArgs().
+
     NB
       * Incoming OSC path will match all valid handlers.
       * Use globbing in OSC path names to match multiple incoming OSC paths.  
@@ -142,6 +298,9 @@ class  MOSOSC:
     hostname  :str  = None
     port      :int  = None
 
+    transport  :Transport  = Transport.UDP              #DEFAULT
+        # Set by createClient() or createServer().  See Transport.
+
     enablePathLogging  :bool  = True                    #DEFAULT
         # Log the oscPath and associated arguments with log.osc().
         # Use this attributes in custom oscPath handlers to unify logging
@@ -173,6 +332,9 @@ class  MOSOSC:
         """
         self._validateHostnameAndPort(hostname, port)
 
+        self._bundleSchedulerLock  :threading.Lock  = threading.Lock()
+        self._eventLoopLock        :threading.Lock  = threading.Lock()
+
 
 
     #----------------------------------------------- -o--
@@ -226,9 +388,26 @@ class  MOSOSC:
 
 
     #=============================================== -o--
+    # Client public attributes.
+
+    enableBundleScheduling  :bool  = False              #DEFAULT
+        # If True, send() holds each part of a bundle with a future timetag
+        #   in OSCBundleScheduler, and sends it when due.  Timetags are 
+        #   still sent, so a receiver that honors them is unaffected.
+
+
+
+    #----------------------------------------------- -o--
     # Client protected attributes.
 
-    _client  :udp_client.UDPClient  = None
+    _client  :Union[udp_client.UDPClient, "_SharedMemoryClient"]  = None
+
+    _batchSender  :"_DatagramBatchSender"  = None
+        # Created on first use of batchSend().
+
+    _bundleScheduler  :"OSCBundleScheduler"  = None
+        # Created on first use of _scheduleSend(), under _bundleSchedulerLock,
+        #   since threads sharing the client may send at once.
 
 
 
@@ -240,27 +419,49 @@ class  MOSOSC:
     # Client runs as UDPClient.  pythonosc also offers SimpleUDPClient.
     #
     def  createClient(  self, 
-                        hostname         :str   = None, 
-                        port             :int   = None,
-                        enableBroadcast  :bool  = False,
+                        hostname         :str        = None, 
+                        port             :int        = None,
+                        enableBroadcast  :bool       = False,
+                        transport        :Transport  = None,
                      )  -> None:
         """
         One client per instance.  Client sends to server at hostname:port.
+
+        transport -- Transport.UDP (DEFAULT), Transport.SHAREDMEMORY,
+                     Transport.TCP or Transport.UNIX.  See class header.
         """
 
         if  self._client:
             log.critical("Client is ALREADY CREATED.")
 
+        if  not transport:  transport = Transport.UDP
+
+        if  not isinstance(transport, Transport):
+            log.critical(f"transport IS INVALID.  ({transport})")
+
         self._validateHostnameAndPort(hostname, port)
+        self.transport = transport
 
-        self._client = udp_client.UDPClient(self.hostname, self.port, enableBroadcast)
+        if  (Transport.SHAREDMEMORY == transport)  and  (not OSCSharedMemoryRing.isMachineSupported()):
+            log.critical(f"Transport.SHAREDMEMORY IS NOT SUPPORTED on this machine.  ({platform.machine()})")
+
+        if  Transport.SHAREDMEMORY == transport:
+            self._client = _SharedMemoryClient(self.hostname, self.port)
+        elif  transport in (Transport.TCP, Transport.UNIX):
+            self._client = _StreamClient(transport, self.hostname, self.port)
+        else:
+            self._client = udp_client.UDPClient(self.hostname, self.port, enableBroadcast)
 
         #
         enableBroadcastString = ""
         if  enableBroadcast:
             enableBroadcastString = "  Broadcast IS ENABLED."
 
-        log.info(f"Created client to {self.hostname}:{self.port}.{enableBroadcastString}")
+        transportString = ""
+        if  Transport.UDP != transport:
+            transportString = f" via {transport.value}"
+
+        log.info(f"Created client to {self.hostname}:{self.port}{transportString}.{enableBroadcastString}")
 
 
     #                                                                    -o-
@@ -269,7 +470,16 @@ class  MOSOSC:
             log.warning("Client is already UNDEFINED.")
             return
 
-        self._client = None
+        with self._bundleSchedulerLock:
+            if  self._bundleScheduler:
+                self._bundleScheduler.stop()
+            self._bundleScheduler = None
+
+        if  isinstance(self._client, (_SharedMemoryClient, _StreamClient)):
+            self._client.close()
+
+        self._client           = None
+        self._batchSender      = None
         log.info(f"Destroyed client to {self.hostname}:{self.port}.")
 
 
@@ -338,11 +548,17 @@ class  MOSOSC:
                  *messageListOrBundle   :Tuple[Union[ List[Any], OscBundleBuilder ]],
                   delayTimeInSeconds    :float  = 0,   #NB osc_bundle_builder.IMMEDIATELY, 
                   sendBundleNow         :bool   = False,
+                  timestamp             :float  = None,
                )  -> OscBundleBuilder:
         """
         When delayTimeInSeconds is zero (0), the received OSC message
           is executed immediately.  Otherwise, delay execution for N seconds.
-          Per OSC standard.
+          Per OSC standard.  Delay is measured by time.monotonic_ns(),
+          see OSCBundleScheduler.timestampNow().
+
+        timestamp, if given, is the OSC timetag (seconds since the epoch) 
+          and delayTimeInSeconds is ignored.  
+          See OSCBundleScheduler.timestampFromMonotonicNs().
 
 	NB  bundle*() methods take as input, and deliver as output,
 	    "builders": OscBundleBuilder or List[Any] (aka "messageList"),
@@ -363,12 +579,13 @@ class  MOSOSC:
 
 
         #
-        timestamp = 0
+        if  None is timestamp:
+            timestamp = 0
 
-        if  delayTimeInSeconds > 0:
-            timestamp = z.timeNowInSeconds(delayTimeInSeconds)
+            if  delayTimeInSeconds > 0:
+                timestamp = OSCBundleScheduler.timestampNow(delayTimeInSeconds)
 
-        bundleBuilder = OscBundleBuilder(timestamp)
+        bundleBuilder = _BundleNodeBuilder(timestamp)
 
 
         #
@@ -378,7 +595,7 @@ class  MOSOSC:
             if  isinstance(objToBundle, List):
                 objToBundle = self._convertMessageListToMessageBuilder(objToBundle)
 
-            bundleBuilder.add_content(objToBundle.build())
+            bundleBuilder.add_content(self._build(objToBundle))
 
         if  sendBundleNow:
             if len(messageListOrBundle) <= 0:   # XXX  Never reached.
@@ -414,7 +631,7 @@ class  MOSOSC:
             if  isinstance(objToBundle, List):
                 objToBundle = self._convertMessageListToMessageBuilder(objToBundle)
                 
-            bundleBuilder.add_content(objToBundle.build())
+            bundleBuilder.add_content(self._build(objToBundle))
 
         #
         return  bundleBuilder
@@ -432,13 +649,30 @@ class  MOSOSC:
         return  self.bundle(messageListOrBundleBuilder, delayTimeInSeconds=delayTimeInSeconds, sendBundleNow=True)
 
 
+    #                                                                    -o-
+    def  bundleNode(  self, 
+                      *messageListOrBundle   :Tuple[Union[ List[Any], OscBundleBuilder, "OSCBundleNode" ]],
+                       delayTimeInSeconds    :float  = 0,
+                       timestamp             :float  = None,
+                   )  -> "OSCBundleNode":
+        """
+        RETURNS  OSCBundleNode, as bundle() then build().  
+
+        The node is encoded once.  It may be sent any number of times 
+          and nested in other bundles, without being encoded again.
+          Arguments are as for bundle().
+        """
+        return  self._build(self.bundle(*messageListOrBundle, delayTimeInSeconds=delayTimeInSeconds, timestamp=timestamp))
+
+
 
     #                                                                    -o-
     def  send(  self, 
-                messageListOrBundleBuilder  :Union[List[Any], OscBundleBuilder],
+                messageListOrBundleBuilder  :Union[List[Any], OscBundleBuilder, "OSCBundleNode", "OSCMessageTemplate"],
              )  -> None:
 
-        objectToSend  :Union[OscMessageBuilder, OscBundleBuilder]  = None
+        objectToSend  :Union[ OscMessageBuilder, OscBundleBuilder, "OSCMessageTemplate", 
+                              osc_message.OscMessage, osc_bundle.OscBundle ]  = None
 
 
         #
@@ -455,63 +689,192 @@ class  MOSOSC:
         else:
             objectToSend = messageListOrBundleBuilder
 
-        self._client.send(objectToSend.build())
+        if       self.enableBundleScheduling                        \
+            and  isinstance(objectToSend, (OscBundleBuilder, OSCBundleNode)):
+            self._sendBundleScheduled(objectToSend)
+        elif  isinstance(objectToSend, OSCMessageTemplate):
+            self._client.send(objectToSend)                 # NB  Datagram is already encoded.
+        else:
+            objectToSend = self._build(objectToSend)        # NB  Also posted, below.
+            self._client.send(objectToSend)
 
 
         #
-        if  self.enablePathLogging:
+        if  self.enablePathLogging  and  log.isEnabledFor(logging.MOS_LOGGER_LEVEL_OSC):
             self.postOSCArgs(objectToSend)
 
 
     #                                                                    -o-
-    def  postOSCArgs(  self,
-                       messageOrBundleBuilder  :Union[OscMessageBuilder, OscBundleBuilder],
-                    )  -> None:
+    def  messageTemplate(  self, 
+                           oscPath       :str,
+                          *exampleArgs   :Tuple[Any],
+                           typeTags      :str          = None,
+                        )  -> "OSCMessageTemplate":
         """
-        Post OSC args via log.osc() for any OscMessageBuilder or OscBundleBuilder.
-        Occurs automatically when enablePathLogging is True.
+        RETURNS  OSCMessageTemplate for oscPath, with argument types taken 
+                   from typeTags or inferred from exampleArgs.
+                   Arguments are initialized to exampleArgs, if given.
+
+        Send with templateSend(), or use wherever a messageList or
+          OscMessageBuilder is accepted by bundle*() or send().
         """
 
-        def  postOSC(message:osc_message.OscMessage, atTimestamp:float=0) -> None:
-            delayString  :str  = ""
+        self._validateOSCPath(oscPath)
 
-            if  atTimestamp > 0:  
-                delayRemaining  = atTimestamp - z.timeNowInSeconds()
-                delayString     = f"  :: remaining delay {delayRemaining:.3f} @ time {atTimestamp:.3f}"
+        template = OSCMessageTemplate(oscPath, *exampleArgs, typeTags=typeTags)
+
+        if  exampleArgs:
+            template.fill(*exampleArgs)
+
+        return  template
+
+
+    #                                                                    -o-
+    def  templateSend(  self, 
+                        template      :"OSCMessageTemplate",
+                       *messageArgs   :Tuple[Any],
+                     )  -> "OSCMessageTemplate":
+        """
+        Write messageArgs into template, in place, and send it.
+        If messageArgs is empty, send template with its current arguments.
+        """
+
+        self._validateClientSetup()
+
+        if  messageArgs:
+            template.fill(*messageArgs)
 
-            log.osc(f"{message.address} {z.c2s(message._parameters)}{delayString}")
+        self._client.send(template)
 
-        #ENDDEF -- postOSC()
+        if  self.enablePathLogging  and  log.isEnabledFor(logging.MOS_LOGGER_LEVEL_OSC):
+            log.osc(log.deferred("%s %s", template.address, log.deferred(z.c2s, template.args)))
 
+        return  template
+
+
+    #                                                                    -o-
+    def  batchSend(  self, 
+                    *messageListOrBundleBuilder  :Tuple[Union[ List[Any], OscBundleBuilder, "OSCBundleNode", "OSCMessageTemplate" ]],
+                  )  -> int:
+        """
+        RETURNS  Number of datagrams sent.
+
+        Send each messageList, bundle or template as one datagram.  
+        All datagrams are encoded before the first is sent, then written 
+          to the socket one after another.  See _DatagramBatchSender.
+
+        Use for bursts, such as chords or ornament sequences.
+        Each template is copied when encoded, so one template may appear 
+          more than once in a batch only with its current arguments.
+        """
+
+        datagrams    :List[bytes]  = []
+        sentObjects  :List[Union[ osc_message.OscMessage, osc_bundle.OscBundle, "OSCMessageTemplate" ]]  = []
+
+        self._validateClientSetup()
+
+        if  len(messageListOrBundleBuilder) <= 0:
+            log.critical("messageListOrBundleBuilder IS EMPTY.")
 
         #
-        def  findMessageInBundle(  messageOrBundle  :Union[osc_message.OscMessage, osc_bundle.OscBundle], 
-                                   atTimestamp      :float = 0,
-                                 ) -> None:
-            #
-            if  isinstance(messageOrBundle, osc_message.OscMessage):
-                postOSC(messageOrBundle, atTimestamp)
+        for obj in messageListOrBundleBuilder:
+            if  isinstance(obj, List):
+                if  len(obj) <= 0:
+                    log.critical("messageListOrBundleBuilder contains EMPTY messageList.")
+                obj = self._convertMessageListToMessageBuilder(obj)
+
+            if  isinstance(obj, OSCMessageTemplate):
+                datagrams.append(bytes(obj.dgram))
+            else:
+                obj = self._build(obj)
+                datagrams.append(obj.dgram)
+
+            sentObjects.append(obj)
+
+
+        #
+        if  isinstance(self._client, (_SharedMemoryClient, _StreamClient)):
+            sentCount = self._client.sendDatagrams(datagrams)
+        else:
+            if  not self._batchSender:
+                self._batchSender = _DatagramBatchSender(self._client._sock, self._client._address, self._client._port)
+
+            sentCount = self._batchSender.send(datagrams)
+
+        if  self.enablePathLogging  and  log.isEnabledFor(logging.MOS_LOGGER_LEVEL_OSC):
+            for obj in sentObjects:
+                self.postOSCArgs(obj)
+
+        return  sentCount
+
+
+    #                                                                    -o-
+    def  postOSCArgs(  self,
+                       messageOrBundle  :Union[ OscMessageBuilder, OscBundleBuilder, "OSCMessageTemplate",
+                                                osc_message.OscMessage, osc_bundle.OscBundle ],
+                    )  -> None:
+        """
+        Post OSC args via log.osc() for any message or bundle, built or not.
+        Occurs automatically when enablePathLogging is True, using the
+          message or bundle already built for sending.
+
+        Nothing is encoded to post.  Builders are posted from their fields.
+        Nested bundles are walked iteratively, in order.
+
+        NB  Returns immediately if OSC log level is disabled.
+        """
+
+        if  not log.isEnabledFor(logging.MOS_LOGGER_LEVEL_OSC):  return
+
+        timeNow  :float  = None
+        stack    :List[Tuple[Any, float]]  = [ (messageOrBundle, 0) ]
+
+        while  stack:
+            obj, atTimestamp = stack.pop()
 
             # Unwrap bundle to find messages.
             # NB  Getter bug: OscBundle.timestamp()->int !
             #
+            if  isinstance(obj, (OscBundleBuilder, osc_bundle.OscBundle)):
+                stack.extend( (_, obj._timestamp)  for _ in reversed(obj._contents) )
+                continue
+
+            if  isinstance(obj, osc_message.OscMessage):
+                address, args = obj.address, log.deferred(z.c2s, obj._parameters)
+            elif  isinstance(obj, OSCMessageTemplate):
+                address, args = obj.address, log.deferred(z.c2s, obj.args)
             else:
-                for _ in messageOrBundle._contents:  
-                    if  isinstance(_, osc_message.OscMessage):
-                        postOSC(_, messageOrBundle._timestamp)
-                    else:
-                        findMessageInBundle(_, _._timestamp)
-                    
-        #ENDDEF -- findMessageInBundle()
+                address, args = obj._address, log.deferred(self._messageBuilderArgsToString, obj._args)
+
+            #
+            delayString  :str  = ""
 
+            if  atTimestamp > 0:  
+                if  None is timeNow:
+                    timeNow = OSCBundleScheduler.timestampNow()
 
-        #
-        mob = messageOrBundleBuilder.build()
-        findMessageInBundle(mob)
+                delayRemaining  = atTimestamp - timeNow
+                delayString     = f"  :: remaining delay {delayRemaining:.3f} @ time {atTimestamp:.3f}"
+
+            log.osc(log.deferred("%s %s%s", address, args, delayString))
 
     #ENDDEF -- postOSCArgs()
 
 
+    #                                                                    -o-
+    def  bundleSchedulerStatistics(self)  -> dict:
+        """
+        RETURNS  Dictionary of counters from OSCBundleScheduler, 
+                   or None if no bundle has been scheduled.
+        """
+
+        if  not self._bundleScheduler:
+            log.warning("Bundle scheduler is UNDEFINED.")
+            return  None
+
+        return  self._bundleScheduler.statistics()
+
+
 
 
     #----------------------------------------------- -o--
@@ -523,6 +886,97 @@ class  MOSOSC:
             log.critical("Client is UNDEFINED.")
 
 
+    #                                                                    -o-
+    def  _scheduleSend(  self,
+                         timestamp  :float,
+                         function   :FunctionType,
+                        *args       :Tuple[Any],
+                      )  -> None:
+        """
+        Run function(*args) at timestamp (OSC timetag, seconds since epoch), 
+          via OSCBundleScheduler.  Past timestamps run immediately.
+        """
+
+        bundleScheduler = self._bundleScheduler
+
+        if  not bundleScheduler:
+            with self._bundleSchedulerLock:
+                if  not self._bundleScheduler:
+                    self._bundleScheduler = OSCBundleScheduler()
+                    self._bundleScheduler.start()
+                bundleScheduler = self._bundleScheduler
+
+        bundleScheduler.schedule(OSCBundleScheduler.monotonicNsFromTimestamp(timestamp), function, *args)
+
+
+    #                                                                    -o-
+    def  _sendBundleScheduled(self, bundleBuilder:Union[OscBundleBuilder, "OSCBundleNode"])  -> None:
+        """
+        Split bundle into one bundle per distinct timetag, including the
+          timetags of nested bundles.  Messages that share a timetag stay 
+          together, in order.  Send parts that are due now, and schedule 
+          the rest with _scheduleSend().  
+
+        Each part is encoded before it is scheduled.
+        """
+
+        messagesByTimestamp  :Dict[float, List[osc_message.OscMessage]]  = {}
+        timeNow              :float                                     = OSCBundleScheduler.timestampNow()
+
+        def  collectMessages(bundleContents:List[Union[osc_message.OscMessage, osc_bundle.OscBundle]], timestamp:float)  -> None:
+            for content in bundleContents:
+                if  isinstance(content, osc_bundle.OscBundle):
+                    collectMessages(content._contents, max(timestamp, content._timestamp))
+                else:
+                    messagesByTimestamp.setdefault(timestamp, []).append(content)
+
+        collectMessages(bundleBuilder._contents, bundleBuilder._timestamp)
+
+        #
+        for timestamp in sorted(messagesByTimestamp):
+            builtBundle = OSCBundleNode(timestamp, *messagesByTimestamp[timestamp])
+
+            if  timestamp <= timeNow:
+                self._client.send(builtBundle)
+            else:
+                self._scheduleSend(timestamp, self._client.send, builtBundle)
+
+
+    #                                                                    -o-
+    # RETURNS  Built message or bundle.  Bundles are built as OSCBundleNode, 
+    #          so nested bundles are not encoded again.
+    #
+    def  _build(  self, 
+                  builder  :Union[ OscMessageBuilder, OscBundleBuilder, "OSCBundleNode", "OSCMessageTemplate" ],
+               )  -> Union[osc_message.OscMessage, osc_bundle.OscBundle]:
+        if  isinstance(builder, OscBundleBuilder):
+            return  OSCBundleNode.fromBuilder(builder)
+        return  builder.build()
+
+
+    #                                                                    -o-
+    # RETURNS  OscMessageBuilder arguments (list of (typeTag, value)) as 
+    #          posted by postOSCArgs(), with arrays restored.
+    #
+    @staticmethod
+    def  _messageBuilderArgsToString(builderArgs:List[Tuple[str, Any]])  -> str:
+        args    :List[Any]        = []
+        arrays  :List[List[Any]]  = []
+
+        for typeTag, value in builderArgs:
+            if  OscMessageBuilder.ARG_TYPE_ARRAY_START == typeTag:
+                arrays.append(args)
+                args = []
+            elif  OscMessageBuilder.ARG_TYPE_ARRAY_STOP == typeTag:
+                array  = args
+                args   = arrays.pop()
+                args.append(array)
+            else:
+                args.append(value)
+
+        return  z.c2s(args)
+
+
     #                                                                    -o-
     def  _convertMessageListToMessageBuilder(self, messageList:List[Any])  -> OscMessageBuilder:
         """
@@ -563,13 +1017,47 @@ class  MOSOSC:
         # Log the source hostname and port.  In the oscPath default
         #   handler, this is logged with oscPath.
 
+    serverMode  :ServerMode  = ServerMode.THREADING     #DEFAULT
+        # Set by createServer().  See ServerMode.
+
+    serverWorkerCount          :int   = 4               #DEFAULT
+    serverWorkerQueueDepth     :int   = 1024            #DEFAULT
+    serverWorkerBlockWhenFull  :bool  = False           #DEFAULT
+        # Used by createServer() when serverMode is ServerMode.WORKERPOOL.
+        # serverWorkerQueueDepth is the capacity of the queue for each worker.
+        # If serverWorkerBlockWhenFull is True, the receive thread waits
+        #   for room in a full worker queue, otherwise the message is dropped.
+
+    sharedMemoryRingSize  :int  = 1 << 20              #DEFAULT
+        # Bytes.  Used by createServer() when transport is Transport.SHAREDMEMORY.
+
 
 
     #----------------------------------------------- -o--
     # Server protected attributes.
 
-    _server      :osc_server.ThreadingOSCUDPServer  = None
-    _dispatcher  :dispatcher.Dispatcher             = None
+    _server      :Union[ osc_server.ThreadingOSCUDPServer, 
+                         osc_server.AsyncIOOSCUDPServer,
+                         "_WorkerPoolOSCUDPServer",
+                         "_SharedMemoryOSCServer",
+                         "_StreamOSCServer" ]               = None
+    _dispatcher  :"_RoutingDispatcher"                      = None
+
+    _UDP_MAX_PACKET_SIZE  :int  = 65535
+        # Receive buffer of UDP servers, in bytes.  Largest UDP datagram.
+        # NB  socketserver.UDPServer reads at most 8192 bytes, truncating
+        #     larger datagrams, which then fail to parse as OSC.
+
+    _asyncioLoop       :asyncio.AbstractEventLoop  = None
+    _asyncioStopEvent  :asyncio.Event              = None
+    _asyncioTasks      :set                        = None
+        # Used when serverMode is ServerMode.ASYNCIO.
+
+    _coroutineLoop        :asyncio.AbstractEventLoop  = None
+    _coroutineLoopThread  :threading.Thread           = None
+        # Runs coroutine handlers when serverMode is not ServerMode.ASYNCIO.
+        #   Created with the first coroutine handler.  
+        #   See _wrapCoroutineHandler().
 
 
     #
@@ -596,44 +1084,117 @@ class  MOSOSC:
     #
     # One server and one dispatcher per class instance.
     # Dispatcher can be updated, even after server is running.
+    #   OSC path handlers may be added or removed while the server is
+    #   serving.  Each change publishes a new OSCRoutingTable, so 
+    #   datagrams in flight are routed by the table in effect when they
+    #   arrived, and the receive path never waits on a lock.
     # 
-    # Server instance runs as ThreadingOSCUDPServer.  
+    # Server instance runs as ThreadingOSCUDPServer (DEFAULT), 
+    #   AsyncIOOSCUDPServer or _WorkerPoolOSCUDPServer, per ServerMode.
+    #   Transports other than UDP use _SharedMemoryOSCServer or _StreamOSCServer.
     # pythonosc also offers:
-    #   . AsyncIOOSCUDPServer
     #   . BlockingOSCUDPServer
     #   . ForkingOSCUDPServer
     #
 
     #                                                                    -o-
     def  createServer(  self, 
-                        hostname  :str   = None, 
-                        port      :int   = None,
+                        hostname    :str         = None, 
+                        port        :int         = None,
+                        serverMode  :ServerMode  = None,
+                        transport   :Transport   = None,
                      )  -> None:
         """
         Create server without starting it.  
         Server is always created with a dispatcher.  
         Dispatcher is created by DEFAULT and set to default oscPath
           handler, which user may choose to disable.
+
+        serverMode -- ServerMode.THREADING (DEFAULT), ServerMode.ASYNCIO
+                      or ServerMode.WORKERPOOL.  
+                      See class header for tradeoffs.
+
+        transport  -- Transport.UDP (DEFAULT), Transport.SHAREDMEMORY,
+                      Transport.TCP or Transport.UNIX.
+                      With SHAREDMEMORY, packets are handled in the thread
+                      running startServer(), unless serverMode is WORKERPOOL.
+                      With TCP or UNIX, packets are handled in the thread
+                      reading their connection, unless serverMode is WORKERPOOL.
         """
 
         if  self._server:
             log.critical("Server is ALREADY CREATED.", exitValue=1)
 
+        if  not serverMode:  serverMode = ServerMode.THREADING
+        if  not transport:   transport  = Transport.UDP
+
+        if  not isinstance(serverMode, ServerMode):
+            log.critical(f"serverMode IS INVALID.  ({serverMode})")
+
+        if  not isinstance(transport, Transport):
+            log.critical(f"transport IS INVALID.  ({transport})")
+
+        if  (Transport.UDP != transport)  and  (ServerMode.ASYNCIO == serverMode):
+            log.critical(f"ServerMode.ASYNCIO IS NOT SUPPORTED by Transport.{transport.name}.")
+
+        if  (Transport.SHAREDMEMORY == transport)  and  (not OSCSharedMemoryRing.isMachineSupported()):
+            log.critical(f"Transport.SHAREDMEMORY IS NOT SUPPORTED on this machine.  ({platform.machine()})")
+
         self._validateHostnameAndPort(hostname, port)
+        self.serverMode  = serverMode
+        self.transport   = transport
 
 
         #
-        self._dispatcher = dispatcher.Dispatcher()
+        self._dispatcher = _RoutingDispatcher()
 
         if  self.enablePathHandlerDefault:
             self._dispatcher.set_default_handler(
-                      self._pathHandlerDefault, 
-                      needs_reply_address=self._pathHandlersReceiveSourceAddr )
+                      _EventHandler(  self._pathHandlerDefault, (), 
+                                      self._pathHandlersReceiveSourceAddr, self, 
+                                      postOSCPath=False ) )
 
+        # NB  AsyncIOOSCUDPServer binds its socket when the server is started.
         #
         try:
-            self._server = osc_server.ThreadingOSCUDPServer( 
+            if  Transport.UDP != self.transport:
+                workerPool = None
+
+                if  ServerMode.WORKERPOOL == self.serverMode:
+                    workerPool = OSCServerWorkerPool(  self._dispatcher, 
+                                                       self.serverWorkerCount, 
+                                                       self.serverWorkerQueueDepth, 
+                                                       self.serverWorkerBlockWhenFull )
+
+                if  Transport.SHAREDMEMORY == self.transport:
+                    self._server = _SharedMemoryOSCServer(  self.hostname, self.port, self._dispatcher, 
+                                                            self.sharedMemoryRingSize, workerPool )
+                else:
+                    self._server = _StreamOSCServer(  self.transport, self.hostname, self.port, 
+                                                      self._dispatcher, workerPool )
+                if  workerPool:
+                    workerPool.start()
+
+            elif  ServerMode.ASYNCIO == self.serverMode:
+                self._asyncioLoop   = asyncio.new_event_loop()
+                self._asyncioTasks  = set()
+                self._server = osc_server.AsyncIOOSCUDPServer( 
+                                        (self.hostname, self.port), self._dispatcher, self._asyncioLoop )
+
+            elif  ServerMode.WORKERPOOL == self.serverMode:
+                workerPool = OSCServerWorkerPool(  self._dispatcher, 
+                                                   self.serverWorkerCount, 
+                                                   self.serverWorkerQueueDepth, 
+                                                   self.serverWorkerBlockWhenFull )
+                self._server = _WorkerPoolOSCUDPServer( 
+                                        (self.hostname, self.port), self._dispatcher, workerPool )
+                self._server.max_packet_size = self._UDP_MAX_PACKET_SIZE
+                workerPool.start()
+
+            else:
+                self._server = osc_server.ThreadingOSCUDPServer( 
                                         (self.hostname, self.port), self._dispatcher )
+                self._server.max_packet_size = self._UDP_MAX_PACKET_SIZE
         except  Exception as e:
             if  48 == e.errno:
                 log.critical(  "Server ALREADY RUNNING on " +
@@ -656,11 +1217,19 @@ class  MOSOSC:
 
         self._willDestroyServer = True
         self.stopServer()
+
+        if  ServerMode.WORKERPOOL == self.serverMode:
+            self._server.workerPool.stop()
+
+        if  (ServerMode.WORKERPOOL == self.serverMode)  or  (Transport.UDP != self.transport):
+            self._server.server_close()
             
         self._dispatcher.set_default_handler(None)
         self._dispatcher = None
 
         self._server = None
+        self._stopCoroutineLoop()
+        self._closeAsyncioLoop()
         self._willDestroyServer = False
 
 
@@ -679,8 +1248,20 @@ class  MOSOSC:
 
         #
         log.info("Server STARTING at %s:%s..." % (self.hostname, self.port))
+
+        # NB  Stop event exists before the server is marked running, so 
+        #     stopServer() can stop this run before its event loop starts.
+        #
+        if  ServerMode.ASYNCIO == self.serverMode:
+            self._asyncioStopEvent = asyncio.Event()
+
         self._isServerRunning = True
-        self._server.serve_forever()
+
+        if  ServerMode.ASYNCIO == self.serverMode:
+            self._startServerAsyncIO(self._asyncioStopEvent)
+        else:
+            self._server.serve_forever()
+
         self._isServerRunning = False
 
 
@@ -689,7 +1270,12 @@ class  MOSOSC:
         self._validateServerSetup()
 
         if  self._isServerRunning:
-            self._server.shutdown()
+            if  ServerMode.ASYNCIO == self.serverMode:
+                stopEvent = self._asyncioStopEvent
+                self._asyncioLoop.call_soon_threadsafe(stopEvent.set)
+            else:
+                self._server.shutdown()
+
             self._isServerRunning = False
             log.info("...Server at %s:%s is STOPPED." % (self.hostname, self.port))
         else:
@@ -715,21 +1301,28 @@ class  MOSOSC:
           userArgs -- Arbitrary parameters or (function) pointers defined by
                       addPathHandler() invocation.
 
+        oscPathHandler may also be a coroutine function (async def).
+          With ServerMode.ASYNCIO, it is scheduled as a task on the server
+          event loop.  Otherwise, it runs on one event loop shared by the
+          coroutine handlers of this server, in its own thread, while the
+          thread handling the message waits for it to complete.
+
         NB--
           * Incoming OSC path will match all valid handlers.
           * Use globbing in OSC path names to match multiple incoming OSC paths.  
           * Optionally use default handler function to capture unmatched OSC paths.
               Redirect stderr to squelch DEBUG messages from default handler.
+          * Handlers are resolved through OSCRoutingTable.
+          * Handlers may be added or removed while the server is running.
         """
 
         self._validateServerSetup()
         self._validateOSCPath(oscPath)
 
-        if  self._isServerRunning:
-            log.error(f"CANNOT add or remove OSC path handlers while SERVER IS RUNNING.  ({oscPath})")
-            return
-
         #
+        if  asyncio.iscoroutinefunction(oscPathHandler):
+            oscPathHandler = self._wrapCoroutineHandler(oscPathHandler)
+
         self._dispatcher.map(  oscPath, 
                                oscPathHandler, 
                                userArgs, 
@@ -739,17 +1332,49 @@ class  MOSOSC:
 
 
     #                                                                    -o-
-    def  removePathHandler(self, oscPath:str)  -> None:
+    def  addEventHandler(  self, 
+                           oscPath          :str, 
+                           oscEventHandler  :FunctionType, 
+                           *userArgs        :List[Any]
+                        )  -> None:
+        """
+        Fast path alternative to addPathHandler().  oscEventHandler 
+          receives one OSCEvent, parsed by the dispatcher directly from 
+          the incoming message:
+
+              def  eventHandler(event:OSCEvent): 
+                  ...event.oscPath, event.oscArgs, event.userArgs...
+
+        OSC path is logged per enablePathLogging, as by parseEventArgs().
+
+        oscEventHandler may also be a coroutine function (async def).
+          See addPathHandler().
+        """
+
         self._validateServerSetup()
         self._validateOSCPath(oscPath)
 
-        if  self._isServerRunning:
-            log.error(f"CANNOT add or remove OSC path handlers while SERVER IS RUNNING.  ({oscPath})")
-            return
+        #
+        if  asyncio.iscoroutinefunction(oscEventHandler):
+            oscEventHandler = self._wrapCoroutineHandler(oscEventHandler)
+
+        self._dispatcher.mapHandler(  oscPath, 
+                                      _EventHandler(  oscEventHandler, 
+                                                      userArgs, 
+                                                      self._pathHandlersReceiveSourceAddr, 
+                                                      self ) )
+
+        log.info(f"Added OSC event handler \"{oscPath}\".")
+
+
+    #                                                                    -o-
+    def  removePathHandler(self, oscPath:str)  -> None:
+        self._validateServerSetup()
+        self._validateOSCPath(oscPath)
 
         #
         try:
-            self._dispatcher._map.pop(oscPath)
+            self._dispatcher.removeAddress(oscPath)
             log.info(f"Removed OSC path handler \"{oscPath}\".")
         except  KeyError:
             log.error(f"oscPath DOES NOT EXIST.  ({oscPath})")
@@ -761,11 +1386,28 @@ class  MOSOSC:
     def  listPathHandlers(self)  -> None:
         self._validateServerSetup()
 
-        registeredOSCPaths  :List[str]  = list(self._dispatcher._map.keys())
+        registeredOSCPaths  :List[str]  = self._dispatcher.addresses()
 
         log.info(dump.listo(registeredOSCPaths, title="OSC Path Handlers", sort=True))
 
 
+    #                                                                    -o-
+    def  serverWorkerPoolStatistics(self)  -> dict:
+        """
+        RETURNS  Dictionary of OSCServerWorkerPool counters, or empty 
+                   dictionary if serverMode is not ServerMode.WORKERPOOL.
+
+        See OSCServerWorkerPool.statistics().
+        """
+
+        self._validateServerSetup()
+
+        if  ServerMode.WORKERPOOL != self.serverMode:
+            return  {}
+
+        return  self._server.workerPool.statistics()
+
+
 
     #                                                                    -o-
     def  parseEventArgs(  self,
@@ -788,50 +1430,41 @@ class  MOSOSC:
 
         NB  Whether MOSOSC returns source hostname/port to every handler
               is determined by MOSOSC._pathHandlersReceiveSourceAddr (DEFAULT:True).
-        """
-
-        sourceHostname  :str        = None
-        sourcePort      :int        = None
-        oscPath         :str        = None
-        userArgs        :List[Any]  = []
-        oscArgs         :List[Any]  = []
-
-        eventList         :List[Any]  = list(eventArgs)
-        sourceAddrString  :str        = ""
-
-
-        # ASSUME eventArgs tuple is of the form...
-        #
-        #    ( [sourceAddrTuple], oscPath, [userArgsTuple], oscArgsTuple )
-        #
-        # ...where:
-        #   * sourceAddrTuple exists if _pathHandlersReceiveSourceAddr is True;
-        #   * userAgrs exists if called from a custom oscPath handler.
-        #
-        if  isinstance(eventList[0], tuple):
-            sourceHostname, sourcePort = eventList.pop(0)
-            if  self.enableSourceAddrLogging:
-                sourceAddrString = f"  :: {sourceHostname}:{sourcePort}"
-
-        oscPath = eventList.pop(0) + " "
-
-        if  expectUserArgs:
-            userArgs = list(eventList.pop(0)[0])
 
-        oscArgs = eventList
+        NB  Adapter for handlers added by addPathHandler().  Handlers added
+              by addEventHandler() receive OSCEvent directly.
+        """
 
+        sourceHostname, sourcePort, oscPath, oscArgs, userArgs =  \
+                OSCEvent._splitEventArgs(eventArgs, expectUserArgs)
 
-        #
-        if  self.enablePathLogging and postOSCPath:  # Global and local toggles.
-            log.osc(f"{oscPath}{z.c2s(oscArgs)}{sourceAddrString}")
+        if       self.enablePathLogging and postOSCPath                 \
+            and  log.isEnabledFor(logging.MOS_LOGGER_LEVEL_OSC):        # Global and local toggles.
+            self._postOSCPath(sourceHostname, sourcePort, oscPath, oscArgs)
 
-        return  (sourceHostname, sourcePort, oscPath.strip(), oscArgs, userArgs)
+        return  (sourceHostname, sourcePort, oscPath, list(oscArgs), list(userArgs))
 
 
 
     #----------------------------------------------- -o--
     # Server protected methods.
 
+    #                                                                    -o-
+    # NB  Log string is created only if OSC log level is enabled and emitted.
+    #
+    def  _postOSCPath(  self, 
+                        sourceHostname  :str,
+                        sourcePort      :int,
+                        oscPath         :str,
+                        oscArgs         :Union[List[Any], Tuple[Any]],
+                     )  -> None:
+        if  self.enableSourceAddrLogging  and  (None is not sourceHostname):
+            log.osc(log.deferred( "%s %s  :: %s:%s", 
+                                  oscPath, log.deferred(z.c2s, oscArgs), sourceHostname, sourcePort ))
+        else:
+            log.osc(log.deferred("%s %s", oscPath, log.deferred(z.c2s, oscArgs)))
+
+
     #                                                                    -o-
     # ASSUME  If Server is defined, then so also is all Server support, 
     #         including Dispatcher and default oscPath handler.
@@ -842,45 +1475,3222 @@ class  MOSOSC:
 
 
     #                                                                    -o-
-    # NB  First argument represents working instance of this class, 
-    #       passed in by calling environment.
+    # Run event loop until stopEvent is set by stopServer().  
+    # Close event loop if server is destroyed while running.
+    #   Otherwise, destroyServer() closes it.
     #
-    def  _pathHandlerDefault(  mososc,
-                               *eventArgs  :Tuple[Any]
-                            )  -> None:
-        """
-        If pathHandlerDefaultFunction is defined as a function, it will be
-          called if enablePathHandlerDefault is True.
+    def  _startServerAsyncIO(self, stopEvent:asyncio.Event)  -> None:
+        loop  = self._asyncioLoop
 
-        pathHandlerDefaultFunction() REQUIRES the following signature:
+        async def  serve()  -> None:
+            try:
+                transport, _ = await self._server.create_serve_endpoint()
+            except  Exception as e:
+                log.critical(e, exitValue=1)
 
-            pathHandlerDefaultFunction(  mososc, 
-                                         sourceHostname  :str,
-                                         sourcePort      :int,
-                                         oscPath         :str,
-                                         oscArgs         :List[Any],
-                                       ) -> None
+            try:
+                await stopEvent.wait()
+            finally:
+                transport.close()
 
-            mososc -- Same instance of MOSOSC as contains all other methods.
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(serve())
 
-            sourceHostname / sourcePort -- Network origin of the oscPath sent
-              to the server.  Available when _pathHandlersReceiveSourceAddr
-              is True.
+        if  not self._server:
+            self._closeAsyncioLoop()
 
-            oscPath / oscArgs -- OSC pathname and associated arguments.
-              oscArgs is List of zero (0) or more elements.
 
-        See also public attributes: enablePathHandlerDefault, pathHandlerDefaultFunction.
+    #                                                                    -o-
+    # NB  Called by destroyServer() and by the thread running the server 
+    #       loop, in either order.  Closes the loop once it is not running.
+    #
+    def  _closeAsyncioLoop(self)  -> None:
+        with self._eventLoopLock:
+            loop = self._asyncioLoop
+
+            if  (None is loop)  or  loop.is_running():
+                return
+
+            loop.close()
+            self._asyncioLoop   = None
+            self._asyncioTasks  = None
+
+
+    #                                                                    -o-
+    def  _wrapCoroutineHandler(self, coroutineHandler:FunctionType)  -> FunctionType:
+        """
+        Dispatcher calls handlers synchronously.  
+        Return a function that runs coroutineHandler per ServerMode.
         """
 
-        if  not mososc.enablePathHandlerDefault:  return
+        if  ServerMode.ASYNCIO != self.serverMode:
+            self._startCoroutineLoop()
 
-        sourceHostname, sourcePort, oscPath, oscArgs, _ =  \
-                mososc.parseEventArgs(eventArgs, expectUserArgs=False)
+        def  runCoroutineHandler(*eventArgs)  -> None:
+            if  ServerMode.ASYNCIO == self.serverMode:
+                task = self._asyncioLoop.create_task(coroutineHandler(*eventArgs))
+                self._asyncioTasks.add(task)                        # NB  Hold reference until done.
+                task.add_done_callback(self._asyncioTasks.discard)
+            else:
+                with self._eventLoopLock:
+                    if  not self._coroutineLoop:
+                        log.warning(f"Server is DESTROYED.  Coroutine handler NOT RUN.  ({coroutineHandler.__name__})")
+                        return
+                    future = asyncio.run_coroutine_threadsafe(coroutineHandler(*eventArgs), self._coroutineLoop)
 
-        if  mososc.pathHandlerDefaultFunction:
-            mososc.pathHandlerDefaultFunction(mososc, sourceHostname, sourcePort, oscPath, oscArgs)
+                future.result()
 
+        runCoroutineHandler.__name__ = coroutineHandler.__name__
 
-#ENDCLASS -- MOSOSC()
+        return  runCoroutineHandler
+
+
+    #                                                                    -o-
+    def  _startCoroutineLoop(self)  -> None:
+        with self._eventLoopLock:
+            if  self._coroutineLoop:  
+                return
+
+            self._coroutineLoop        = asyncio.new_event_loop()
+            self._coroutineLoopThread  = threading.Thread(  target  = self._coroutineLoop.run_forever,
+                                                            name    = "MOSOSCCoroutineLoop", 
+                                                            daemon  = True )
+            self._coroutineLoopThread.start()
+
+
+    #                                                                    -o-
+    # NB  Coroutine handlers still running are cancelled, so threads 
+    #       waiting for them are released, then the loop stops.
+    #     Handlers are submitted under _eventLoopLock, so none is 
+    #       submitted after cancelAndStop().
+    #
+    def  _stopCoroutineLoop(self, timeoutInSeconds:float=5.0)  -> None:
+        async def  cancelAndStop()  -> None:
+            tasks = [ _  for _ in asyncio.all_tasks()  if _ is not asyncio.current_task() ]
+            for task in tasks:  task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            asyncio.get_running_loop().stop()
+
+        with self._eventLoopLock:
+            loop    = self._coroutineLoop
+            thread  = self._coroutineLoopThread
+
+            if  None is loop:  
+                return
+
+            self._coroutineLoop        = None
+            self._coroutineLoopThread  = None
+
+            asyncio.run_coroutine_threadsafe(cancelAndStop(), loop)
+
+        if  threading.current_thread() is not thread:
+            thread.join(timeout=timeoutInSeconds)
+            if  not loop.is_running():
+                loop.close()
+
+
+    #                                                                    -o-
+    # NB  First argument represents working instance of this class, 
+    #       passed in by calling environment.
+    #
+    def  _pathHandlerDefault(  mososc,
+                               event  :"OSCEvent",
+                            )  -> None:
+        """
+        If pathHandlerDefaultFunction is defined as a function, it will be
+          called if enablePathHandlerDefault is True.
+
+        pathHandlerDefaultFunction() REQUIRES the following signature:
+
+            pathHandlerDefaultFunction(  mososc, 
+                                         sourceHostname  :str,
+                                         sourcePort      :int,
+                                         oscPath         :str,
+                                         oscArgs         :List[Any],
+                                       ) -> None
+
+            mososc -- Same instance of MOSOSC as contains all other methods.
+
+            sourceHostname / sourcePort -- Network origin of the oscPath sent
+              to the server.  Available when _pathHandlersReceiveSourceAddr
+              is True.
+
+            oscPath / oscArgs -- OSC pathname and associated arguments.
+              oscArgs is List of zero (0) or more elements.
+
+        See also public attributes: enablePathHandlerDefault, pathHandlerDefaultFunction.
+        """
+
+        if  not mososc.enablePathHandlerDefault:  return
+
+        if  mososc.enablePathLogging  and  log.isEnabledFor(logging.MOS_LOGGER_LEVEL_OSC):
+            mososc._postOSCPath(event.sourceHostname, event.sourcePort, event.oscPath, event.oscArgs)
+
+        if  mososc.pathHandlerDefaultFunction:
+            mososc.pathHandlerDefaultFunction(  mososc, event.sourceHostname, event.sourcePort, 
+                                                event.oscPath, list(event.oscArgs) )
+
+
+#ENDCLASS -- MOSOSC()
+
+
+
+
+#----------------------------------------------- -o--
+# Public classes.
+
+#                                                                    -o-
+class  OSCMessageTemplate:
+    """
+    OSC message whose address and type tags are encoded once.  
+    Arguments are fixed-width and overwritten in place by fill().
+
+    Supported type tags--
+        i  int32
+        h  int64
+        f  float32
+        d  float64
+
+    Types inferred from example arguments follow OscMessageBuilder:
+      int is "i", or "h" if it needs more than 32 bits; float is "f".
+
+    Presents the datagram as .dgram, so a template may be passed directly 
+      to pythonosc UDPClient.send().  build() returns an OscMessage copy, 
+      so a template may also be used where OscMessageBuilder is expected.
+
+    PUBLIC METHODS--
+        * fill()
+        * build()
+    """
+
+    _STRUCT_FORMATS  :Dict[str, str]  = { "i": "i", "h": "q", "f": "f", "d": "d", }
+
+
+    #                                                                    -o-
+    def  __init__(  self, 
+                    oscPath       :str,
+                   *exampleArgs   :Tuple[Any],
+                    typeTags      :str          = None,
+                 ):
+        if  None is typeTags:
+            typeTags = "".join(self._inferTypeTag(arg)  for arg in exampleArgs)
+
+        for typeTag in typeTags:
+            if  typeTag not in self._STRUCT_FORMATS:
+                log.critical(f"Type tag IS NOT fixed-width.  ({typeTag} in \"{typeTags}\")")
+
+        if  exampleArgs  and  (len(exampleArgs) != len(typeTags)):
+            log.critical(f"exampleArgs DO NOT MATCH typeTags.  ({z.c2s(exampleArgs)} :: {typeTags})")
+
+        self.address   :str  = oscPath
+        self.typeTags  :str  = typeTags
+
+        header  = osc_types.write_string(oscPath) + osc_types.write_string("," + typeTags)
+
+        self._argsOffset  :int            = len(header)
+        self._struct      :struct.Struct  = struct.Struct(">" + "".join(self._STRUCT_FORMATS[t]  for t in typeTags))
+        self._buffer      :bytearray      = bytearray(header) + bytearray(self._struct.size)
+
+
+    #                                                                    -o-
+    @property
+    def  dgram(self)  -> bytearray:
+        return  self._buffer
+
+    @property
+    def  size(self)  -> int:
+        return  len(self._buffer)
+
+    @property
+    def  args(self)  -> Tuple[Any]:
+        return  self._struct.unpack_from(self._buffer, self._argsOffset)
+
+
+    #                                                                    -o-
+    def  fill(self, *messageArgs:Tuple[Any])  -> "OSCMessageTemplate":
+        """
+        Overwrite all arguments, in order, in place.
+        """
+
+        try:
+            self._struct.pack_into(self._buffer, self._argsOffset, *messageArgs)
+        except  struct.error as e:
+            log.critical(f"messageArgs DO NOT FIT template \"{self.address}\" ({self.typeTags}).  ({e})")
+
+        return  self
+
+
+    #                                                                    -o-
+    def  build(self)  -> osc_message.OscMessage:
+        return  osc_message.OscMessage(bytes(self._buffer))
+
+
+    #                                                                    -o-
+    @staticmethod
+    def  _inferTypeTag(arg:Any)  -> str:
+        if  isinstance(arg, bool)  or  not isinstance(arg, (int, float)):
+            log.critical(f"Template argument IS NOT int or float.  ({arg!r})")
+
+        if  isinstance(arg, float):
+            return  "f"
+
+        return  "h"  if (arg.bit_length() > 32)  else "i"
+
+#ENDCLASS -- OSCMessageTemplate()
+
+
+
+
+#                                                                    -o-
+class  OSCEvent:
+    """
+    One OSC message received by the server, as given to handlers added 
+    by MOSOSC.addEventHandler().
+
+        sourceHostname, sourcePort 
+                  -- Origin of the message, or None if handlers do not 
+                       receive source address.
+        oscPath   -- OSC path of the message.
+        oscArgs   -- Arguments of the message.  Read only; shared by all
+                       handlers of the message.
+        userArgs  -- Tuple of arguments given to addEventHandler().
+
+    PUBLIC METHODS--
+        * fromEventArgs()
+        * asTuple()
+    """
+
+    __slots__ = ("sourceHostname", "sourcePort", "oscPath", "oscArgs", "userArgs")
+
+
+    #                                                                    -o-
+    def  __init__(  self, 
+                    sourceHostname  :str,
+                    sourcePort      :int,
+                    oscPath         :str,
+                    oscArgs         :Union[List[Any], Tuple[Any]],
+                    userArgs        :Tuple[Any],
+                 ):
+        self.sourceHostname  = sourceHostname
+        self.sourcePort      = sourcePort
+        self.oscPath         = oscPath
+        self.oscArgs         = oscArgs
+        self.userArgs        = userArgs
+
+
+    #                                                                    -o-
+    @classmethod
+    def  fromEventArgs(cls, eventArgs:Tuple[Any], expectUserArgs:bool=True)  -> "OSCEvent":
+        """
+        Parse eventArgs given to handlers added by addPathHandler(), 
+          of the form...
+
+            ( [sourceAddrTuple], oscPath, [userArgsTuple], oscArgs... )
+
+        ...where:
+          * sourceAddrTuple exists if _pathHandlersReceiveSourceAddr is True;
+          * userArgsTuple exists if called from a custom oscPath handler.
+        """
+        return  cls(*cls._splitEventArgs(eventArgs, expectUserArgs))
+
+
+    #                                                                    -o-
+    def  asTuple(self)  -> Tuple[str, int, str, List[Any], List[Any]]:
+        """
+        RETURNS  (sourceHostname, sourcePort, oscPath, oscArgs, userArgs),
+                   as returned by MOSOSC.parseEventArgs().
+        """
+        return  (self.sourceHostname, self.sourcePort, self.oscPath, list(self.oscArgs), list(self.userArgs))
+
+
+    #                                                                    -o-
+    @staticmethod
+    def  _splitEventArgs(eventArgs:Tuple[Any], expectUserArgs:bool)  -> Tuple[str, int, str, Tuple[Any], Tuple[Any]]:
+        if  isinstance(eventArgs[0], tuple):
+            sourceHostname, sourcePort = eventArgs[0]
+
+            if  expectUserArgs:
+                return  (sourceHostname, sourcePort, eventArgs[1], eventArgs[3:], eventArgs[2][0])
+            return  (sourceHostname, sourcePort, eventArgs[1], eventArgs[2:], ())
+
+        if  expectUserArgs:
+            return  (None, None, eventArgs[0], eventArgs[2:], eventArgs[1][0])
+        return  (None, None, eventArgs[0], eventArgs[1:], ())
+
+
+    #                                                                    -o-
+    def  __repr__(self)  -> str:
+        return  f"OSCEvent({self.oscPath} {z.c2s(self.oscArgs)}  :: {self.sourceHostname}:{self.sourcePort}  userArgs={self.userArgs!r})"
+
+#ENDCLASS -- OSCEvent()
+
+
+
+
+#                                                                    -o-
+class  OSCBundleNode(osc_bundle.OscBundle):
+    """
+    Immutable OSC bundle, encoded once when created.
+
+    Contents are built messages and bundles (OscMessage, OscBundle or 
+      OSCBundleNode).  Their datagrams are concatenated as they are, so 
+      composing nodes into larger nodes costs one byte concatenation per 
+      level, and sending a node again costs nothing to encode.
+
+    Is an OscBundle, so it may be sent, posted, scheduled or nested 
+      wherever a built bundle is expected.  build() returns the node 
+      itself, so it may also be used wherever a builder is expected.
+
+    NB  pythonosc OscBundleBuilder.build() accepts only contents of exact
+          type OscMessage or OscBundle.  Build bundle builders holding 
+          nodes with fromBuilder(), as MOSOSC does.
+
+    PUBLIC METHODS--
+        * fromBuilder()
+        * build()
+    """
+
+    _BUNDLE_PREFIX  :bytes  = b"#bundle\x00"
+
+
+    #                                                                    -o-
+    def  __init__(  self, 
+                    timestamp  :float,
+                   *contents   :Tuple[Union[osc_message.OscMessage, osc_bundle.OscBundle]],
+                 ):
+        """
+        timestamp -- OSC timetag (seconds since the epoch), or 0 (IMMEDIATELY).
+        """
+
+        parts  :List[bytes]  = [ self._BUNDLE_PREFIX, osc_types.write_date(timestamp) ]
+
+        for content in contents:
+            if  not isinstance(content, (osc_message.OscMessage, osc_bundle.OscBundle)):
+                log.critical(f"Bundle content IS NOT OscMessage or OscBundle.  ({type(content).__name__})")
+
+            parts.append(osc_types.write_int(content.size))
+            parts.append(content.dgram)
+
+        # NB  Attributes of OscBundle.  OscBundle.__init__() is not called,
+        #     since it would parse the datagram.
+        #
+        self._dgram      :bytes  = b"".join(parts)
+        self._timestamp  :float  = timestamp
+        self._contents   :Tuple[Union[osc_message.OscMessage, osc_bundle.OscBundle]]  = contents
+
+
+    #                                                                    -o-
+    @classmethod
+    def  fromBuilder(cls, bundleBuilder:OscBundleBuilder)  -> "OSCBundleNode":
+        return  cls(bundleBuilder._timestamp, *bundleBuilder._contents)
+
+
+    #                                                                    -o-
+    def  build(self)  -> "OSCBundleNode":
+        return  self
+
+#ENDCLASS -- OSCBundleNode()
+
+
+
+
+#                                                                    -o-
+class  OSCRoutingTable:
+    """
+    Immutable, precompiled map from incoming OSC address to Dispatcher
+    handlers.  Created from the address map of a Dispatcher each time the
+    map changes.  See _RoutingDispatcher.
+
+    Resolves handlers exactly as pythonosc 1.8.0 Dispatcher.handlers_for_address():
+      * Registered path equal to incoming address matches.
+      * Registered path containing "*" is a regular expression, with "*"
+          replaced by "[^/]*?/*", matched against the start of the 
+          incoming address.
+      * Incoming address containing "?" or "*" is a pattern, matched 
+          against every registered path.
+      * Handlers of all matches are returned in the order their paths
+          were first registered.
+      * Default handler is returned only when no path matches.
+
+    Incoming addresses without "?" or "*" are resolved by...
+      * dictionary lookup of the address among registered paths, then
+      * walking a trie of the literal prefixes of globbed registered paths,
+          testing only the globs whose literal prefix begins the address.
+    Every resolved address is memoized, so repeated addresses cost one
+      dictionary lookup.
+
+    PUBLIC METHODS--
+        * handlersFor()
+    """
+
+    _GLOB_ENTRIES       :str        = ""
+        # Trie node key for globs ending at node.  Never an address character.
+
+    _REGEX_SPECIAL      :frozenset  = frozenset(".^$*+?{}[]\\|()")
+
+    memoSizeMaximum     :int        = 4096          #DEFAULT
+        # Memo is cleared when it holds this many addresses.
+
+
+    #                                                                    -o-
+    def  __init__(  self, 
+                    pathMap         :Dict[str, List[dispatcher.Handler]], 
+                    defaultHandler  :dispatcher.Handler  = None,
+                 ):
+        self.defaultHandlers  :Tuple[dispatcher.Handler]  = (defaultHandler,)  if defaultHandler else ()
+
+        self._exact     :Dict[str, Tuple[int, Tuple[dispatcher.Handler]]]  = {}
+        self._trie      :dict  = {}
+        self._ordered   :List[Tuple[str, Any, Tuple[dispatcher.Handler]]]  = []
+        self._memo      :Dict[str, Tuple[dispatcher.Handler]]  = {}
+
+        for order, (oscPath, handlers) in enumerate(pathMap.items()):
+            handlers    = tuple(handlers)
+            globRegex   = None
+
+            if  "*" in oscPath:
+                globRegex = re.compile(oscPath.replace("*", "[^/]*?/*"))
+                self._addGlobToTrie(oscPath, (order, globRegex, handlers))
+
+            self._exact[oscPath] = (order, handlers)
+            self._ordered.append((oscPath, globRegex, handlers))
+
+
+    #                                                                    -o-
+    def  handlersFor(self, address:str)  -> Tuple[dispatcher.Handler]:
+        """
+        RETURNS  Tuple of handlers matching address, or defaultHandlers
+                   if no registered path matches.
+        """
+
+        handlers = self._memo.get(address)
+
+        if  None is handlers:
+            if  ("?" in address)  or  ("*" in address):
+                handlers = self._matchPattern(address)
+            else:
+                handlers = self._matchLiteral(address)
+
+            if  len(self._memo) >= self.memoSizeMaximum:
+                self._memo.clear()
+
+            self._memo[address] = handlers
+
+        return  handlers
+
+
+    #                                                                    -o-
+    def  _addGlobToTrie(self, oscPath:str, entry:Tuple[int, Any, Tuple[dispatcher.Handler]])  -> None:
+        node = self._trie
+
+        for character in oscPath:
+            if  character in self._REGEX_SPECIAL:  break
+            node = node.setdefault(character, {})
+
+        node.setdefault(self._GLOB_ENTRIES, []).append(entry)
+
+
+    #                                                                    -o-
+    def  _matchLiteral(self, address:str)  -> Tuple[dispatcher.Handler]:
+        matches  :Dict[int, Tuple[dispatcher.Handler]]  = {}
+
+        exact = self._exact.get(address)
+        if  exact:
+            matches[exact[0]] = exact[1]
+
+        node   = self._trie
+        depth  = 0
+
+        while  node:
+            for order, globRegex, handlers in node.get(self._GLOB_ENTRIES, ()):
+                if  (order not in matches)  and  globRegex.match(address):
+                    matches[order] = handlers
+
+            if  depth >= len(address):  break
+
+            node    = node.get(address[depth])
+            depth  += 1
+
+        return  self._orderMatches(matches)
+
+
+    #                                                                    -o-
+    def  _matchPattern(self, address:str)  -> Tuple[dispatcher.Handler]:
+        pattern  = re.escape(address).replace("\\?", "\\w?").replace("\\*", "[\\w|\\+]*") + "$"
+        patternCompiled  = re.compile(pattern)
+
+        matches  :Dict[int, Tuple[dispatcher.Handler]]  = {}
+
+        for order, (oscPath, globRegex, handlers) in enumerate(self._ordered):
+            if      patternCompiled.match(oscPath)  \
+                or  (globRegex and globRegex.match(address)):
+                matches[order] = handlers
+
+        return  self._orderMatches(matches)
+
+
+    #                                                                    -o-
+    # NB  A registered path with no handlers (after Dispatcher.unmap())
+    #       still counts as a match and suppresses the default handler.
+    #
+    def  _orderMatches(self, matches:Dict[int, Tuple[dispatcher.Handler]])  -> Tuple[dispatcher.Handler]:
+        if  not matches:
+            return  self.defaultHandlers
+
+        if  len(matches) == 1:
+            return  next(iter(matches.values()))
+
+        return  tuple(handler  for order in sorted(matches)  for handler in matches[order])
+
+#ENDCLASS -- OSCRoutingTable()
+
+
+
+
+#                                                                    -o-
+class  OSCServerWorkerPool:
+    """
+    Fixed number of worker threads that run OSC path handlers on behalf
+    of one or more receive threads.  See ServerMode.WORKERPOOL.
+    (_StreamOSCServer submits from the thread reading each connection.)
+
+    Each message in a datagram (including each message of a bundle) is 
+    queued to the worker selected by its OSC path.  Messages sharing an
+    OSC path are handled in order of arrival.  
+
+    Bundle timetags are honored, as they are by pythonosc Dispatcher, 
+    without blocking a worker.  Messages with a future timetag are held 
+    by an OSCBundleScheduler and queued to their worker when due.
+
+    PUBLIC METHODS--
+        * start()
+        * stop()
+        * submit()
+        * statistics()
+    """
+
+    _SENTINEL  :object  = object()
+        # Ask a worker to exit once its queue is drained.
+
+
+    #                                                                    -o-
+    def  __init__(  self, 
+                    oscDispatcher  :dispatcher.Dispatcher,
+                    workerCount    :int   = 4,
+                    queueDepth     :int   = 1024,
+                    blockWhenFull  :bool  = False,
+                 ):
+        if  (not isinstance(workerCount, int))  or  (workerCount < 1):
+            log.critical(f"workerCount MUST BE a positive integer.  ({workerCount})")
+
+        if  (not isinstance(queueDepth, int))  or  (queueDepth < 1):
+            log.critical(f"queueDepth MUST BE a positive integer.  ({queueDepth})")
+
+        self.dispatcher     = oscDispatcher
+        self.workerCount    = workerCount
+        self.queueDepth     = queueDepth
+        self.blockWhenFull  = blockWhenFull
+
+        self._queues     :List[queue.Queue]       = [ queue.Queue(maxsize=queueDepth) for _ in range(workerCount) ]
+        self._workers    :List[threading.Thread]  = []
+        self._scheduler  :OSCBundleScheduler      = OSCBundleScheduler()
+
+        self._statisticsLock  :threading.Lock  = threading.Lock()
+
+        self._exitWhenDrained  :threading.Thread  = None
+            # Worker that called stop() while its own queue was full.  See stop().
+
+        self._received      :int  = 0     # Datagrams received.
+        self._enqueued      :int  = 0     # Messages queued to a worker.
+        self._handled       :int  = 0     # Messages handled by a worker.
+        self._dropped       :int  = 0     # Messages dropped because worker queue was full.
+        self._blocked       :int  = 0     # Messages that waited for room in worker queue.
+        self._parseErrors   :int  = 0     # Datagrams that are not valid OSC.
+        self._handlerErrors :int  = 0     # Exceptions raised by OSC path handlers.
+        self._queueDepthMax :List[int]  = [0] * workerCount     # High water mark per worker.
+
+        # NB  Written only by the scheduler thread.
+        #
+        self._delayed         :int  = 0     # Messages held for their timetag, once due.
+        self._delayedDropped  :int  = 0     # Held messages dropped because worker queue was full.
+        self._delayedBlocked  :int  = 0     # Held messages that waited for room in worker queue.
+
+
+    #                                                                    -o-
+    def  start(self)  -> None:
+        if  self._workers:
+            log.warning("Worker pool is ALREADY STARTED.")
+            return
+
+        for index, workerQueue in enumerate(self._queues):
+            worker = threading.Thread(  target  = self._runWorker, 
+                                        args    = (workerQueue,), 
+                                        name    = f"OSCServerWorker-{index}", 
+                                        daemon  = True )
+            worker.start()
+            self._workers.append(worker)
+
+        self._scheduler.start()
+
+
+    #                                                                    -o-
+    def  stop(self, timeoutInSeconds:float=5.0)  -> None:
+        """
+        Handle messages already queued, then stop all workers.
+        Messages held for a future timetag are discarded.
+        If called from a worker (eg, by an OSC path handler), that worker 
+          exits after the handler returns and its queue is drained.
+
+        NB  A worker cannot wait for room in its own queue.  If it calls 
+            stop() while that queue is full, it is marked to exit once the
+            queue is drained, instead of being sent the sentinel.
+        """
+
+        self._scheduler.stop(timeoutInSeconds)
+
+        currentThread = threading.current_thread()
+
+        for index, workerQueue in enumerate(self._queues):
+            if  (index < len(self._workers))  and  (currentThread is self._workers[index]):
+                try:
+                    workerQueue.put_nowait(self._SENTINEL)
+                except  queue.Full:
+                    self._exitWhenDrained = currentThread
+                continue
+
+            workerQueue.put(self._SENTINEL)
+
+        for worker in self._workers:
+            if  currentThread is not worker:
+                worker.join(timeout=timeoutInSeconds)
+
+        self._workers = []
+
+
+    #                                                                    -o-
+    def  submit(self, data:bytes, clientAddress:Tuple[str, int])  -> None:
+        """
+        Parse datagram and queue each message to the worker for its OSC path.
+        Messages with a future timetag are queued when due.
+        Called by receive threads, which may be more than one.
+        """
+
+        try:
+            packet = osc_packet.OscPacket(data)
+        except  osc_packet.ParseError:
+            with self._statisticsLock:
+                self._received     += 1
+                self._parseErrors  += 1
+            return
+
+        timeNow   = time.time()
+        enqueued  = 0
+        dropped   = 0
+        blocked   = 0
+
+        for timedMessage in packet.messages:
+            if  timedMessage.time > timeNow:
+                self._scheduler.schedule(  OSCBundleScheduler.monotonicNsFromTimestamp(timedMessage.time),
+                                           self._enqueueDelayed, timedMessage, clientAddress )
+                continue
+
+            isQueued, isBlocked = self._enqueue(timedMessage, clientAddress)
+
+            if  isBlocked:     blocked   += 1
+            if  isQueued:      enqueued  += 1
+            else:              dropped   += 1
+
+        with self._statisticsLock:
+            self._received  += 1
+            self._enqueued  += enqueued
+            self._dropped   += dropped
+            self._blocked   += blocked
+
+
+    #                                                                    -o-
+    def  statistics(self)  -> dict:
+        """
+        RETURNS  Dictionary of counters:
+            workerCount, queueDepth, blockWhenFull,
+            received, enqueued, handled, dropped, blocked, 
+            parseErrors, handlerErrors,
+            delayed, delayedPending,
+            pending (List[int]), pendingMax (List[int]) -- per worker.
+
+        Counters include messages held for a future timetag, once due.
+          delayed counts held messages that have come due, 
+          delayedPending those not yet due.
+        """
+
+        with self._statisticsLock:
+            received       = self._received
+            enqueued       = self._enqueued
+            handled        = self._handled
+            dropped        = self._dropped
+            blocked        = self._blocked
+            parseErrors    = self._parseErrors
+            handlerErrors  = self._handlerErrors
+            pendingMax     = list(self._queueDepthMax)
+
+        return  { "workerCount"    : self.workerCount,
+                  "queueDepth"     : self.queueDepth,
+                  "blockWhenFull"  : self.blockWhenFull,
+                  "received"       : received,
+                  "enqueued"       : enqueued + (self._delayed - self._delayedDropped),
+                  "handled"        : handled,
+                  "dropped"        : dropped + self._delayedDropped,
+                  "blocked"        : blocked + self._delayedBlocked,
+                  "parseErrors"    : parseErrors,
+                  "handlerErrors"  : handlerErrors,
+                  "delayed"        : self._delayed,
+                  "delayedPending" : self._scheduler.statistics()["pending"],
+                  "pending"        : [ q.qsize() for q in self._queues ],
+                  "pendingMax"     : pendingMax,
+                }
+
+
+    #                                                                    -o-
+    def  _enqueue(self, timedMessage:osc_packet.TimedMessage, clientAddress:Tuple[str, int])  -> Tuple[bool, bool]:
+        """
+        Queue timedMessage to the worker for its OSC path.
+        RETURNS  (isQueued, isBlocked).  
+                 Counters are left to the caller, except _queueDepthMax, 
+                 which is written here by the receive and scheduler 
+                 threads, under _statisticsLock.
+        """
+
+        index        = hash(timedMessage.message.address) % self.workerCount
+        workerQueue  = self._queues[index]
+        isBlocked    = False
+
+        try:
+            workerQueue.put_nowait((timedMessage, clientAddress))
+
+        except  queue.Full:
+            if  not self.blockWhenFull:
+                return  (False, False)
+
+            isBlocked = True
+            workerQueue.put((timedMessage, clientAddress))
+
+        depth = workerQueue.qsize()
+
+        with self._statisticsLock:
+            if  depth > self._queueDepthMax[index]:
+                self._queueDepthMax[index] = depth
+
+        return  (True, isBlocked)
+
+
+    #                                                                    -o-
+    def  _enqueueDelayed(self, timedMessage:osc_packet.TimedMessage, clientAddress:Tuple[str, int])  -> None:
+        """
+        Run by the scheduler thread when timedMessage is due.
+        """
+
+        isQueued, isBlocked = self._enqueue(timedMessage, clientAddress)
+
+        self._delayed += 1
+        if  isBlocked:     self._delayedBlocked  += 1
+        if  not isQueued:  self._delayedDropped  += 1
+
+
+    #                                                                    -o-
+    def  _runWorker(self, workerQueue:queue.Queue)  -> None:
+        while  True:
+            item = workerQueue.get()
+
+            if  self._SENTINEL is item:  
+                return
+
+            timedMessage, clientAddress = item
+            message = timedMessage.message
+
+            handlers = self.dispatcher.handlers_for_address(message.address)
+
+            isHandlerError = False
+
+            for handler in handlers:
+                try:
+                    handler.invoke(clientAddress, message)
+                except  Exception as e:
+                    isHandlerError = True
+                    log.error(f"OSC path handler FAILED for \"{message.address}\".  ({e})")
+
+            with self._statisticsLock:
+                self._handled += 1
+                if  isHandlerError:  
+                    self._handlerErrors += 1
+
+            if  (self._exitWhenDrained is threading.current_thread())  and  workerQueue.empty():
+                return
+
+#ENDCLASS -- OSCServerWorkerPool()
+
+
+
+
+#                                                                    -o-
+class  OSCBundleScheduler:
+    """
+    Run functions at their due time, from one thread.  Used by MOSOSC to
+    send delayed bundles when enableBundleScheduling is True.
+
+    Pending functions are held in a heap, ordered by due time, then by 
+    order of scheduling.  Due times are time.monotonic_ns() values, so 
+    they are immune to changes in wall clock time.  OSC timetags (seconds
+    since the epoch, sent as NTP timetags) are converted to and from 
+    monotonic time relative to an anchor, a reading of both clocks.  
+    The anchor is read again by any conversion made more than 
+    reanchorIntervalNs after it, so timetags follow steps and slews of 
+    the wall clock (eg, by NTP), as do receivers that compare timetags 
+    with time.time().  
+
+    NB  Functions already scheduled keep their monotonic due time, so 
+        a step in the wall clock is not applied to them.
+
+    The thread waits on a condition until spinThresholdNs before the next 
+    due time, then yields in a short spin until it is due.  Jitter (time 
+    of dispatch minus due time) is measured for every function.  
+    See statistics() and testBundleSchedulerJitter().
+
+    PUBLIC METHODS--
+        * start()
+        * stop()
+        * schedule()
+        * cancelAll()
+        * statistics()
+
+    PUBLIC CLASS METHODS--
+        * timestampNow()
+        * monotonicNsFromTimestamp()
+        * timestampFromMonotonicNs()
+        * reanchor()
+
+    PUBLIC CLASS ATTRIBUTES--
+        * reanchorIntervalNs
+    """
+
+    reanchorIntervalNs  :int  = 1_000_000_000       #DEFAULT
+        # Longest use of one anchor.  See reanchor().
+
+    _anchor  :Tuple[int, int]  = (time.time_ns(), time.monotonic_ns())
+        # (wall clock, monotonic clock), read together.  
+        # Replaced whole, so readers always see one pair.
+
+
+    #                                                                    -o-
+    def  __init__(  self, 
+                    spinThresholdNs     :int  = 500_000,
+                    jitterSampleCount   :int  = 4096,
+                 ):
+        """
+        spinThresholdNs     -- Spin, rather than wait, this close to due time.
+                                 Zero (0) disables spinning.
+        jitterSampleCount   -- Most recent jitter measurements kept for 
+                                 median and percentile in statistics().
+        """
+
+        if  (not isinstance(spinThresholdNs, int))  or  (spinThresholdNs < 0):
+            log.critical(f"spinThresholdNs MUST BE a non-negative integer.  ({spinThresholdNs})")
+
+        self.spinThresholdNs  = spinThresholdNs
+
+        self._heap       :List[Tuple[int, int, FunctionType, Tuple[Any]]]  = []
+        self._sequence   :itertools.count                                  = itertools.count()
+        self._condition  :threading.Condition                              = threading.Condition()
+        self._thread     :threading.Thread                                 = None
+        self._isRunning  :bool                                             = False
+
+        self._scheduled       :int  = 0     # Functions scheduled.
+        self._dispatched      :int  = 0     # Functions run.
+        self._cancelled       :int  = 0     # Functions removed before their due time.
+        self._errors          :int  = 0     # Exceptions raised by functions.
+        self._jitterTotalNs   :int  = 0
+        self._jitterMaximumNs :int  = 0
+        self._jitterSamples   :collections.deque  = collections.deque(maxlen=jitterSampleCount)
+
+
+    #                                                                    -o-
+    def  start(self)  -> None:
+        if  self._thread:
+            log.warning("Bundle scheduler is ALREADY STARTED.")
+            return
+
+        self._isRunning  = True
+        self._thread     = threading.Thread(target=self._run, name="OSCBundleScheduler", daemon=True)
+        self._thread.start()
+
+
+    #                                                                    -o-
+    def  stop(self, timeoutInSeconds:float=5.0)  -> None:
+        """
+        Cancel pending functions, then stop the scheduler thread.
+        """
+
+        self.cancelAll()
+
+        with self._condition:
+            self._isRunning = False
+            self._condition.notify()
+
+        if  self._thread  and  (threading.current_thread() is not self._thread):
+            self._thread.join(timeout=timeoutInSeconds)
+
+        self._thread = None
+
+
+    #                                                                    -o-
+    def  schedule(  self, 
+                    dueNs      :int,
+                    function   :FunctionType,
+                   *args       :Tuple[Any],
+                 )  -> None:
+        """
+        Run function(*args) when time.monotonic_ns() reaches dueNs.
+        Functions with the same dueNs run in order of scheduling.
+        """
+
+        if  not self._isRunning:
+            log.critical("Bundle scheduler is NOT STARTED.")
+
+        with self._condition:
+            heapq.heappush(self._heap, (dueNs, next(self._sequence), function, args))
+            self._scheduled += 1
+
+            if  self._heap[0][0] == dueNs:
+                self._condition.notify()
+
+
+    #                                                                    -o-
+    def  cancelAll(self)  -> int:
+        """
+        RETURNS  Number of pending functions removed.
+        """
+
+        with self._condition:
+            cancelCount       = len(self._heap)
+            self._heap        = []
+            self._cancelled  += cancelCount
+            self._condition.notify()
+
+        return  cancelCount
+
+
+    #                                                                    -o-
+    def  statistics(self)  -> dict:
+        """
+        RETURNS  Dictionary of counters:
+            scheduled, dispatched, cancelled, errors, pending,
+            jitterMeanUs, jitterMedianUs, jitterP99Us, jitterMaximumUs.
+
+        Jitter is time of dispatch minus due time, in microseconds.
+          Median and 99th percentile are taken from recent dispatches.
+        """
+
+        with self._condition:
+            samples     = sorted(self._jitterSamples)
+            dispatched  = self._dispatched
+
+            results = { "scheduled"        : self._scheduled,
+                        "dispatched"       : dispatched,
+                        "cancelled"        : self._cancelled,
+                        "errors"           : self._errors,
+                        "pending"          : len(self._heap),
+                        "jitterMeanUs"     : None,
+                        "jitterMedianUs"   : None,
+                        "jitterP99Us"      : None,
+                        "jitterMaximumUs"  : self._jitterMaximumNs / 1000,
+                      }
+
+            if  dispatched > 0:
+                results["jitterMeanUs"]  = self._jitterTotalNs / dispatched / 1000
+
+        if  samples:
+            results["jitterMedianUs"]  = samples[len(samples) // 2] / 1000
+            results["jitterP99Us"]     = samples[min(len(samples) - 1, (len(samples) * 99) // 100)] / 1000
+
+        return  results
+
+
+    #                                                                    -o-
+    @classmethod
+    def  timestampNow(cls, withOffset:float=0.0)  -> float:
+        """
+        RETURNS  OSC timetag (seconds since the epoch) for now, plus 
+                   withOffset seconds, as measured by time.monotonic_ns().
+        """
+        return  cls.timestampFromMonotonicNs(time.monotonic_ns()) + withOffset
+
+
+    #                                                                    -o-
+    @classmethod
+    def  monotonicNsFromTimestamp(cls, timestamp:float)  -> int:
+        anchorWallNs, anchorMonotonicNs = cls._currentAnchor()
+        return  anchorMonotonicNs + (int(timestamp * 1_000_000_000) - anchorWallNs)
+
+
+    #                                                                    -o-
+    @classmethod
+    def  timestampFromMonotonicNs(cls, monotonicNs:int)  -> float:
+        anchorWallNs, anchorMonotonicNs = cls._currentAnchor()
+        return  (anchorWallNs + (monotonicNs - anchorMonotonicNs)) / 1_000_000_000
+
+
+    #                                                                    -o-
+    @classmethod
+    def  reanchor(cls)  -> Tuple[int, int]:
+        """
+        Read wall clock and monotonic clock together, as the anchor for 
+          conversion between timetags and monotonic time.
+        RETURNS  (wall clock, monotonic clock), in nanoseconds.
+        """
+
+        monotonicBeforeNs  = time.monotonic_ns()
+        wallNs             = time.time_ns()
+        monotonicAfterNs   = time.monotonic_ns()
+
+        cls._anchor = (wallNs, (monotonicBeforeNs + monotonicAfterNs) // 2)
+
+        return  cls._anchor
+
+
+    #                                                                    -o-
+    @classmethod
+    def  _currentAnchor(cls)  -> Tuple[int, int]:
+        anchor = cls._anchor
+
+        if  (time.monotonic_ns() - anchor[1]) > cls.reanchorIntervalNs:
+            anchor = cls.reanchor()
+
+        return  anchor
+
+
+    #                                                                    -o-
+    def  _run(self)  -> None:
+        while  True:
+            with self._condition:
+                while  self._isRunning  and  not self._heap:
+                    self._condition.wait()
+
+                if  not self._isRunning:  
+                    return
+
+                dueNs   = self._heap[0][0]
+                waitNs  = dueNs - time.monotonic_ns() - self.spinThresholdNs
+
+                if  waitNs > 0:
+                    self._condition.wait(waitNs / 1_000_000_000)
+                    continue
+
+            # NB  Spin without holding the lock.  
+            #     An earlier function scheduled meanwhile is run first.
+            #
+            while  time.monotonic_ns() < dueNs:
+                time.sleep(0)
+
+            with self._condition:
+                if  (not self._heap)  or  (self._heap[0][0] > time.monotonic_ns()):
+                    continue                # NB  Cancelled during spin.
+
+                dueNs, _, function, args = heapq.heappop(self._heap)
+
+            jitterNs = time.monotonic_ns() - dueNs
+
+            try:
+                function(*args)
+                isError = False
+            except  Exception as e:
+                isError = True
+                log.error(f"Scheduled function FAILED.  ({e})")
+
+            with self._condition:
+                self._dispatched     += 1
+                self._jitterTotalNs  += jitterNs
+                self._jitterSamples.append(jitterNs)
+
+                if  jitterNs > self._jitterMaximumNs:
+                    self._jitterMaximumNs = jitterNs
+
+                if  isError:
+                    self._errors += 1
+
+#ENDCLASS -- OSCBundleScheduler()
+
+
+
+
+#                                                                    -o-
+class  OSCSharedMemoryRing:
+    """
+    Ring buffer of encoded OSC packets in shared memory, for one producer
+    (MOSOSC client) and one consumer (MOSOSC server) on the same host.
+    A named pipe (FIFO) wakes the consumer.  See Transport.SHAREDMEMORY.
+
+    The consumer creates the ring for a port.  The producer attaches to it
+    by port.  Each packet is stored as a 32-bit length, then the packet, 
+    padded to four bytes.  Packets may wrap around the end of the ring.
+
+    Header counters are bytes written (head, owned by producer) and bytes
+    read (tail, owned by consumer), so neither side writes the other's 
+    counter.  Before it blocks on the FIFO, the consumer sets the waiting 
+    flag.  A producer that finds the flag set clears it and writes one 
+    byte to the FIFO.  So a consumer that keeps up costs the producer no 
+    system calls.  The consumer waits no longer than wakeupTimeoutInSeconds, 
+    which bounds the cost of a wakeup lost to a race.
+
+    Packets that do not fit are dropped and counted, as UDP would drop them.
+
+    The consumer holds an exclusive lock on lockPathForPort() while the 
+    ring is open.  create() replaces a ring only if it can take that lock,
+    so a ring left by a consumer that exited without closing it is 
+    replaced, and the ring of a running consumer is not.
+
+    NB  One producer process per ring.  Threads of that process may share 
+        the producer.
+
+    NB  Head and tail are published by plain stores to shared memory,
+        with no memory barrier.  Packet bytes are seen before the head 
+        that covers them only where the CPU does not reorder stores 
+        (x86-64).  Use across processes on weakly ordered CPUs, such as 
+        ARM (including Apple Silicon), is NOT SUPPORTED.  Python offers 
+        no memory barrier, so MOSOSC.createClient() and createServer() 
+        refuse Transport.SHAREDMEMORY where isMachineSupported() is False.
+
+    PUBLIC METHODS--
+        * isMachineSupported()
+        * create()
+        * attach()
+        * write()
+        * read()
+        * wait()
+        * wake()
+        * close()
+        * statistics()
+    """
+
+    _HEADER      :struct.Struct  = struct.Struct("<QQQII")
+        # head, tail, dropped, waiting, magic.
+    _HEADER_SIZE :int            = 64
+
+    _OFFSET_HEAD     :int  = 0
+    _OFFSET_TAIL     :int  = 8
+    _OFFSET_DROPPED  :int  = 16
+    _OFFSET_WAITING  :int  = 24
+    _OFFSET_MAGIC    :int  = 28
+
+    _MAGIC   :int  = 0x4D4F5352         # "MOSR".  Zero once the consumer closes the ring.
+
+    _UINT32  :struct.Struct  = struct.Struct("<I")
+    _UINT64  :struct.Struct  = struct.Struct("<Q")
+
+    wakeupTimeoutInSeconds  :float  = 0.010         #DEFAULT
+
+    _namesCreated  :set  = set()
+        # Shared memory created by this process.  See attach().
+
+    _MACHINES_SUPPORTED  :Tuple[str, ...]  = ("x86_64", "amd64")
+        # Values of platform.machine(), lowercase, for CPUs that keep stores in order.
+
+
+    #                                                                    -o-
+    def  __init__(  self, 
+                    sharedMemory  :shared_memory.SharedMemory, 
+                    fifoPath      :str, 
+                    fifoFD        :int, 
+                    isConsumer    :bool,
+                    lockFD        :int   = None,
+                 ):
+        """
+        Use create() or attach().
+        """
+
+        self.isConsumer  :bool  = isConsumer
+        self.capacity    :int   = sharedMemory.size - self._HEADER_SIZE
+
+        self._sharedMemory  :shared_memory.SharedMemory  = sharedMemory
+        self._buffer        :memoryview                  = sharedMemory.buf
+        self._fifoPath      :str                         = fifoPath
+        self._fifoFD        :int                         = fifoFD
+        self._wakeFD        :int                         = None
+        self._lockFD        :int                         = lockFD
+        self._lock          :threading.Lock              = threading.Lock()
+        self._isClosed      :bool                        = False
+
+        # NB  Consumer holds a write end of its own FIFO, so the read end 
+        #     never reads EOF while no producer is attached.  Also used by wake().
+        #
+        if  isConsumer:
+            self._wakeFD = os.open(fifoPath, os.O_WRONLY | os.O_NONBLOCK)
+
+
+    #                                                                    -o-
+    @classmethod
+    def  isMachineSupported(cls)  -> bool:
+        """
+        RETURNS  True if this machine is x86-64, whose stores are seen
+                   by other processes in program order.  See class header.
+        """
+        return  platform.machine().lower() in cls._MACHINES_SUPPORTED
+
+
+    #                                                                    -o-
+    @staticmethod
+    def  namesForPort(port:int)  -> Tuple[str, str]:
+        """
+        RETURNS  (shared memory name, FIFO path) for port.
+        """
+        return  (f"mososc_{port}", os.path.join(tempfile.gettempdir(), f"mososc_{port}.fifo"))
+
+
+    #                                                                    -o-
+    @staticmethod
+    def  lockPathForPort(port:int)  -> str:
+        """
+        RETURNS  Path of the file locked by the consumer of the ring for port.
+
+        NB  The file is left in place when the ring closes, so every
+            consumer for port locks the same file.
+        """
+        return  os.path.join(tempfile.gettempdir(), f"mososc_{port}.lock")
+
+
+    #                                                                    -o-
+    @classmethod
+    def  create(cls, port:int, capacity:int)  -> "OSCSharedMemoryRing":
+        """
+        Create ring of capacity bytes (rounded up to four) for port, as consumer.  
+        Replaces a ring left by a consumer that did not close it.
+        Fails if the ring for port is open by a running consumer.
+        """
+
+        if  (not hasattr(os, "mkfifo"))  or  (None is fcntl):
+            log.critical("Shared memory transport REQUIRES POSIX named pipes and file locks.")
+
+        name, fifoPath  = cls.namesForPort(port)
+        capacity        = (capacity + 3) & ~3
+
+        lockFD = os.open(cls.lockPathForPort(port), os.O_RDWR | os.O_CREAT, 0o600)
+
+        try:
+            fcntl.flock(lockFD, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except  OSError:
+            os.close(lockFD)
+            log.critical(f"Shared memory ring for port {port} is IN USE by a running server.")
+
+        # NB  Lock is held, so any ring found for port is stale.
+        #
+        try:
+            stale = shared_memory.SharedMemory(name)
+            stale.close()
+            stale.unlink()
+        except  FileNotFoundError:
+            pass
+
+        if  os.path.exists(fifoPath):
+            os.unlink(fifoPath)
+
+        os.mkfifo(fifoPath, 0o600)
+
+        sharedMemory = shared_memory.SharedMemory(name, create=True, size=cls._HEADER_SIZE + capacity)
+        cls._HEADER.pack_into(sharedMemory.buf, 0, 0, 0, 0, 0, cls._MAGIC)
+        cls._namesCreated.add(name)
+
+        return  cls(sharedMemory, fifoPath, os.open(fifoPath, os.O_RDONLY | os.O_NONBLOCK), True, lockFD)
+
+
+    #                                                                    -o-
+    @classmethod
+    def  attach(cls, port:int)  -> Union["OSCSharedMemoryRing",None]:
+        """
+        Attach to the ring for port, as producer.
+        RETURNS  Ring, or None if no consumer has created it.
+        """
+
+        name, fifoPath = cls.namesForPort(port)
+
+        try:
+            sharedMemory = shared_memory.SharedMemory(name)
+        except  FileNotFoundError:
+            return  None
+
+        # NB  Until Python 3.13, attaching also registers the segment with
+        #     resource_tracker, which would unlink it when this process exits.
+        #     Registration is shared with the consumer in the same process.
+        #
+        if  name not in cls._namesCreated:
+            try:
+                resource_tracker.unregister(sharedMemory._name, "shared_memory")
+            except  Exception:
+                pass
+
+        try:
+            if  cls._MAGIC != cls._UINT32.unpack_from(sharedMemory.buf, cls._OFFSET_MAGIC)[0]:
+                raise  FileNotFoundError()
+            fifoFD = os.open(fifoPath, os.O_WRONLY | os.O_NONBLOCK)
+        except  OSError:
+            sharedMemory.close()
+            return  None
+
+        return  cls(sharedMemory, fifoPath, fifoFD, False)
+
+
+    #                                                                    -o-
+    @property
+    def  isClosed(self)  -> bool:
+        """
+        True if this end is closed, or (for producer) if the consumer closed the ring.
+        """
+        if  self._isClosed:  return True
+        return  self._MAGIC != self._UINT32.unpack_from(self._buffer, self._OFFSET_MAGIC)[0]
+
+
+    #                                                                    -o-
+    def  write(self, packet:Union[bytes, bytearray])  -> bool:
+        """
+        RETURNS  True if packet is written, False if it is dropped.
+        """
+
+        buffer    = self._buffer
+        capacity  = self.capacity
+        length    = len(packet)
+        size      = 4 + ((length + 3) & ~3)
+
+        with self._lock:
+            head  = self._UINT64.unpack_from(buffer, self._OFFSET_HEAD)[0]
+            tail  = self._UINT64.unpack_from(buffer, self._OFFSET_TAIL)[0]
+
+            if  size > (capacity - (head - tail)):
+                dropped = self._UINT64.unpack_from(buffer, self._OFFSET_DROPPED)[0]
+                self._UINT64.pack_into(buffer, self._OFFSET_DROPPED, dropped + 1)
+                return  False
+
+            # NB  Length is four-byte aligned and never wraps.
+            #
+            offset = head % capacity
+            self._UINT32.pack_into(buffer, self._HEADER_SIZE + offset, length)
+
+            start  = (offset + 4) % capacity
+            first  = min(length, capacity - start)
+
+            buffer[self._HEADER_SIZE + start : self._HEADER_SIZE + start + first] = packet[:first]
+            if  first < length:
+                buffer[self._HEADER_SIZE : self._HEADER_SIZE + length - first] = packet[first:]
+
+            self._UINT64.pack_into(buffer, self._OFFSET_HEAD, head + size)
+
+            #
+            if  self._UINT32.unpack_from(buffer, self._OFFSET_WAITING)[0]:
+                self._UINT32.pack_into(buffer, self._OFFSET_WAITING, 0)
+                try:
+                    os.write(self._fifoFD, b"\0")
+                except  (BlockingIOError, BrokenPipeError):
+                    pass
+
+        return  True
+
+
+    #                                                                    -o-
+    def  read(self)  -> Union[bytes,None]:
+        """
+        RETURNS  Next packet, or None if ring is empty.
+        """
+
+        buffer    = self._buffer
+        capacity  = self.capacity
+
+        head  = self._UINT64.unpack_from(buffer, self._OFFSET_HEAD)[0]
+        tail  = self._UINT64.unpack_from(buffer, self._OFFSET_TAIL)[0]
+
+        if  head == tail:  return None
+
+        offset  = tail % capacity
+        length  = self._UINT32.unpack_from(buffer, self._HEADER_SIZE + offset)[0]
+        start   = (offset + 4) % capacity
+        first   = min(length, capacity - start)
+
+        packet = bytes(buffer[self._HEADER_SIZE + start : self._HEADER_SIZE + start + first])
+        if  first < length:
+            packet += bytes(buffer[self._HEADER_SIZE : self._HEADER_SIZE + length - first])
+
+        self._UINT64.pack_into(buffer, self._OFFSET_TAIL, tail + 4 + ((length + 3) & ~3))
+
+        return  packet
+
+
+    #                                                                    -o-
+    def  wait(self, timeoutInSeconds:float=None)  -> None:
+        """
+        Block until a packet is written, wake() is called, or 
+        timeoutInSeconds (DEFAULT: wakeupTimeoutInSeconds) passes.
+        """
+
+        buffer = self._buffer
+
+        if  None is timeoutInSeconds:
+            timeoutInSeconds = self.wakeupTimeoutInSeconds
+
+        self._UINT32.pack_into(buffer, self._OFFSET_WAITING, 1)
+
+        if  self._UINT64.unpack_from(buffer, self._OFFSET_HEAD)[0] == self._UINT64.unpack_from(buffer, self._OFFSET_TAIL)[0]:
+            select.select([self._fifoFD], [], [], timeoutInSeconds)
+
+        self._UINT32.pack_into(buffer, self._OFFSET_WAITING, 0)
+
+        try:
+            os.read(self._fifoFD, 4096)
+        except  BlockingIOError:
+            pass
+
+
+    #                                                                    -o-
+    def  wake(self)  -> None:
+        """
+        Wake consumer from wait().  Consumer only.
+        """
+        try:
+            os.write(self._wakeFD, b"\0")
+        except  (BlockingIOError, BrokenPipeError, TypeError):
+            pass
+
+
+    #                                                                    -o-
+    def  close(self)  -> None:
+        """
+        Consumer marks the ring closed, then removes shared memory and FIFO.
+        Producer detaches.
+        """
+
+        if  self._isClosed:  return
+        self._isClosed = True
+
+        if  self.isConsumer:
+            self._UINT32.pack_into(self._buffer, self._OFFSET_MAGIC, 0)
+
+        for fd in (self._fifoFD, self._wakeFD):
+            if  None is not fd:  
+                os.close(fd)
+
+        self._buffer = None
+        self._sharedMemory.close()
+
+        if  self.isConsumer:
+            self._sharedMemory.unlink()
+            self._namesCreated.discard(self._sharedMemory.name)
+            try:
+                os.unlink(self._fifoPath)
+            except  FileNotFoundError:
+                pass
+
+            os.close(self._lockFD)                  # NB  Releases lock.
+
+
+    #                                                                    -o-
+    def  statistics(self)  -> dict:
+        """
+        RETURNS  Dictionary: capacity, written, read, pending (bytes), dropped (packets).
+        """
+
+        head, tail, dropped, _, _ = self._HEADER.unpack_from(self._buffer, 0)
+
+        return  { "capacity"  : self.capacity,
+                  "written"   : head,
+                  "read"      : tail,
+                  "pending"   : head - tail,
+                  "dropped"   : dropped,
+                }
+
+#ENDCLASS -- OSCSharedMemoryRing()
+
+
+
+
+#                                                                    -o-
+class  OSCSLIPStream:
+    """
+    SLIP framing of OSC packets on a byte stream, per OSC 1.1.
+
+    Each packet is written as END, the packet with END and ESC bytes 
+    escaped, then END (RFC 1055, double END).  Empty frames between 
+    consecutive END bytes are ignored.
+
+    encode() frames one packet.  An instance decodes one stream--
+    feed() it bytes as they arrive, and it returns the packets completed
+    by them, keeping the partial packet that follows until its END arrives.
+
+    PUBLIC METHODS--
+        * encode()
+        * feed()
+    """
+
+    END      :bytes  = b"\xc0"
+    ESC      :bytes  = b"\xdb"
+    ESC_END  :bytes  = b"\xdb\xdc"
+    ESC_ESC  :bytes  = b"\xdb\xdd"
+
+    _END_BYTE  :int  = 0xc0
+    _ESC_BYTE  :int  = 0xdb
+
+
+    #                                                                    -o-
+    def  __init__(self):
+        self._partial  :bytearray  = bytearray()
+
+
+    #                                                                    -o-
+    @classmethod
+    def  encode(cls, packet:Union[bytes, bytearray])  -> bytes:
+        """
+        RETURNS  Packet framed for a stream.
+        """
+
+        if  (cls._ESC_BYTE in packet)  or  (cls._END_BYTE in packet):
+            packet = packet.replace(cls.ESC, cls.ESC_ESC).replace(cls.END, cls.ESC_END)
+
+        return  b"".join((cls.END, packet, cls.END))
+
+
+    #                                                                    -o-
+    def  feed(self, data:Union[bytes, bytearray])  -> List[bytes]:
+        """
+        RETURNS  Packets completed by data, in order.  May be empty.
+
+        The partial packet is split only when data holds an END byte,
+        so a large packet received in many pieces is scanned once.
+        """
+
+        self._partial += data
+
+        if  self._END_BYTE not in data:  
+            return  []
+
+        frames         = self._partial.split(self.END)
+        self._partial  = frames.pop()
+        packets        = []
+
+        for frame in frames:
+            if  not frame:  continue
+
+            if  self._ESC_BYTE in frame:
+                frame = frame.replace(self.ESC_END, self.END).replace(self.ESC_ESC, self.ESC)
+
+            packets.append(bytes(frame))
+
+        return  packets
+
+#ENDCLASS -- OSCSLIPStream()
+
+
+
+
+#----------------------------------------------- -o--
+# Protected classes.
+
+#                                                                    -o-
+class  _DatagramBatchSender:
+    """
+    Write many datagrams to one destination, by one socket.sendto() per
+    datagram.  
+
+    NB  pythonosc UDPClient socket is non-blocking.  When the socket 
+          buffer is full, wait until it is writable, then continue.
+    """
+
+    _WRITE_WAIT_SECONDS   :float  = 1.0
+
+
+    #                                                                    -o-
+    def  __init__(self, sock:socket.socket, hostname:str, port:int):
+        self._sock         = sock
+        self._destination  = (hostname, port)
+
+
+    #                                                                    -o-
+    def  send(self, datagrams:List[bytes])  -> int:
+        sendto       = self._sock.sendto
+        destination  = self._destination
+
+        for dgram in datagrams:
+            try:
+                sendto(dgram, destination)
+            except  BlockingIOError:
+                self._waitUntilWritable()
+                sendto(dgram, destination)
+
+        return  len(datagrams)
+
+
+    #                                                                    -o-
+    def  _waitUntilWritable(self)  -> None:
+        select.select([], [self._sock], [], self._WRITE_WAIT_SECONDS)
+
+#ENDCLASS -- _DatagramBatchSender()
+
+
+
+#                                                                    -o-
+class  _RoutingDispatcher(dispatcher.Dispatcher):
+    """
+    Dispatcher that resolves handlers through OSCRoutingTable.
+
+    Address map and routing table are copy-on-write.  Each change copies 
+    the address map, edits the copy, compiles a new table from it, then 
+    publishes both by reference assignment.  Readers take a single 
+    reference to the current table and never lock, so handlers may be
+    mapped and unmapped while the server is serving.  Writers serialize
+    on _writeLock.
+    """
+
+    def  __init__(self):
+        super().__init__()
+        self._writeLock     :threading.Lock   = threading.Lock()
+        self._routingTable  :OSCRoutingTable  = OSCRoutingTable({})
+
+    def  map(  self, 
+               address              :str, 
+               handler              :FunctionType, 
+               *args                :List[Any],
+               needs_reply_address  :bool  = False,
+            )  -> dispatcher.Handler:
+        return  self.mapHandler(address, dispatcher.Handler(handler, list(args), needs_reply_address))
+
+    def  mapHandler(self, address:str, handlerObject:dispatcher.Handler)  -> dispatcher.Handler:
+        with self._writeLock:
+            pathMap = self._copyMap()
+            pathMap[address].append(handlerObject)
+            self._publish(pathMap)
+
+        return  handlerObject
+
+    def  unmap(  self, 
+                 address              :str, 
+                 handler              :Union[FunctionType, dispatcher.Handler], 
+                 *args                :List[Any],
+                 needs_reply_address  :bool  = False,
+              )  -> None:
+        if  not isinstance(handler, dispatcher.Handler):
+            handler = dispatcher.Handler(handler, list(args), needs_reply_address)
+
+        with self._writeLock:
+            pathMap = self._copyMap()
+
+            try:
+                pathMap[address].remove(handler)
+            except  ValueError as e:
+                raise ValueError(f"Address '{address}' doesn't have handler '{handler}' mapped to it") from e
+
+            self._publish(pathMap)
+
+    def  set_default_handler(  self, 
+                               handler              :Union[FunctionType, dispatcher.Handler], 
+                               needs_reply_address  :bool  = False,
+                            )  -> None:
+        with self._writeLock:
+            if  isinstance(handler, dispatcher.Handler):
+                self._default_handler = handler
+            else:
+                super().set_default_handler(handler, needs_reply_address)
+            self._publish(self._map)
+
+    def  removeAddress(self, address:str)  -> None:
+        """
+        Remove address and all its handlers.  Raise KeyError if address is not mapped.
+        """
+        with self._writeLock:
+            pathMap = self._copyMap()
+            pathMap.pop(address)
+            self._publish(pathMap)
+
+    def  addresses(self)  -> List[str]:
+        return  list(self._map.keys())
+
+    def  handlers_for_address(self, address_pattern:str)  -> Tuple[dispatcher.Handler]:
+        routingTable  = self._routingTable
+        handlers      = routingTable.handlersFor(address_pattern)
+
+        if  handlers and (handlers is routingTable.defaultHandlers):
+            logging.debug("No handler matched but default handler present, added it.")
+
+        return  handlers
+
+    def  _copyMap(self)  -> Dict[str, List[dispatcher.Handler]]:
+        pathMap = collections.defaultdict(list)
+        for address, handlers in self._map.items():
+            pathMap[address] = list(handlers)
+        return  pathMap
+
+    # NB  Table is published last; readers only use the table.
+    #
+    def  _publish(self, pathMap:Dict[str, List[dispatcher.Handler]])  -> None:
+        routingTable  = OSCRoutingTable(pathMap, self._default_handler)
+        self._map           = pathMap
+        self._routingTable  = routingTable
+
+#ENDCLASS -- _RoutingDispatcher()
+
+
+
+#                                                                    -o-
+class  _EventHandler(dispatcher.Handler):
+    """
+    Handler that calls its callback with one OSCEvent, built directly 
+    from the incoming message.  See MOSOSC.addEventHandler().
+
+    NB  event.oscArgs is the parameter list of the message, shared by 
+        every handler of that message.
+    """
+
+    def  __init__(  self, 
+                    callback           :FunctionType, 
+                    userArgs           :Tuple[Any], 
+                    needsReplyAddress  :bool, 
+                    mososc             :MOSOSC,
+                    postOSCPath        :bool  = True,
+                 ):
+        super().__init__(callback, userArgs, needsReplyAddress)
+        self.mososc       :MOSOSC  = mososc
+        self.postOSCPath  :bool    = postOSCPath
+
+    def  invoke(self, clientAddress:Tuple[str, int], message:osc_message.OscMessage)  -> None:
+        if  self.needs_reply_address:
+            event = OSCEvent(clientAddress[0], clientAddress[1], message.address, message._parameters, self.args)
+        else:
+            event = OSCEvent(None, None, message.address, message._parameters, self.args)
+
+        mososc = self.mososc
+
+        if       self.postOSCPath  and  mososc.enablePathLogging        \
+            and  log.isEnabledFor(logging.MOS_LOGGER_LEVEL_OSC):
+            mososc._postOSCPath(event.sourceHostname, event.sourcePort, event.oscPath, event.oscArgs)
+
+        self.callback(event)
+
+#ENDCLASS -- _EventHandler()
+
+
+
+#                                                                    -o-
+class  _BundleNodeBuilder(OscBundleBuilder):
+    """
+    OscBundleBuilder whose build() returns OSCBundleNode.  Created by MOSOSC.bundle().
+    """
+
+    def  build(self)  -> OSCBundleNode:
+        return  OSCBundleNode.fromBuilder(self)
+
+#ENDCLASS -- _BundleNodeBuilder()
+
+
+
+#                                                                    -o-
+class  _WorkerPoolOSCUDPServer(osc_server.BlockingOSCUDPServer):
+    """
+    Receive datagrams in the thread running serve_forever(), and pass 
+    them to workerPool instead of handling them in place.
+    """
+
+    def  __init__(  self, 
+                    serverAddress  :Tuple[str, int],
+                    oscDispatcher  :dispatcher.Dispatcher,
+                    workerPool     :OSCServerWorkerPool,
+                 ):
+        super().__init__(serverAddress, oscDispatcher)
+        self.workerPool = workerPool
+
+    def  finish_request(self, request:Tuple[bytes, Any], clientAddress:Tuple[str, int])  -> None:
+        self.workerPool.submit(request[0], clientAddress)
+
+#ENDCLASS -- _WorkerPoolOSCUDPServer()
+
+
+
+#                                                                    -o-
+class  _SharedMemoryClient:
+    """
+    Client for Transport.SHAREDMEMORY.  Presents send() as UDPClient.
+
+    Attaches to the server ring on first send, and again if the server
+    is recreated.  Packets sent while there is no server are dropped and
+    counted, as UDP would drop them.
+    """
+
+    def  __init__(self, hostname:str, port:int):
+        self._address  :str                    = hostname
+        self._port     :int                    = port
+        self._ring     :OSCSharedMemoryRing    = None
+        self.dropped   :int                    = 0        # Packets sent while no server ring exists.
+
+    def  send(self, content:Union[osc_message.OscMessage, osc_bundle.OscBundle, "OSCMessageTemplate"])  -> None:
+        self.sendDatagrams([content.dgram])
+
+    def  sendDatagrams(self, datagrams:List[Union[bytes, bytearray]])  -> int:
+        """
+        RETURNS  Number of datagrams written to the ring.
+        """
+
+        ring = self._ring
+
+        if  (None is ring)  or  ring.isClosed:
+            if  ring:  ring.close()
+            ring = self._ring = OSCSharedMemoryRing.attach(self._port)
+
+            if  not ring:
+                self.dropped += len(datagrams)
+                return  0
+
+        sentCount = 0
+        for dgram in datagrams:
+            if  ring.write(dgram):  sentCount += 1
+
+        return  sentCount
+
+    def  close(self)  -> None:
+        if  self._ring:
+            self._ring.close()
+            self._ring = None
+
+#ENDCLASS -- _SharedMemoryClient()
+
+
+
+#                                                                    -o-
+class  _SharedMemoryOSCServer:
+    """
+    Server for Transport.SHAREDMEMORY.  Presents serve_forever(), 
+    shutdown() and server_close() as socketserver.
+
+    Packets are read from OSCSharedMemoryRing by the thread running 
+    serve_forever(), then passed to workerPool (ServerMode.WORKERPOOL),
+    or handled in place, in order of arrival (otherwise).
+
+    Handlers receive source address (hostname, 0).
+    """
+
+    def  __init__(  self, 
+                    hostname       :str,
+                    port           :int,
+                    oscDispatcher  :dispatcher.Dispatcher,
+                    ringSize       :int,
+                    workerPool     :OSCServerWorkerPool  = None,
+                 ):
+        self.dispatcher     :dispatcher.Dispatcher  = oscDispatcher
+        self.workerPool     :OSCServerWorkerPool    = workerPool
+        self.ring           :OSCSharedMemoryRing    = OSCSharedMemoryRing.create(port, ringSize)
+
+        self._clientAddress      :Tuple[str, int]   = (hostname, 0)
+        self._isShutdownRequest  :bool              = False
+        self._isShutdown         :threading.Event   = threading.Event()
+        self._servingThread      :threading.Thread  = None
+
+        self._isShutdown.set()
+
+    def  serve_forever(self)  -> None:
+        ring           = self.ring
+        clientAddress  = self._clientAddress
+
+        if  self.workerPool:
+            handlePacket = self.workerPool.submit
+        else:
+            handlePacket = self.dispatcher.call_handlers_for_packet
+
+        self._isShutdownRequest  = False
+        self._servingThread      = threading.current_thread()
+        self._isShutdown.clear()
+
+        try:
+            while  not self._isShutdownRequest:
+                packet = ring.read()
+
+                if  None is packet:
+                    ring.wait()
+                    continue
+
+                handlePacket(packet, clientAddress)
+        finally:
+            self._isShutdown.set()
+
+    def  shutdown(self)  -> None:
+        """
+        Stop serve_forever() and wait for it to return, unless called 
+        from a handler run by serve_forever().
+        """
+
+        self._isShutdownRequest = True
+        self.ring.wake()
+
+        if  threading.current_thread() is not self._servingThread:
+            self._isShutdown.wait()
+
+    def  server_close(self)  -> None:
+        self.ring.close()
+
+#ENDCLASS -- _SharedMemoryOSCServer()
+
+
+
+#                                                                    -o-
+class  _StreamClient:
+    """
+    Client for Transport.TCP and Transport.UNIX.  Presents send() as UDPClient.
+
+    Packets are framed by OSCSLIPStream on one persistent connection,
+    opened by the first send, and opened again when a write fails.  
+    Packets that cannot be written are dropped and counted.
+
+    Writes are coalesced.  Frames passed to one sendDatagrams(), and frames 
+    sent by other threads while a write is in progress, are written by 
+    one sendall().  A thread that finds a write in progress leaves its 
+    frames to the writing thread and returns.
+
+    Connecting waits no longer than connectTimeoutInSeconds.  After a 
+    connection attempt times out, sends are dropped without connecting 
+    for connectRetryIntervalInSeconds, so an unreachable host does not 
+    hold up every send.
+    """
+
+    connectTimeoutInSeconds        :float  = 0.5        #DEFAULT
+    connectRetryIntervalInSeconds  :float  = 1.0        #DEFAULT
+
+
+    def  __init__(self, transport:Transport, hostname:str, port:int):
+        self._transport    :Transport        = transport
+        self._address      :str              = hostname
+        self._port         :int              = port
+        self._sock         :socket.socket    = None
+        self._retryAfter   :float            = 0        # time.monotonic() before which no connection is tried.
+
+        self._pending       :List[bytes]     = []
+        self._pendingCount  :int             = 0
+        self._pendingLock   :threading.Lock  = threading.Lock()
+        self._writeLock     :threading.Lock  = threading.Lock()
+
+        self.dropped       :int  = 0        # Packets not written.
+        self.writeCount    :int  = 0        # Calls to sendall().
+        self.connectCount  :int  = 0        # Connections opened.
+
+    def  send(self, content:Union[osc_message.OscMessage, osc_bundle.OscBundle, "OSCMessageTemplate"])  -> None:
+        self.sendDatagrams([content.dgram])
+
+    def  sendDatagrams(self, datagrams:List[Union[bytes, bytearray]])  -> int:
+        """
+        RETURNS  Number of datagrams queued to be written.  
+                 Those that are not written are counted by dropped.
+        """
+
+        encode  = OSCSLIPStream.encode
+        frames  = b"".join([ encode(dgram) for dgram in datagrams ])
+
+        with self._pendingLock:
+            self._pending.append(frames)
+            self._pendingCount += len(datagrams)
+
+        # NB  Check for pending frames after the write lock is released,
+        #     so frames queued while the last write was finishing are not left.
+        #
+        while  self._writeLock.acquire(blocking=False):
+            try:
+                self._writePending()
+            finally:
+                self._writeLock.release()
+
+            with self._pendingLock:
+                if  not self._pending:  break
+
+        return  len(datagrams)
+
+    def  close(self)  -> None:
+        with self._writeLock:
+            self._disconnect()
+
+    def  _writePending(self)  -> None:
+        while  True:
+            with self._pendingLock:
+                if  not self._pending:  return
+
+                data                = b"".join(self._pending)
+                count               = self._pendingCount
+                self._pending       = []
+                self._pendingCount  = 0
+
+            if  not self._write(data):
+                self.dropped += count
+
+    def  _write(self, data:bytes)  -> bool:
+        """
+        RETURNS  True if data is written.
+
+        A write that fails on an open connection is tried once more on 
+        a new connection, since the failure may only reveal that the 
+        server has closed.
+
+        NB  The server never writes, so a connection that is readable 
+            has been closed by the server.  It is replaced before writing,
+            since a write to it may succeed locally and still be lost.
+        """
+
+        if  self._sock  and  select.select([self._sock], [], [], 0)[0]:
+            self._disconnect()
+
+        for _ in range(2):
+            try:
+                if  None is self._sock:  
+                    self._connect()
+
+                self._sock.sendall(data)
+                self.writeCount += 1
+                return  True
+
+            except  OSError as e:
+                if  None is self._sock:  
+                    return  False
+
+                log.warning(f"Connection to {self._address}:{self._port} via {self._transport.value} FAILED.  ({e})")
+                self._disconnect()
+
+        return  False
+
+    def  _connect(self)  -> None:
+        if  time.monotonic() < self._retryAfter:
+            raise  ConnectionError("Connection attempt timed out recently.")
+
+        if  Transport.UNIX == self._transport:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(_StreamOSCServer.socketPathForPort(self._port))
+            except  OSError:
+                sock.close()
+                raise
+        else:
+            try:
+                sock = socket.create_connection((self._address, self._port), self.connectTimeoutInSeconds)
+            except  socket.timeout:
+                self._retryAfter = time.monotonic() + self.connectRetryIntervalInSeconds
+                raise
+
+            sock.settimeout(None)           # NB  Writes block while the server catches up.
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        self._sock = sock
+        self.connectCount += 1
+
+    def  _disconnect(self)  -> None:
+        if  self._sock:
+            try:
+                self._sock.close()
+            except  OSError:
+                pass
+            self._sock = None
+
+#ENDCLASS -- _StreamClient()
+
+
+
+#                                                                    -o-
+class  _StreamOSCRequestHandler(socketserver.BaseRequestHandler):
+    """
+    Read one connection to _StreamOSCServer until it closes.  
+    Packets are handled in order of arrival by this thread, or passed 
+    to the worker pool of the server.
+    """
+
+    receiveSize  :int  = 1 << 16
+
+    def  handle(self)  -> None:
+        server         = self.server
+        sock           = self.request
+        decoder        = OSCSLIPStream()
+        handlePacket   = server.handlePacket
+        clientAddress  = self.client_address
+
+        if  not isinstance(clientAddress, tuple):       # Transport.UNIX
+            clientAddress = server.clientAddress
+
+        server.addConnection(sock)
+
+        try:
+            while  True:
+                data = sock.recv(self.receiveSize)
+                if  not data:  break
+
+                for packet in decoder.feed(data):
+                    handlePacket(packet, clientAddress)
+
+        except  OSError:
+            pass
+
+        finally:
+            server.removeConnection(sock)
+
+#ENDCLASS -- _StreamOSCRequestHandler()
+
+
+
+#                                                                    -o-
+class  _StreamOSCServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """
+    Server for Transport.TCP and Transport.UNIX.  
+    Presents serve_forever(), shutdown() and server_close() as socketserver.
+
+    Each connection is read by its own thread.  Packets are handled by 
+    that thread, in order of arrival (ServerMode.THREADING), or passed to 
+    workerPool (ServerMode.WORKERPOOL).  
+
+    Transport.UNIX listens at socketPathForPort(port), replacing a socket
+    left by a server that did not close it, and failing as address in use
+    if a server is listening there.  Handlers receive source address 
+    (hostname, 0).
+    """
+
+    daemon_threads  = True
+
+    def  __init__(  self, 
+                    transport      :Transport,
+                    hostname       :str,
+                    port           :int,
+                    oscDispatcher  :dispatcher.Dispatcher,
+                    workerPool     :OSCServerWorkerPool  = None,
+                 ):
+        self.transport      :Transport              = transport
+        self.dispatcher     :dispatcher.Dispatcher  = oscDispatcher
+        self.workerPool     :OSCServerWorkerPool    = workerPool
+        self.clientAddress  :Tuple[str, int]        = (hostname, 0)
+
+        self._connections      :set             = set()
+        self._connectionsLock  :threading.Lock  = threading.Lock()
+
+        if  workerPool:
+            self.handlePacket = workerPool.submit
+
+        if  Transport.UNIX == transport:
+            if  not hasattr(socket, "AF_UNIX"):
+                log.critical("Transport.UNIX REQUIRES Unix domain sockets.")
+
+            self.address_family  = socket.AF_UNIX
+            serverAddress        = self.socketPathForPort(port)
+
+            self._removeStaleSocket(serverAddress)
+        else:
+            self.allow_reuse_address  = True
+            serverAddress             = (hostname, port)
+
+        super().__init__(serverAddress, _StreamOSCRequestHandler)
+
+
+    #                                                                    -o-
+    @staticmethod
+    def  socketPathForPort(port:int)  -> str:
+        return  os.path.join(tempfile.gettempdir(), f"mososc_{port}.sock")
+
+    @staticmethod
+    def  _removeStaleSocket(socketPath:str)  -> None:
+        """
+        Remove socketPath only if no server accepts connections on it.
+        RAISES  OSError (EADDRINUSE) if a server does.
+        """
+
+        if  not os.path.exists(socketPath):  
+            return
+
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        try:
+            probe.connect(socketPath)
+        except  ConnectionRefusedError:
+            os.unlink(socketPath)
+            return
+        finally:
+            probe.close()
+
+        raise  OSError(errno.EADDRINUSE, os.strerror(errno.EADDRINUSE), socketPath)
+
+    def  handlePacket(self, packet:bytes, clientAddress:Tuple[str, int])  -> None:
+        try:
+            self.dispatcher.call_handlers_for_packet(packet, clientAddress)
+        except  Exception as e:
+            log.error(f"OSC path handler FAILED.  ({e})")
+
+    def  addConnection(self, sock:socket.socket)  -> None:
+        with self._connectionsLock:
+            self._connections.add(sock)
+
+    def  removeConnection(self, sock:socket.socket)  -> None:
+        with self._connectionsLock:
+            self._connections.discard(sock)
+
+    def  server_close(self)  -> None:
+        """
+        Close the listening socket, then end open connections so their
+        threads return.
+        """
+
+        super().server_close()
+
+        with self._connectionsLock:
+            connections = list(self._connections)
+
+        for sock in connections:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except  OSError:
+                pass
+
+        if  Transport.UNIX == self.transport:
+            try:
+                os.unlink(self.server_address)
+            except  OSError:
+                pass
+
+#ENDCLASS -- _StreamOSCServer()
+
+
+
+
+#----------------------------------------------- -o--
+# Testing.
+
+#                                                                    -o-
+def  testServerModeBenchmark(  serverMode    :ServerMode  = ServerMode.THREADING,
+                               messageCount  :int         = 5000,
+                               messagesPerSecond  :float  = 2000,
+                               port          :int         = 50555,
+                            )  -> dict:
+    """
+    Send messageCount messages at messagesPerSecond to a local server 
+    running in serverMode.  Each message carries its send time.
+
+    Post and return throughput (messages handled per second) and
+    latency (send to handler, in microseconds: mean, median, 99th percentile).
+    Messages lost by UDP are reported, not counted.
+    """
+
+    latencies      :List[float]       = []
+    done           :threading.Event   = threading.Event()
+    results        :dict              = {}
+
+    server  = MOSOSC()
+    client  = MOSOSC()
+
+    server.enablePathLogging  = False
+    client.enablePathLogging  = False
+
+
+    #
+    def  handlerBenchmark(*eventArgs):
+        _, _, _, oscArgs, _ = server.parseEventArgs(eventArgs)
+        latencies.append((time.perf_counter_ns() - oscArgs[0]) / 1000)
+
+        if  oscArgs[1] >= (messageCount - 1):  
+            done.set()
+
+    server.createServer(port=port, serverMode=serverMode)
+    server.addPathHandler("/benchmark", handlerBenchmark)
+
+    serverThread = threading.Thread(target=server.startServer, daemon=True)
+    serverThread.start()
+    time.sleep(0.5)
+
+    client.createClient(port=port)
+
+
+    #
+    interval   = 1 / messagesPerSecond
+    timeStart  = time.perf_counter()
+
+    for index in range(messageCount):
+        nextSend = timeStart + (index * interval)
+        while  time.perf_counter() < nextSend:  pass
+
+        client.messageSend("/benchmark", time.perf_counter_ns(), index)
+
+    done.wait(timeout=5)
+    elapsed  = time.perf_counter() - timeStart
+
+    workerPoolStatistics = server.serverWorkerPoolStatistics()
+
+    server.stopServer()
+    serverThread.join(timeout=5)
+    server.destroyServer()
+    client.destroyClient()
+
+
+    #
+    latencies.sort()
+
+    results = { "serverMode"         : serverMode.value,
+                "received"           : len(latencies),
+                "lost"               : messageCount - len(latencies),
+                "messagesPerSecond"  : len(latencies) / elapsed,
+                "latencyMeanUsec"    : statistics.mean(latencies)  if latencies else 0,
+                "latencyMedianUsec"  : statistics.median(latencies)  if latencies else 0,
+                "latencyP99Usec"     : latencies[int(len(latencies) * 0.99)]  if latencies else 0,
+              }
+
+    if  ServerMode.WORKERPOOL == serverMode:
+        results["workerPool"] = workerPoolStatistics
+
+    log.info(dump.dicto(results, title=f"Server mode benchmark: {serverMode.value}"))
+
+    return  results
+
+#ENDDEF -- testServerModeBenchmark()
+
+
+
+
+#                                                                    -o-
+def  testRoutingTableEquivalence(trialCount:int=20000, seed:int=1)  -> bool:
+    """
+    Compare OSCRoutingTable with pythonosc Dispatcher over random 
+    registered paths (literal and globbed) and random incoming addresses
+    (literal and patterned).  Return True if every resolution matches.
+    """
+
+    rand        = random.Random(seed)
+    segments    = [ "a", "b", "volume", "pan", "x1", "" ]
+    isAllEqual  = True
+
+    logging.disable(logging.DEBUG)      # Squelch default handler messages.
+
+    #
+    def  randomPath(wildcards:str)  -> str:
+        parts = []
+        for _ in range(rand.randint(1, 3)):
+            part = rand.choice(segments)
+            if  rand.random() < 0.3:
+                position  = rand.randint(0, len(part))
+                part      = part[:position] + rand.choice(wildcards) + part[position:]
+            parts.append(part)
+        return  "/" + "/".join(parts)
+
+    #
+    for trial in range(trialCount // 100):
+        reference  = dispatcher.Dispatcher()
+        routing    = _RoutingDispatcher()
+
+        for target in (reference, routing):
+            target.set_default_handler(print)
+
+        for index in range(rand.randint(0, 12)):
+            oscPath = randomPath("*")
+            reference.map(oscPath, print, index)
+            routing.map(oscPath, print, index)
+
+        for _ in range(100):
+            address   = randomPath("*?")  if rand.random() < 0.2  else randomPath("*")
+            expected  = [ (h.callback, h.args) for h in reference.handlers_for_address(address) ]
+            found     = [ (h.callback, h.args) for h in routing.handlers_for_address(address) ]
+            again     = [ (h.callback, h.args) for h in routing.handlers_for_address(address) ]
+
+            if  (expected != found)  or  (found != again):
+                log.error(f"Routing MISMATCH for {address}:  {expected} != {found}")
+                isAllEqual = False
+
+    logging.disable(logging.NOTSET)
+
+    log.info(f"Routing table equivalence: {'PASSED' if isAllEqual else 'FAILED'}  ({trialCount} addresses)")
+
+    return  isAllEqual
+
+#ENDDEF -- testRoutingTableEquivalence()
+
+
+#                                                                    -o-
+def  testRoutingTableBenchmark(handlerCount:int=200, lookupCount:int=20000)  -> dict:
+    """
+    Time handler lookup by pythonosc Dispatcher and by _RoutingDispatcher 
+    with handlerCount literal paths plus a few globbed paths.
+    """
+
+    reference  = dispatcher.Dispatcher()
+    routing    = _RoutingDispatcher()
+
+    oscPaths  = [ f"/synth/{index}/volume" for index in range(handlerCount) ]
+    globs     = [ "/*volume", "/synth/*/pan", "/fx/*" ]
+
+    for target in (reference, routing):
+        for oscPath in oscPaths + globs:
+            target.map(oscPath, print)
+
+    addresses = [ oscPaths[index % handlerCount] for index in range(lookupCount) ]
+
+    #
+    def  timeLookups(target:dispatcher.Dispatcher)  -> float:
+        timeStart = time.perf_counter()
+        for address in addresses:
+            for _ in target.handlers_for_address(address):  pass
+        return  time.perf_counter() - timeStart
+
+    referenceSeconds  = timeLookups(reference)
+    routingSeconds    = timeLookups(routing)
+
+    results = { "handlerCount"              : handlerCount + len(globs),
+                "lookupCount"               : lookupCount,
+                "dispatcherUsecPerLookup"   : referenceSeconds * 1e6 / lookupCount,
+                "routingUsecPerLookup"      : routingSeconds * 1e6 / lookupCount,
+                "speedup"                   : referenceSeconds / routingSeconds,
+              }
+
+    log.info(dump.dicto(results, title="Routing table benchmark"))
+
+    return  results
+
+#ENDDEF -- testRoutingTableBenchmark()
+
+
+
+
+#                                                                    -o-
+def  testMessageTemplateBenchmark(sendCount:int=100000)  -> dict:
+    """
+    Verify OSCMessageTemplate datagrams equal OscMessageBuilder datagrams,
+    then time encoding a /lowSequence message both ways.
+    """
+
+    mososc    = MOSOSC()
+    template  = OSCMessageTemplate("/lowSequence", 0, 0.0, 0, 0.0)
+
+    #
+    for args in [ (1, 0.5, -7, 120.25), (2**31 - 1, -1.5, 0, 1e-3) ]:
+        builder = mososc._convertMessageListToMessageBuilder(["/lowSequence", *args])
+        if  builder.build().dgram != bytes(template.fill(*args).dgram):
+            log.error(f"Template datagram MISMATCH for {args}.")
+
+    wide = OSCMessageTemplate("/wide", 2**40, 0.25, typeTags="hd")
+    if  osc_message.OscMessage(bytes(wide.fill(2**40, 0.25).dgram)).params != [2**40, 0.25]:
+        log.error("Template datagram MISMATCH for int64/float64.")
+
+
+    #
+    timeStart = time.perf_counter()
+    for index in range(sendCount):
+        mososc._convertMessageListToMessageBuilder(["/lowSequence", index, 0.5, 60, 0.25]).build().dgram
+    builderSeconds = time.perf_counter() - timeStart
+
+    timeStart = time.perf_counter()
+    for index in range(sendCount):
+        template.fill(index, 0.5, 60, 0.25).dgram
+    templateSeconds = time.perf_counter() - timeStart
+
+    results = { "sendCount"              : sendCount,
+                "builderUsecPerMessage"  : builderSeconds * 1e6 / sendCount,
+                "templateUsecPerMessage" : templateSeconds * 1e6 / sendCount,
+                "speedup"                : builderSeconds / templateSeconds,
+              }
+
+    log.info(dump.dicto(results, title="Message template benchmark"))
+
+    return  results
+
+#ENDDEF -- testMessageTemplateBenchmark()
+
+
+
+
+#                                                                    -o-
+def  testBatchSendBenchmark(  messageCount  :int  = 50000,
+                              batchSize     :int  = 16,
+                              port          :int  = 50556,
+                           )  -> dict:
+    """
+    Count messages per second for send() of each message and for
+    batchSend() of batchSize messages, to a local server that counts 
+    datagrams received.
+    """
+
+    received  :List[int]  = [0]
+
+    serverSocket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    serverSocket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 8 * 1024 * 1024)
+    serverSocket.bind(("127.0.0.1", port))
+    serverSocket.settimeout(0.5)
+
+    def  receive():
+        try:
+            while  True:
+                serverSocket.recv(65536)
+                received[0] += 1
+        except  OSError:
+            pass
+
+    #
+    client = MOSOSC()
+    client.enablePathLogging = False
+    client.createClient(port=port)
+
+    messageLists = [ ["/lowSequence", index, 0.5, 60, 0.25]  for index in range(messageCount) ]
+
+    #
+    def  timeSends(sendFunction:FunctionType)  -> Tuple[float, int]:
+        received[0]  = 0
+        thread       = threading.Thread(target=receive, daemon=True)
+        thread.start()
+
+        timeStart = time.perf_counter()
+        sendFunction()
+        seconds = time.perf_counter() - timeStart
+
+        thread.join()
+        return  (messageCount / seconds, received[0])
+
+    def  sendSingle():
+        for messageList in messageLists:
+            client.send(messageList)
+
+    def  sendBatched():
+        for batchStart in range(0, messageCount, batchSize):
+            client.batchSend(*messageLists[batchStart : batchStart + batchSize])
+
+    def  sendTemplatesBatched():
+        for batchStart in range(0, messageCount, batchSize):
+            batchIndices = range(batchStart, min(batchStart + batchSize, messageCount))
+            client.batchSend(*[ template.fill(index, 0.5, 60, 0.25)  
+                                    for template, index in zip(templates, batchIndices) ])
+
+    templates = [ client.messageTemplate("/lowSequence", 0, 0.5, 60, 0.25)  for _ in range(batchSize) ]
+
+    singleRate,  singleReceived   = timeSends(sendSingle)
+    batchedRate, batchedReceived  = timeSends(sendBatched)
+    templateRate, templateReceived  = timeSends(sendTemplatesBatched)
+
+    results = { "messageCount"              : messageCount,
+                "batchSize"                 : batchSize,
+                "singleMessagesPerSecond"   : singleRate,
+                "singleReceived"            : singleReceived,
+                "batchedMessagesPerSecond"  : batchedRate,
+                "batchedReceived"           : batchedReceived,
+                "templateBatchedMessagesPerSecond"  : templateRate,
+                "templateBatchedReceived"           : templateReceived,
+              }
+
+    client.destroyClient()
+    serverSocket.close()
+
+    log.info(dump.dicto(results, title="Batch send benchmark"))
+
+    return  results
+
+#ENDDEF -- testBatchSendBenchmark()
+
+
+#                                                                    -o-
+def  testBundleSchedulerJitter(  bundleCount        :int    = 200,
+                                 intervalInSeconds  :float  = 0.005,
+                                 port               :int    = 50559,
+                              )  -> dict:
+    """
+    Measure jitter (time of arrival minus due time) of bundleCount bundles 
+    due every intervalInSeconds at a local socket that ignores timetags.
+    Compare--
+      * sleep loop -- time.sleep() until due time, then send()
+                        (as in demos/MOSOSC-with-RTcmix);
+      * scheduler  -- send() all bundles at once, with timetags, 
+                        when enableBundleScheduling is True.
+
+    Jitter is reported in microseconds.
+    """
+
+    arrivalsNs  :List[Tuple[int, bytes]]  = []
+
+    serverSocket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    serverSocket.bind(("127.0.0.1", port))
+    serverSocket.settimeout(0.5)
+
+    def  receive():
+        try:
+            while  len(arrivalsNs) < bundleCount:
+                datagram = serverSocket.recv(65536)
+                arrivalsNs.append((time.monotonic_ns(), datagram))
+        except  OSError:
+            pass
+
+    #
+    client = MOSOSC()
+    client.enablePathLogging = False
+    client.createClient(port=port)
+
+    intervalNs = int(intervalInSeconds * 1_000_000_000)
+
+    #
+    def  measure(sendAll:FunctionType)  -> dict:
+        arrivalsNs.clear()
+        thread = threading.Thread(target=receive, daemon=True)
+        thread.start()
+
+        startNs  = time.monotonic_ns() + (50 * 1_000_000)
+        dueNs    = [ startNs + (index * intervalNs)  for index in range(bundleCount) ]
+
+        sendAll(dueNs)
+        thread.join()
+
+        jitterUs = sorted( (arrivalNs - dueNs[osc_packet.OscPacket(datagram).messages[0].message.params[0]]) / 1000
+                                for arrivalNs, datagram in arrivalsNs )
+
+        if  not jitterUs:
+            return  { "received" : 0 }
+
+        return  { "received"         : len(jitterUs),
+                  "jitterMeanUs"     : statistics.mean(jitterUs),
+                  "jitterMedianUs"   : jitterUs[len(jitterUs) // 2],
+                  "jitterP99Us"      : jitterUs[min(len(jitterUs) - 1, (len(jitterUs) * 99) // 100)],
+                  "jitterMaximumUs"  : jitterUs[-1],
+                  "jitterStdevUs"    : statistics.pstdev(jitterUs),
+                }
+
+    def  sendWithSleepLoop(dueNs:List[int]):
+        client.enableBundleScheduling = False
+        for index, due in enumerate(dueNs):
+            delayNs = due - time.monotonic_ns()
+            if  delayNs > 0:
+                time.sleep(delayNs / 1_000_000_000)
+            client.send(client.bundle(["/jitter", index]))
+
+    def  sendWithScheduler(dueNs:List[int]):
+        client.enableBundleScheduling = True
+        for index, due in enumerate(dueNs):
+            bundleBuilder = OscBundleBuilder(OSCBundleScheduler.timestampFromMonotonicNs(due))
+            client.send(client.bundleAdd(bundleBuilder, ["/jitter", index]))
+
+    #
+    results = { "bundleCount"        : bundleCount,
+                "intervalInSeconds"  : intervalInSeconds,
+                "sleepLoop"          : measure(sendWithSleepLoop),
+                "scheduler"          : measure(sendWithScheduler),
+              }
+
+    results["schedulerStatistics"] = client.bundleSchedulerStatistics()
+
+    client.destroyClient()
+    serverSocket.close()
+
+    log.info(dump.dicto(results, title="Bundle scheduler jitter (microseconds)"))
+
+    return  results
+
+#ENDDEF -- testBundleSchedulerJitter()
+
+
+
+
+#                                                                    -o-
+def  testEventHandlerBenchmark(eventCount:int=200000)  -> dict:
+    """
+    Verify that handlers added by addPathHandler() and addEventHandler()
+    see the same event, as parsed before OSCEvent, with and without
+    source address, user args and OSC args.  Then time per-event
+    overhead of dispatching one message to one handler, two ways--
+      * adapter  -- Handler.invoke() + MOSOSC.parseEventArgs();
+      * event    -- _EventHandler.invoke(), handler receives OSCEvent.
+
+    Path logging is disabled, so only dispatch and parsing are timed.
+    """
+
+    mososc = MOSOSC()
+    mososc.enablePathLogging = False
+
+    clientAddress  = ("127.0.0.1", 50560)
+
+    expectedCases  :List[Tuple[List[Any], Tuple[Any], bool, Tuple[Any]]]  = [
+        # messageList, userArgs, needsReplyAddress, parsed event.
+        ( ["/lowSequence", 1, 0.5, 60, 0.25],  ("user", 7),  True,
+          ("127.0.0.1", 50560, "/lowSequence", [1, 0.5, 60, 0.25], ["user", 7]) ),
+        ( ["/lowSequence", 1, 0.5, 60, 0.25],  ("user", 7),  False,
+          (None, None, "/lowSequence", [1, 0.5, 60, 0.25], ["user", 7]) ),
+        ( ["/lowSequence", 1, 0.5, 60, 0.25],  (),  True,
+          ("127.0.0.1", 50560, "/lowSequence", [1, 0.5, 60, 0.25], []) ),
+        ( ["/ping"],  ("user",),  True,
+          ("127.0.0.1", 50560, "/ping", [], ["user"]) ),
+        ( ["/note", "C4", -3, 0.125, True, b"\x01\x02"],  (),  False,
+          (None, None, "/note", ["C4", -3, 0.125, True, b"\x01\x02"], []) ),
+    ]
+
+    isAllEqual  :bool  = True
+
+    #
+    for messageList, userArgs, needsReplyAddress, expected in expectedCases:
+        message  = mososc._convertMessageListToMessageBuilder(messageList).build()
+        message  = osc_message.OscMessage(message.dgram)
+        results  :List[Any]  = []
+
+        handlers = { "adapter"  : dispatcher.Handler(  lambda *eventArgs: results.append(mososc.parseEventArgs(eventArgs)), 
+                                                       [userArgs], needsReplyAddress ),
+                     "event"    : _EventHandler(  lambda event: results.append(event.asTuple()), 
+                                                  userArgs, needsReplyAddress, mososc ),
+                   }
+
+        for handler in handlers.values():
+            handler.invoke(clientAddress, message)
+
+        if  not (expected == results[0] == results[1]):
+            log.error(f"Parsed events DO NOT MATCH:  {messageList} {userArgs} needsReplyAddress={needsReplyAddress}\n    {expected}\n    {results}")
+            isAllEqual = False
+
+    log.info(f"Parsed events: {'PASSED' if isAllEqual else 'FAILED'}  ({len(expectedCases)} cases)")
+
+
+    # Time the first case.
+    #
+    messageList, userArgs, needsReplyAddress, _  = expectedCases[0]
+
+    message  = mososc._convertMessageListToMessageBuilder(messageList).build()
+    message  = osc_message.OscMessage(message.dgram)
+
+    handlers = { "adapter"  : dispatcher.Handler(  lambda *eventArgs: mososc.parseEventArgs(eventArgs), 
+                                                   [userArgs], needsReplyAddress ),
+                 "event"    : _EventHandler(  lambda event: (event.oscArgs, event.userArgs), 
+                                              userArgs, needsReplyAddress, mososc ),
+               }
+
+    usecPerEvent  :Dict[str, float]  = {}
+
+    for name, handler in handlers.items():
+        timeStart = time.perf_counter()
+        for _ in range(eventCount):
+            handler.invoke(clientAddress, message)
+        usecPerEvent[name] = (time.perf_counter() - timeStart) * 1e6 / eventCount
+
+    results = { "eventCount"            : eventCount,
+                "adapterUsecPerEvent"   : usecPerEvent["adapter"],
+                "eventUsecPerEvent"     : usecPerEvent["event"],
+                "speedup"               : usecPerEvent["adapter"] / usecPerEvent["event"],
+              }
+
+    log.info(dump.dicto(results, title="Event handler benchmark"))
+
+    return  results
+
+#ENDDEF -- testEventHandlerBenchmark()
+
+
+
+
+#                                                                    -o-
+def  testPostOSCArgsBenchmark(postCount:int=20000)  -> dict:
+    """
+    Verify that postOSCArgs() posts fixed expected lines, as posted before
+    it walked built messages iteratively, for messages with arrays, with 
+    no args and with each arg type, and for single and nested bundles, 
+    given either the builder or the built object.  Then time posting the 
+    first message and bundle, to an in-memory stream.  
+
+    Posting a builder encodes the message or bundle a second time, 
+    as the previous implementation always did.
+    """
+
+    mososc  = MOSOSC()
+    mososc.createClient(port=50562)
+
+    stream  = io.StringIO()
+
+    streamHandler  = logging.StreamHandler(stream)
+    rootLogger     = logging.getLogger()
+    handlers       = list(rootLogger.handlers)
+
+    for handler in handlers:  rootLogger.removeHandler(handler)
+    rootLogger.addHandler(streamHandler)
+
+    def  posted(postFunction:FunctionType, obj:Any)  -> List[str]:
+        stream.seek(0)
+        stream.truncate()
+        postFunction(obj)
+        return  [ re.sub(r"remaining delay \S+ @ time \S+", "remaining delay", _)  for _ in stream.getvalue().splitlines() ]
+
+    #
+    message        = mososc._convertMessageListToMessageBuilder(["/lowSequence", 1, 0.5, "text", [60, [62, 64]]])
+    innerBundle    = mososc.bundle(["/inner", 1], ["/inner", 2], delayTimeInSeconds=10)
+    outerBundle    = mososc.bundle(["/outer", 1], innerBundle, ["/outer", 2, 2.5])
+
+    expectedCases  :List[Tuple[str, Any, List[str]]]  = [
+        # name, message or bundle builder, posted lines.
+        ( "message",     message,       [ "/lowSequence 1 0.5 text [60, [62, 64]]" ] ),
+        ( "bundle",      outerBundle,   [ "/outer 1", 
+                                          "/inner 1  :: remaining delay", 
+                                          "/inner 2  :: remaining delay", 
+                                          "/outer 2 2.5" ] ),
+        ( "noArgs",      mososc._convertMessageListToMessageBuilder(["/ping"]),
+                                        [ "/ping " ] ),
+        ( "argTypes",    mososc._convertMessageListToMessageBuilder(["/note", "C4", -3, 0.125, True, b"\x01\x02"]),
+                                        [ "/note C4 -3 0.125 True b'\\x01\\x02'" ] ),
+        ( "emptyArray",  mososc._convertMessageListToMessageBuilder(["/list", []]),
+                                        [ "/list []" ] ),
+        ( "oneMessageBundle",  
+                         mososc.bundle(["/solo", 7]),
+                                        [ "/solo 7" ] ),
+        ( "deepBundle",  mososc.bundle(["/a"], mososc.bundle(["/b", 1], mososc.bundle(["/c", "x"]))),
+                                        [ "/a ", "/b 1", "/c x" ] ),
+    ]
+
+    results  :Dict[str, Any]  = {}
+    isEqual  :bool            = True
+
+    try:
+        for name, obj, expected in expectedCases:
+            for candidate, form in [ (obj, "builder"), (obj.build(), "built") ]:
+                lines = posted(mososc.postOSCArgs, candidate)
+
+                if  lines != expected:
+                    isEqual = False
+                    rootLogger.removeHandler(streamHandler)
+                    for handler in handlers:  rootLogger.addHandler(handler)
+                    log.error(f"Posted {name} ({form}) DOES NOT MATCH expected.\n    {expected}\n    {lines}")
+                    for handler in handlers:  rootLogger.removeHandler(handler)
+                    rootLogger.addHandler(streamHandler)
+
+        #
+        for name, obj in [ ("message", message), ("bundle", outerBundle) ]:
+            built = obj.build()
+
+            timeStart = time.perf_counter()
+            for _ in range(postCount):
+                mososc.postOSCArgs(obj)
+            builderSeconds = time.perf_counter() - timeStart
+
+            timeStart = time.perf_counter()
+            for _ in range(postCount):
+                mososc.postOSCArgs(built)
+            postSeconds = time.perf_counter() - timeStart
+
+            stream.seek(0)
+            stream.truncate()
+
+            results[f"{name}BuilderUsecPerPost"]  = builderSeconds * 1e6 / postCount
+            results[f"{name}UsecPerPost"]         = postSeconds * 1e6 / postCount
+
+    finally:
+        rootLogger.removeHandler(streamHandler)
+        for handler in handlers:  rootLogger.addHandler(handler)
+
+    mososc.destroyClient()
+
+    results["isEqual"] = isEqual
+    log.info(dump.dicto(results, title="postOSCArgs benchmark"))
+
+    return  results
+
+#ENDDEF -- testPostOSCArgsBenchmark()
+
+
+
+
+#                                                                    -o-
+def  testBundleNodeBenchmark(  sendCount     :int  = 5000,
+                               bundleCount   :int  = 4,
+                               messageCount  :int  = 8,
+                            )  -> dict:
+    """
+    Compose a bundle of bundleCount bundles, of messageCount messages each 
+    (as in demos/MOSOSC), with pythonosc OscBundleBuilder and with 
+    MOSOSC.bundle().  Verify both encode the same datagram, then time--
+      * compose -- building the nested bundles, then the outer bundle;
+      * resend  -- building the outer bundle for each send, as 
+                     OscBundleBuilder must, versus reusing one OSCBundleNode.
+    """
+
+    mososc = MOSOSC()
+    mososc.createClient(port=50563)
+
+    messageLists = [ [ [f"/voice/{b}", m, m * 0.5, "note"]  for m in range(messageCount) ]  for b in range(bundleCount) ]
+    delays       = [ 0.25 * (b + 1)  for b in range(bundleCount) ]
+    timestamp    = OSCBundleScheduler.timestampNow(1)
+
+    def  composeWithPythonOSC()  -> OscBundleBuilder:
+        outer = OscBundleBuilder(timestamp)
+        for b in range(bundleCount):
+            inner = OscBundleBuilder(timestamp + delays[b])
+            for messageList in messageLists[b]:
+                inner.add_content(mososc._convertMessageListToMessageBuilder(messageList).build())
+            outer.add_content(inner.build())
+        return  outer
+
+    def  composeWithMOSOSC()  -> OscBundleBuilder:
+        return  mososc.bundle( *[ mososc.bundle(*messageLists[b], timestamp=timestamp + delays[b])  for b in range(bundleCount) ], 
+                               timestamp=timestamp )
+
+    #
+    isEqual = composeWithPythonOSC().build().dgram == composeWithMOSOSC().build().dgram
+
+    node = mososc.bundleNode(composeWithMOSOSC(), composeWithMOSOSC())
+    if  not isinstance(node.build(), osc_bundle.OscBundle)                                                  \
+            or  (osc_bundle.OscBundle(node.dgram).dgram != node.dgram)                                      \
+            or  (len(list(osc_packet.OscPacket(node.dgram).messages)) != 2 * bundleCount * messageCount):
+        isEqual = False
+
+    if  not isEqual:
+        log.error("OSCBundleNode datagram DOES NOT MATCH pythonosc.")
+
+
+    #
+    def  timeIt(function:FunctionType)  -> float:
+        timeStart = time.perf_counter()
+        for _ in range(sendCount):
+            function()
+        return  (time.perf_counter() - timeStart) * 1e6 / sendCount
+
+    builder  = composeWithPythonOSC()
+    node     = mososc._build(composeWithMOSOSC())
+
+    results = { "bundleCount"                : bundleCount,
+                "messageCount"               : messageCount,
+                "isEqual"                    : isEqual,
+                "pythonoscComposeUsec"       : timeIt(lambda: composeWithPythonOSC().build().dgram),
+                "nodeComposeUsec"            : timeIt(lambda: composeWithMOSOSC().build().dgram),
+                "pythonoscResendUsec"        : timeIt(lambda: builder.build().dgram),
+                "nodeResendUsec"             : timeIt(lambda: node.build().dgram),
+              }
+
+    results["composeSpeedup"]  = results["pythonoscComposeUsec"] / results["nodeComposeUsec"]
+    results["resendSpeedup"]   = results["pythonoscResendUsec"] / results["nodeResendUsec"]
+
+    mososc.destroyClient()
+
+    log.info(dump.dicto(results, title="Bundle node benchmark"))
+
+    return  results
+
+#ENDDEF -- testBundleNodeBenchmark()
+
+
+
+
+#                                                                    -o-
+def  testTransportBenchmark(  messageCount       :int         = 5000,
+                              messagesPerSecond  :float       = 2000,
+                              burstCount         :int         = 20000,
+                              serverMode         :ServerMode  = ServerMode.WORKERPOOL,
+                              port               :int         = 50564,
+                           )  -> dict:
+    """
+    For each Transport, between a client and a server in this process--
+      * latency    -- send messageCount messages at messagesPerSecond, 
+                        each carrying its send time.  Latency is send to
+                        handler, in microseconds: mean, median, 99th percentile.
+      * throughput -- send burstCount messages as fast as possible.  
+                        Messages handled per second (until the last one
+                        is handled), and messages lost.  Losses are 
+                        attributed to the ring (Transport.SHAREDMEMORY) 
+                        and to the worker queue (ServerMode.WORKERPOOL); 
+                        UDP losses not otherwise counted are in the socket.
+
+    Every transport uses serverMode.  Handlers are added by addEventHandler().
+    """
+
+    results  :Dict[str, Any]  = {}
+
+    for transport in Transport:
+        latencies  :List[float]      = []
+        received   :List[int]        = [0]
+        receivedAt :List[float]      = [0]
+        receivedLock  = threading.Lock()
+        done       :threading.Event  = threading.Event()
+        expected   :List[int]        = [messageCount]
+
+        server  = MOSOSC()
+        client  = MOSOSC()
+
+        server.enablePathLogging  = False
+        client.enablePathLogging  = False
+
+        def  handlerLatency(event:OSCEvent):
+            latencies.append((time.perf_counter_ns() - event.oscArgs[0]) / 1000)
+            if  len(latencies) >= expected[0]:  done.set()
+
+        def  handlerBurst(event:OSCEvent):
+            with receivedLock:
+                received[0]    += 1
+                receivedAt[0]   = time.perf_counter()
+                if  received[0] >= expected[0]:  done.set()
+
+        server.createServer(port=port, serverMode=serverMode, transport=transport)
+        server.addEventHandler("/latency", handlerLatency)
+        server.addEventHandler("/burst", handlerBurst)
+
+        serverThread = threading.Thread(target=server.startServer, daemon=True)
+        serverThread.start()
+        time.sleep(0.5)
+
+        client.createClient(port=port, transport=transport)
+
+
+        # Latency.
+        #
+        interval   = 1 / messagesPerSecond
+        timeStart  = time.perf_counter()
+
+        for index in range(messageCount):
+            nextSend = timeStart + (index * interval)
+            while  time.perf_counter() < nextSend:  pass
+
+            client.messageSend("/latency", time.perf_counter_ns(), index)
+
+        done.wait(timeout=5)
+        latencies.sort()
+
+
+        # Throughput.
+        #
+        done.clear()
+        expected[0]  = burstCount
+        template     = client.messageTemplate("/burst", 0)
+        timeStart    = time.perf_counter()
+
+        for index in range(burstCount):
+            client.templateSend(template, index)
+
+        done.wait(timeout=5)
+        elapsed = max(receivedAt[0] - timeStart, 1e-9)
+
+        workerPoolDropped  = server.serverWorkerPoolStatistics().get("dropped", 0)
+        ringDropped        = 0
+        if  Transport.SHAREDMEMORY == transport:
+            ringDropped = server._server.ring.statistics()["dropped"]
+
+        #
+        server.stopServer()
+        serverThread.join(timeout=5)
+        server.destroyServer()
+        client.destroyClient()
+
+        results[transport.value] = { 
+                "latencyReceived"    : len(latencies),
+                "latencyMeanUsec"    : statistics.mean(latencies)  if latencies else 0,
+                "latencyMedianUsec"  : statistics.median(latencies)  if latencies else 0,
+                "latencyP99Usec"     : latencies[int(len(latencies) * 0.99)]  if latencies else 0,
+                "burstReceived"      : received[0],
+                "burstLost"          : burstCount - received[0],
+                "ringDropped"        : ringDropped,
+                "workerPoolDropped"  : workerPoolDropped,
+                "messagesPerSecond"  : received[0] / elapsed,
+              }
+
+    log.info(dump.dicto(results, title=f"Transport benchmark ({serverMode.value})"))
+
+    return  results
+
+#ENDDEF -- testTransportBenchmark()
+
+
+#                                                                    -o-
+def  testLargePayloadBenchmark(  payloadSizes  :Tuple[int]  = (1024, 8192, 32768, 65000, 262144),
+                                 messageCount  :int         = 500,
+                                 transports    :Tuple[Transport]  = (Transport.UDP, Transport.TCP, Transport.UNIX),
+                                 port          :int         = 50565,
+                              )  -> dict:
+    """
+    For each of transports and payloadSizes, send messageCount messages 
+    as fast as possible, each carrying its send time and a blob of 
+    payloadSize bytes, between a client and a server in this process.
+
+    Post and return, per transport and payload size--
+      * received, lost -- Messages handled, and not.
+      * sendErrors     -- Sends refused by the transport, such as UDP 
+                            datagrams that exceed the datagram limit.
+      * megabytesPerSecond  -- Payload handled per second, until the 
+                                 last message is handled.
+      * latency        -- Send to handler, in microseconds: median, 
+                            99th percentile.
+
+    Server runs ServerMode.WORKERPOOL with serverWorkerBlockWhenFull,
+    so no message is dropped by the worker pool.  UDP servers read 
+    datagrams of up to MOSOSC._UDP_MAX_PACKET_SIZE bytes.  UDP payloads 
+    larger than the datagram limit of the host (at most 65507 bytes 
+    over IPv4, and 9216 by DEFAULT on macOS) are refused by send(), 
+    and counted as sendErrors.  Other UDP losses are those of the 
+    socket receive buffer.
+    """
+
+    results  :Dict[str, Any]  = {}
+
+    for transport in transports:
+        server  = MOSOSC()
+        server.enablePathLogging          = False
+        server.serverWorkerBlockWhenFull  = True
+
+        latencies   :List[float]      = []
+        receivedAt  :List[float]      = [0]
+        done        :threading.Event  = threading.Event()
+
+        def  handler(event:OSCEvent):
+            latencies.append((time.perf_counter_ns() - event.oscArgs[0]) / 1000)
+            receivedAt[0] = time.perf_counter()
+            if  len(latencies) >= messageCount:  done.set()
+
+        server.createServer(port=port, serverMode=ServerMode.WORKERPOOL, transport=transport)
+        server.addEventHandler("/payload", handler)
+
+        serverThread = threading.Thread(target=server.startServer, daemon=True)
+        serverThread.start()
+        time.sleep(0.5)
+
+        client = MOSOSC()
+        client.enablePathLogging = False
+        client.createClient(port=port, transport=transport)
+
+        transportResults  :Dict[int, Any]  = {}
+
+        for payloadSize in payloadSizes:
+            payload     = os.urandom(payloadSize)
+            sendErrors  = 0
+
+            latencies.clear()
+            done.clear()
+
+            timeStart = time.perf_counter()
+
+            for _ in range(messageCount):
+                try:
+                    client.messageSend("/payload", time.perf_counter_ns(), payload)
+                except  OSError:
+                    sendErrors += 1
+
+            done.wait(timeout=3)
+            time.sleep(0.1)
+
+            received  = len(latencies)
+            elapsed   = max(receivedAt[0] - timeStart, 1e-9)
+            latencies.sort()
+
+            transportResults[payloadSize] = {
+                    "received"            : received,
+                    "lost"                : messageCount - received,
+                    "sendErrors"          : sendErrors,
+                    "megabytesPerSecond"  : (received * payloadSize) / elapsed / (1 << 20)  if received else 0,
+                    "latencyMedianUsec"   : latencies[received // 2]  if received else 0,
+                    "latencyP99Usec"      : latencies[int(received * 0.99)]  if received else 0,
+                  }
+
+        #
+        server.stopServer()
+        serverThread.join(timeout=5)
+        server.destroyServer()
+        client.destroyClient()
+
+        results[transport.value] = transportResults
+
+    log.info(dump.dicto(results, title="Large payload benchmark"))
+
+    return  results
+
+#ENDDEF -- testLargePayloadBenchmark()
+
+
+
+
+#----------------------------------------- -o--
+# Main, for testing.
+
+if  "__main__" == __name__:
+    testRoutingTableEquivalence()
+    testRoutingTableBenchmark()
+    testMessageTemplateBenchmark()
+    testBatchSendBenchmark()
+    testBundleSchedulerJitter()
+    testEventHandlerBenchmark()
+    testPostOSCArgsBenchmark()
+    testBundleNodeBenchmark()
+    testTransportBenchmark()
+    testLargePayloadBenchmark()
+
+    for mode in ServerMode:
+        testServerModeBenchmark(mode)
+
+    sys.exit(0)
 
@@ -37,10 +37,26 @@
         * cmixHostname
         * cmixPort
         * cmixOSCPath          
+        * cmixScriptMaximumBytes
+
+        * cmixWorkerPoolSize
+        * cmixWorkerPoolHealthCheckInSeconds
+        * enableCMIXWorkerPool
+
+        * mincCache
+
+        * cmixHelperWireFormat
+        * cmixHelperCompactMinC
+
+
+    MODULE PUBLIC CLASSES--
+        * CMIXWorkerPool
+        * MinCCache
 
 
     MODULE PROTECTED ATTRIBUTES--
         * _cmixHelperVersion1  
+        * _cmixHelperVersion2  
         * _lengthOfOSCDataCommonList  
         * _defaultCMIXUndefined  
 
@@ -48,13 +64,27 @@
         * _createCommonList()
         * _createOSCDataObject()
         * _convertOSCInputToMinCList()
+        * _mincFreeList()
+        * _mincCommonList()
+        * _mincOSCDataCandidate()
         * _mincFormatFromOSCArgs()
+        * _mainDirectiveFromOSCArgs()
+
+        * _encodeOSCDataCompact()
+        * _decodeOSCDataCompact()
+        * _convertOSCDataCompactToMinCList()
 
 
     MODULE TEST FUNCTIONS--
         * testSendNormalOSCMessagesToScoreEnabledWithOSCData()
         * testSendCMIXOSCMessagesToScoreEnabledWithOSCData()
         * testSendNormalAndCMIXMessages()
+        * testConvertOSCInputToMinCListEquivalence()
+        * testConvertOSCInputToMinCListBenchmark()
+        * testMinCCache()
+        * testOSCDataCompactRoundTrip()
+        * testBundleToCMIX()
+        * testCMIXRunsDirectivesFromStdin()
 
 
     ASSUME  CMIX executable is accessible to subprocess.Popen() and os.system().
@@ -86,16 +116,25 @@ version  :str  = "0.2"   #RELEASE
 #----------------------------------------- -o--
 # Modules.
 
+import copy
+import collections
+import marshal
 from subprocess import Popen
+import random
+import socket
+import struct
 import subprocess
 import sys
+import threading
 import time
-from typing import Any, List, Tuple, Union
+from typing import Any, Callable, Dict, List, Tuple, Union
 
 
 #
 from pythonosc.osc_message_builder import OscMessageBuilder
 from pythonosc.osc_bundle_builder import OscBundleBuilder
+from pythonosc import osc_bundle
+from pythonosc import osc_message
 
 
 #
@@ -125,6 +164,69 @@ cmixHostname    :str  = "127.0.0.1"
 cmixPort        :int  = 7777                      
 cmixOSCPath     :str  = "/RTcmix/ScoreCommands"  
 
+cmixScriptMaximumBytes  :int  = 32768       #DEFAULT
+    # Largest MinC script sent to CMIX in one OSC message when a bundle is 
+    #   flattened by MOSRTcmix.send().  Larger scripts are split between 
+    #   main() directives.  Keep well below UDP datagram size limits.
+
+
+# The following attributes configure CMIXWorkerPool, which is used by 
+#   MOSRTcmix.invokeCMIXWithOSCData() when CMIX build does NOT enable OSC.
+#
+cmixWorkerPoolSize                  :int    = 4     #DEFAULT
+cmixWorkerPoolHealthCheckInSeconds  :float  = 1.0   #DEFAULT
+    # Set to zero (0) to disable periodic health checks.  
+    # Workers are always checked before they are used.
+
+enableCMIXWorkerPool  :bool  = False                #DEFAULT
+    # Opt in to CMIXWorkerPool.  createCMIXWorkerPool() fails unless True.
+    #
+    # The pool ASSUMES CMIX runs each MinC directive as it arrives on stdin,
+    #   while stdin remains open.  This is NOT VERIFIED for every CMIX build.
+    #   A CMIX that reads the score to EOF before running it never plays
+    #   directives sent to the pool.  Set True only once 
+    #   testCMIXRunsDirectivesFromStdin() passes with the local CMIX.
+
+
+
+
+# mincCache holds MinC main() directives generated from OSC path and args.
+#   Used by MOSRTcmix._sendOSCArgsToCMIX() and invokeCMIXWithOSCData().
+#   See MinCCache.  Set mincCache.maximumSize to zero (0) to disable.
+#
+mincCacheSize  :int  = 1024                         #DEFAULT
+    # Initial maximumSize of mincCache.  
+
+# NB  mincCache is defined after class MinCCache, below.
+
+
+# cmixHelperWireFormat selects how cmixMessage*() encode OSCData for OSC.
+#   "cmix1" (DEFAULT) -- One nested list per OSCData object:
+#                           [ label, [free_list], [common_list] ]
+#   "cmix2"           -- Compact and typed.  Three arguments per OSCData object:
+#                           label, [free_list], common_blob
+#                        common_blob packs defined common values as float32,
+#                        after a one byte mask of which are defined.  
+#                        Common values are rounded to float32, and integral
+#                        values are decoded as int, so the MinC text for
+#                        common values may differ from that of cmix1.
+#                        (440.0 becomes 440, 0.1 becomes 0.10000000149011612.)
+#                        It is OSC False if there is no common list.
+#                        The first label is sent empty.
+#                        See _encodeOSCDataCompact().
+#
+# Both are decoded by the Python OSC server into MinC, per cmixHelper.sco.
+#   RTcmix OSC input accepts only score text, so OSCData always reaches 
+#   CMIX as MinC.  cmix2 makes packets smaller between Python processes.
+#
+cmixHelperWireFormat  :str  = "cmix1"               #DEFAULT
+
+cmixHelperCompactMinC  :bool  = False               #DEFAULT
+    # If True, cmix2 input is delivered to main() as one flat MinC list
+    #   of (label, free list, common list) triples, which the score must 
+    #   read with parseOSCDataCompact() instead of parseOSCData().  
+    #   See cmix/cmixHelper.sco.
+
 
 
 
@@ -132,8 +234,15 @@ cmixOSCPath     :str  = "/RTcmix/ScoreCommands"
 # Module protected attributes.
 
 _cmixHelperVersion1  :str  = "cmix1"    #XXX
+_cmixHelperVersion2  :str  = "cmix2"    #XXX
         # Shared between OSC message creation and message conversion functions.
 
+_commonListCompactFields  :List[str]  = [ "start", "dur", "amp", "freq", "pan" ]
+    # Order of common list values, and of bits in cmix2 common_blob mask.
+
+_commonBlobPresent  :int  = 0x80
+    # Bit always set in cmix2 common_blob mask, so that blob is never empty.
+
 _lengthOfOSCDataCommonList  :int  = 5   #XXX
 
 _defaultCMIXUndefined  :int  = -1       #XXX
@@ -150,15 +259,21 @@ class MOSRTcmix(mosOSC.MOSOSC):
         * cmixMessageSend()    
 
         * send()
+        * batchSend()
 
         * sendScoreToCMIX()        -- For OSC client when CMIX build does enable OSC.
         * sendMinCToCMIX()
 
         * invokeCMIXWithOSCData()  -- For OSC server when CMIX build does NOT enable OSC.
+        * createCMIXWorkerPool()
+        * destroyCMIXWorkerPool()
 
 
     CLASS PROTECTED METHODS--
         * _sendOSCArgsToCMIX()
+        * _sendBundleToCMIX()
+        * _flattenBundleContents()
+        * _sendScriptsToCMIX()
 
     """
 
@@ -184,6 +299,14 @@ class MOSRTcmix(mosOSC.MOSOSC):
 
 
 
+    #----------------------------------------------- -o--
+    # Class protected attributes.
+
+    _cmixWorkerPool  :"CMIXWorkerPool"  = None
+        # Defined by createCMIXWorkerPool().  Used by invokeCMIXWithOSCData().
+
+
+
 
     #----------------------------------------------- -o--
     # Class public methods.
@@ -223,8 +346,14 @@ class MOSRTcmix(mosOSC.MOSOSC):
         oscData = _createOSCDataObject(oscPath, freeListArgs, commonListDict=commonList)
 
         messageList.append(oscPath)
-        messageList.append(_cmixHelperVersion1)
-        messageList.append(oscData)
+
+        if  _cmixHelperVersion2 == cmixHelperWireFormat:
+            oscData[0] = ""                                 # NB  Replaced by OSC path on receipt.
+            messageList.append(_cmixHelperVersion2)
+            messageList.extend(_encodeOSCDataCompact([oscData]))
+        else:
+            messageList.append(_cmixHelperVersion1)
+            messageList.append(oscData)
 
         #
         if  sendMessageNow:
@@ -256,7 +385,11 @@ class MOSRTcmix(mosOSC.MOSOSC):
         #
         self._validateOSCPath(messageList[0])
         oscData  = _createOSCDataObject(label, *freeListArgs, commonListDict=commonList)
-        messageList.append(oscData)
+
+        if  (len(messageList) > 1)  and  (_cmixHelperVersion2 == messageList[1]):
+            messageList.extend(_encodeOSCDataCompact([oscData]))
+        else:
+            messageList.append(oscData)
 
         #
         return  messageList
@@ -276,7 +409,7 @@ class MOSRTcmix(mosOSC.MOSOSC):
 
     #                                                                    -o-
     def  send( self, 
-               messageListOrBundleBuilder  :Union[List[Any], OscBundleBuilder],
+               messageListOrBundleBuilder  :Union[List[Any], OscBundleBuilder, mosOSC.OSCBundleNode],
              ) -> None:
         """
         RTcmix version of send() to handle two cases: whether or not CMIX build enables OSC.
@@ -289,7 +422,9 @@ class MOSRTcmix(mosOSC.MOSOSC):
           OSC args are converted locally to MinC before being sent to CMIX directly.
 
         NB  When mosRTcmix.cmixBuildEnablesOSC is True...
-                . OSC bundles are not supported.
+                . OSC bundles are flattened into MinC scripts of main() 
+                    directives, one script per timetag.  Timetags are 
+                    honored by the client.  See _sendBundleToCMIX().
                 . MUST USE designated CMIX port on localhost.
         """
 
@@ -311,8 +446,8 @@ class MOSRTcmix(mosOSC.MOSOSC):
 
 
         #
-        if  isinstance(messageListOrBundleBuilder, OscBundleBuilder):
-            log.error("CMIX-style OSC server DOES NOT SUPPORT BUNDLES.  DROPPING bundle message...")
+        if  isinstance(messageListOrBundleBuilder, (OscBundleBuilder, mosOSC.OSCBundleNode)):
+            self._sendBundleToCMIX(messageListOrBundleBuilder)
             return
 
 
@@ -323,6 +458,36 @@ class MOSRTcmix(mosOSC.MOSOSC):
 
 
 
+    #                                                                    -o-
+    def  batchSend( self, 
+                    *messageListOrBundleBuilder  :Tuple[Union[ List[Any], OscBundleBuilder, 
+                                                              mosOSC.OSCBundleNode, mosOSC.OSCMessageTemplate ]],
+                  ) -> int:
+        """
+        RTcmix version of batchSend().
+
+        If mosRTcmix.cmixBuildEnablesOSC is False, then use MOSOSC.batchSend().
+
+        Otherwise, each messageList or bundle is sent by send(), so it is 
+          translated for CMIX and bundle timetags are honored by the client.
+          Templates are sent as they are, by MOSOSC.batchSend().
+
+        RETURNS  Number of messageLists, bundles and templates sent.
+        """
+
+        if  not cmixBuildEnablesOSC:
+            return  super().batchSend(*messageListOrBundleBuilder)
+
+        for obj in messageListOrBundleBuilder:
+            if  isinstance(obj, mosOSC.OSCMessageTemplate):
+                super().batchSend(obj)
+            else:
+                self.send(obj)
+
+        return  len(messageListOrBundleBuilder)
+
+
+
     #                                                                    -o-
     def  sendScoreToCMIX( self,
                           cmixScore  :str
@@ -382,14 +547,18 @@ include  {cmixScore}
         """
         Used by OSC server to support CMIX when CMIX is NOT built to support CMIX-style OSC.
 
-        Each incoming OSC message triggers a new process that receives MinC directives on stdin
+        If a CMIXWorkerPool was created for cmixScore (see createCMIXWorkerPool()), 
+        then the OSC message is sent as a main() directive to a long-lived CMIX 
+        process which has already read the score.
+
+        Otherwise, each incoming OSC message triggers a new process that receives MinC directives on stdin
         instructing CMIX to read the score (via include) then execute score template main() which,
         in turn, passes OSC arguments to CMIX in format defined by MinC OSCData struct.
         
         NB  Missing executable raises exception.  
         """
 
-        mincFormat         :str  = None
+        mainDirective      :str  = None
         miniScore          :str  = None
         miniScoreInBinary  :str  = None
 
@@ -404,14 +573,24 @@ include  {cmixScore}
             log.critical("One or more input args INCORRECT.")
 
 
-        # Create MinC version of OSC args.
-        # Create a string to invoke score and send OSC args via main().
+        # Create MinC version of OSC args, wrapped in main().
+        #
+        mainDirective = _mainDirectiveFromOSCArgs(oscPath, oscArgs)
+
+
+        # Prefer long-lived CMIX processes, when available for this score.
         #
-        mincFormat = _mincFormatFromOSCArgs(oscPath, oscArgs)
+        if       self._cmixWorkerPool                           \
+            and  (self._cmixWorkerPool.cmixScore == cmixScore):
+            self._cmixWorkerPool.submit(mainDirective)
+            return
 
+
+        # Create a string to invoke score and send OSC args via main().
+        #
         miniScore =         f"""
 include  {cmixScore}
-main( {mincFormat} )    
+{mainDirective}    
                             """
 
         miniScoreInBinary = miniScore.encode('ascii')
@@ -434,6 +613,48 @@ main( {mincFormat} )
     #ENDDEF -- invokeCMIXWithOSCData
 
 
+    #                                                                    -o-
+    def  createCMIXWorkerPool( self,
+                               cmixScore  :str,
+                               poolSize   :int  = None,
+                             )  -> "CMIXWorkerPool":
+        """
+        Used by OSC server when CMIX is NOT built to support CMIX-style OSC.
+
+        Start poolSize long-lived CMIX processes, each of which reads cmixScore 
+        once.  Thereafter, invokeCMIXWithOSCData() with the same cmixScore 
+        sends main() directives to the pool instead of running CMIX once 
+        per OSC message.
+
+        poolSize DEFAULTS to mosRTcmix.cmixWorkerPoolSize.
+
+        NB  Requires mosRTcmix.enableCMIXWorkerPool.  See its comment.
+        """
+
+        if  not enableCMIXWorkerPool:
+            log.critical(  "CMIX worker pool is NOT ENABLED.  "
+                           "Set mosRTcmix.enableCMIXWorkerPool once testCMIXRunsDirectivesFromStdin() passes." )
+
+        if  self._cmixWorkerPool:
+            log.critical("CMIX worker pool is ALREADY CREATED.")
+
+        self._cmixWorkerPool = CMIXWorkerPool(cmixScore, poolSize)
+        self._cmixWorkerPool.start()
+
+        return  self._cmixWorkerPool
+
+
+    #                                                                    -o-
+    def  destroyCMIXWorkerPool(self)  -> None:
+        if  not self._cmixWorkerPool:
+            log.warning("CMIX worker pool is already UNDEFINED.")
+            return
+
+        self._cmixWorkerPool.stop()
+        self._cmixWorkerPool = None
+
+
+
 
 
     #----------------------------------------------- -o--
@@ -462,10 +683,10 @@ main( {mincFormat} )
 
 
         #
-        mincFormat  :str  = _mincFormatFromOSCArgs(oscPath, oscArgs)
+        mainDirective  :str  = _mainDirectiveFromOSCArgs(oscPath, oscArgs)
 
-        miniScore   :str  = f"""
-main( {mincFormat} )
+        miniScore      :str  = f"""
+{mainDirective}
                             """
 
         #
@@ -473,346 +694,1020 @@ main( {mincFormat} )
         super().send(msgToSend)
 
 
-#ENDCLASS -- MOSRTcmix()
+    #                                                                    -o-
+    def  _sendBundleToCMIX( self,
+                            bundleBuilder  :Union[OscBundleBuilder, mosOSC.OSCBundleNode],
+                          ) -> None:
+        """
+        Used by OSC client when CMIX build enables "CMIX-style" OSC.
 
+        CMIX-style OSC server does not read bundles.  Instead, flatten bundle 
+        (and nested bundles) into MinC scripts, one per distinct timetag.  
+        Each script is a sequence of main() directives, one per OSC message,
+        in bundle order, and is sent to CMIX as a single OSC message.
 
+        Messages addressed to cmixOSCPath are passed through as score text.
 
+        Scripts without timetag, or whose time has passed, are sent 
+        immediately.  Later scripts are held by the client until their 
+        timetag, since CMIX does not honor timetags.  
+        See MOSOSC._scheduleSend().
+        """
 
-#----------------------------------------------- -o--
-# Module protected functions.
+        scriptsByTimestamp  :Dict[float, List[str]]  = {}
+        timeNow             :float                   = None
 
-#                                                                    -o-
-def  _createCommonList(  start  :float  = _defaultCMIXUndefined,
-                         dur    :float  = _defaultCMIXUndefined,
-                         amp    :float  = _defaultCMIXUndefined,
-                         freq   :float  = _defaultCMIXUndefined,
-                         pan    :float  = _defaultCMIXUndefined,
-                      )  -> dict:
-    commonList  :dict  = { "start"  : start,
-                           "dur"    : dur,
-                           "amp"    : amp,
-                           "freq"   : freq,
-                           "pan"    : pan,
-                        }
-    return  commonList
 
+        #
+        self._flattenBundleContents(bundleBuilder._contents, bundleBuilder._timestamp, scriptsByTimestamp)
 
-#                                                                    -o-
-def  _createOSCDataObject(  label           :str,
-                            freeListArgs    :Tuple[Any],
-                            commonListDict  :dict         = None,
-                         )  -> list:
-    """
-    NB  Removes instances of None from freeListArgs.
+        if  len(scriptsByTimestamp) <= 0:
+            log.warning("Bundle contains NO MESSAGES.  Nothing sent to CMIX.")
+            return
 
-    NB  commonListDict may be literal dictionary with a partial set of keys.
-        Unmentioned keys will be sent as defaults.
-    """
 
-    freeList    = []
-    oscData     = [ label ]
+        #
+        timeNow = mosOSC.OSCBundleScheduler.timestampNow()
 
-    #
-    if  not isinstance(label, str):
-        log.critical(f"label IS NOT a String.  ({label})")
+        for timestamp in sorted(scriptsByTimestamp):
+            if  timestamp <= timeNow:
+                self._sendScriptsToCMIX(scriptsByTimestamp[timestamp])
+            else:
+                self._scheduleSend(timestamp, self._sendScriptsToCMIX, scriptsByTimestamp[timestamp])
 
-    if       not isinstance(freeListArgs, (Tuple,List))   \
-        and  freeListArgs is not None:
-        log.critical(f"freeListArgs IS NOT a Tuple or List.  ({freeListArgs})")
 
+    #                                                                    -o-
+    def  _flattenBundleContents( self,
+                                 bundleContents      :List[Union[osc_message.OscMessage, osc_bundle.OscBundle]],
+                                 timestamp           :float,
+                                 scriptsByTimestamp  :Dict[float, List[str]],
+                               ) -> None:
+        """
+        Collect main() directive (or score text) of each message under its 
+        bundle timestamp.  Nested bundle timestamps are never earlier than 
+        their enclosing bundle, per OSC standard.
+        """
 
-    #
-    if  freeListArgs is not None:
-        for arg in freeListArgs:
-            if  None is arg:  continue 
-            freeList.append(arg)
+        for content in bundleContents:
+            if  isinstance(content, osc_bundle.OscBundle):
+                self._flattenBundleContents(content._contents, max(timestamp, content._timestamp), scriptsByTimestamp)
+                continue
 
-    oscData.append(freeList)
+            #
+            if  cmixOSCPath == content.address:
+                directive = "\n".join([ str(_) for _ in content.params ])
+            else:
+                directive = _mainDirectiveFromOSCArgs(content.address, content.params)
 
-    if  commonListDict:
-        completeList = _createCommonList(**commonListDict)
-        oscData.append( list(completeList.values()) )
+            if  None is directive:
+                log.error(f"DROPPING bundle message which cannot be converted to MinC.  ({content.address})")
+                continue
 
+            scriptsByTimestamp.setdefault(timestamp, []).append(directive)
 
-    #
-    return  oscData
 
+    #                                                                    -o-
+    def  _sendScriptsToCMIX( self,
+                             directives  :List[str],
+                           ) -> None:
+        """
+        Send directives to CMIX in as few OSC messages as 
+        cmixScriptMaximumBytes allows.
+        """
 
-#                                                                    -o-
-def  _convertOSCInputToMinCList(oscPath:str, oscArgs:List[Any])  -> str:
-    """
-    Convert incoming OSC message into CMIX MinC list format which is then
-    read (in CMIX) by parseOSCData() which, in turn, creates a list of
-    struct OSCData objects as defined by cmix/cmixHelper.sco.
+        script      :List[str]  = []
+        scriptSize  :int        = 0
 
-    If the first token is "cmix1" (for cmixHelper, v1), then ASSUME
-    each following list represents a candidate MinC struct OSCData
-    object.  By design, the path token in the first object is left
-    blank, then overwritten with the OSC path.  All list objects must
-    have a form analogous to OSCData:
+        if  not self._client:
+            log.warning("Client is UNDEFINED.  DROPPING MinC script for CMIX.")
+            return
 
-        [ "path-or-label", [free_list], [common_list] ]
+        #
+        for directive in directives:
+            if  (scriptSize + len(directive) > cmixScriptMaximumBytes)  and  (len(script) > 0):
+                super().send([cmixOSCPath, "\n".join(script)])
+                script      = []
+                scriptSize  = 0
 
-    ...where the two lists are optional, per cmix/cmixHelper.sco.  If
-    free_list is empty, but common_list is not, then free_list must still
-    be given as an empty list to mark its place.
+            script.append(directive)
+            scriptSize += len(directive) + 1
 
-    Otherwise, when cmixHelper token is not used, all items are
-    encapsulated into a single Free List within a single MinC struct
-    OSCData object.
+        super().send([cmixOSCPath, "\n".join(script)])
 
-    For either method, encapsulate the final result in one more list,
-    delivering a single list to the score environment.
 
-    Be flexible with processing errors by tossing smallest broken
-    unit, in case adjacent elements can be salvaged.
+#ENDCLASS -- MOSRTcmix()
 
-    NB  Handles limited types, a common subset of both OSC and
-          MinC types: float, string, list.  Lists may be nested.
+
+
+
+#----------------------------------------------- -o--
+class  CMIXWorkerPool:
     """
+    Managed pool of long-lived CMIX processes, for use by OSC server 
+    when CMIX is NOT built to support CMIX-style OSC.
 
-    # Internal functions.
-    #   * convertPythonFreeList()
-    #   * convertPythonCommonList()
-    #   * convertPythonOSCDataCandidate()
-    #
+    Each process reads the score once (via include), then receives one 
+    MinC directive per OSC message on stdin -- typically main( ... ).
+    Directives are distributed to processes round-robin.
 
-    def  convertPythonFreeList(pList:List)  -> str:
-        mincList      :str   = ""
-        commaSpace    :str   = ""
-        isFirstToken  :bool  = True
+    Processes that exit or whose stdin is broken are restarted 
+    before the next directive is sent, and periodically by a
+    health check thread (see cmixWorkerPoolHealthCheckInSeconds).
 
-        for  elem  in pList:
-            if  isinstance(elem, list):
-                mincList += commaSpace + convertPythonFreeList(elem)
 
-            elif  isinstance(elem, str):
-                mincList += commaSpace + f"\'{elem}\'" 
+    PUBLIC METHODS--
+        * start()
+        * stop()
+        * submit()
+        * healthCheck()
 
-            else:
-                mincList += commaSpace + f"{elem}"   #XXX
-            
-            if  isFirstToken:
-                commaSpace = ", "
-                isFirstToken = False
+    PUBLIC ATTRIBUTES--
+        * cmixScore
+        * poolSize
+        * restartCount
 
-        return  "{" + mincList + "}"
-    #ENDDEF -- convertPythonFreeList
 
+    ASSUME  CMIX executes MinC directives as they arrive on stdin.
+              NOT VERIFIED for every CMIX build, so the pool is created 
+              only if enableCMIXWorkerPool is True.  
+              See testCMIXRunsDirectivesFromStdin().
+    ASSUME  CMIX executable is accessible to subprocess.Popen().
+    """
 
-    def  convertPythonCommonList(pList:List)  -> Union[str,None]:
-        mincList      :str   = ""
-        commaSpace    :str   = ""
-        isFirstToken  :bool  = True
 
-        #
-        if      not isinstance(pList, list)   \
-            or  len(pList) != _lengthOfOSCDataCommonList:
 
-            log.error(f"Common list candidate DOES NOT EXIST or IS WRONG LENGTH.  ({pList})")
-            return  None
+    #----------------------------------------------- -o--
+    # Lifecycle.
 
-        for  elem  in pList:
-            if  not z.isNumber(elem):
-                log.error(f"Common list candidate contains non-numeric values.  ({pList})")
-                return  None
+    #                                                                    -o-
+    def  __init__( self,
+                   cmixScore        :str,
+                   poolSize         :int   = None,
+                   cmixProcessArgs  :List  = None,
+                 ):
 
-            mincList += commaSpace + f"{elem}"
+        if  not poolSize:         poolSize         = cmixWorkerPoolSize
+        if  not cmixProcessArgs:  cmixProcessArgs  = ["CMIX"]
 
-            if  isFirstToken:
-                commaSpace = ", "
-                isFirstToken = False
+        if      not isinstance(cmixScore, str)   \
+            or  (len(cmixScore) <= 0):
+            log.critical("cmixScore is INVALID.")
 
-        #
-        return  "{" + mincList + "}"
-    #ENDDEF -- convertPythonCommonList
+        if  not isinstance(poolSize, int)  or  (poolSize < 1):
+            log.critical(f"poolSize MUST BE a positive integer.  ({poolSize})")
 
 
-    def  convertPythonOSCDataCandidate(pList:list)  -> Union[str,None]:
-        mincList      :str   = ""
-        commaSpace    :str   = ", "
+        #
+        self.cmixScore     :str  = cmixScore
+        self.poolSize      :int  = poolSize
+        self.restartCount  :int  = 0
 
-        candidateCommonString  :str  = None
+        self._cmixProcessArgs  :List                    = cmixProcessArgs
+        self._workers          :List[Popen]             = [None] * poolSize
+        self._workerLocks      :List[threading.Lock]    = [threading.Lock() for _ in range(poolSize)]
+        self._nextWorker       :int                     = 0
+        self._nextWorkerLock   :threading.Lock          = threading.Lock()
 
+        self._isRunning          :bool              = False
+        self._healthCheckThread  :threading.Thread  = None
+        self._healthCheckStop    :threading.Event   = threading.Event()
 
-        #                                       
-        if  not isinstance(pList, list):        # Candidate is not a list.
-            log.error(f"Skipping candidate -- DOES NOT CONFORM to MinC struct OSCData.  ({pList})")
-            return  None
 
-        if  len(pList) <= 0:                    # Candidate is empty list.
-            log.error("Skipping EMPTY LIST.")
-            return  None
 
+    #----------------------------------------------- -o--
+    # Public methods.
 
-        #
-        if  not isinstance(pList[0], str):      # Required element: path or label.
-            log.error(f"Candidate DOES NOT LEAD with string.  Inserting empty string.  ({pList[0]})")
-            mincList += "\'\'"
-        else: 
-            mincList += f"\'{pList[0]}\'"
-            pList.pop(0)
+    #                                                                    -o-
+    def  start(self)  -> None:
+        if  self._isRunning:
+            log.warning("CMIX worker pool is ALREADY RUNNING.")
+            return
 
+        for index in range(self.poolSize):
+            with  self._workerLocks[index]:
+                self._workers[index] = self._spawnWorker()
 
-        #                                       # First optional element is missing or is not a list.
-        if      (len(pList) <= 0)   \
-            or  not isinstance(pList[0], list):     
+        self._isRunning = True
 
-            if  len(pList) > 0:
-                log.error(f"Candidate DOES NOT CONTAIN Free List.  Ignore remaining elements.  ({pList})")
+        if  cmixWorkerPoolHealthCheckInSeconds > 0:
+            self._healthCheckStop.clear()
+            self._healthCheckThread = threading.Thread(target=self._healthCheckLoop, daemon=True)
+            self._healthCheckThread.start()
 
-            return "{" + mincList + "}"
+        log.info(f"Started {self.poolSize} CMIX worker(s) with score \"{self.cmixScore}\".")
 
-                                                # First optional element: Free list.
-        mincList += commaSpace + convertPythonFreeList(pList[0])
-        pList.pop(0)
 
+    #                                                                    -o-
+    def  stop(self, timeoutInSeconds:float=5.0)  -> None:
+        """
+        Close stdin of each CMIX process, allowing it to finish pending 
+        directives.  Processes still running after timeoutInSeconds are killed.
+        """
 
-        #                                       # Second optional element is missing or is not a list.
-        if      (len(pList) <= 0)   \
-            or  not isinstance(pList[0], list):     
+        if  not self._isRunning:
+            log.warning("CMIX worker pool is ALREADY STOPPED.")
+            return
 
-            if  len(pList) > 0:
-                log.error(f"Candidate DOES NOT CONTAIN Common List.  Ignore remaining elements.  ({pList})")
+        self._isRunning = False
+        self._healthCheckStop.set()
 
-            return "{" + mincList + "}"
+        if  self._healthCheckThread:
+            self._healthCheckThread.join()
+            self._healthCheckThread = None
 
-                                                # Second optional element: Common list.
-        candidateCommonString  = convertPythonCommonList(pList[0])
-        if  candidateCommonString:
-            mincList += commaSpace + candidateCommonString
-        pList.pop(0)
+        for index in range(self.poolSize):
+            with  self._workerLocks[index]:
+                self._stopWorker(self._workers[index], timeoutInSeconds)
+                self._workers[index] = None
 
-        if  len(pList) > 0:
-            log.error(f"Candidate CONTAINS EXTRA DATA.  Ignore remaining elements.  ({pList})")
+        log.info(f"Stopped CMIX workers with score \"{self.cmixScore}\".")
 
-        return "{" + mincList + "}"
-    #ENDDEF -- convertPythonOSCDataCandidate
 
+    #                                                                    -o-
+    def  submit(self, mincDirective:str)  -> bool:
+        """
+        Send mincDirective to the next CMIX process in the pool.
 
+        RETURNS  True if directive was written to a CMIX process, False otherwise.
 
-    # Parse OSC input.
-    #
-    mincList         :str   = ""
-    commaSpace       :str   = ", "
-    isOSCDataFormat  :bool  = False
+        Dead processes are restarted and the write retried once.
+        """
 
-    if  len(oscArgs) > 0:
-        isOSCDataFormat  = (_cmixHelperVersion1 == oscArgs[0])
+        index  :int  = -1
 
-        if  isOSCDataFormat:
-            oscArgs.pop(0)
+        #
+        if  not self._isRunning:
+            log.error("CMIX worker pool is NOT RUNNING.  DROPPING directive...")
+            return  False
 
+        if  not isinstance(mincDirective, str):
+            log.error(f"mincDirective is INVALID.  ({mincDirective})")
+            return  False
 
-    #
-    mincList += "{" + f"\'{oscPath}\'"
+        with  self._nextWorkerLock:
+            index = self._nextWorker
+            self._nextWorker = (self._nextWorker + 1) % self.poolSize
 
-    if  len(oscArgs) <= 0:              # Partial OSCData -- path only.
-        mincList += "}"
+        directiveInBinary  = (mincDirective + "\n").encode('ascii')
 
-    elif  not isOSCDataFormat:          # Partial OSCData -- path + Free list.
-        mincList += ", " + convertPythonFreeList(oscArgs)
-        mincList += "}"
 
-    else:                               # Candidates for list of OSCData objects.
-        # Assign oscPath to leading string value of first OSCData candidate.
-        # (By hook or by crook.)
         #
-        if  not isinstance(oscArgs[0], list):
-            log.error(f"First candidate is not a list.  Prepending new list with OSC Path only.  ({oscArgs[0]})")
-            oscArgs.insert(0, [ oscPath ])
+        with  self._workerLocks[index]:
+            for attempt in range(2):
+                if  not self._isWorkerAlive(self._workers[index]):
+                    self._restartWorker(index)
 
-        else:
-            if  len(oscArgs[0]) <= 0:
-                log.error(f"First candidate is empty list.  Inserting OSC Path.  ({oscArgs[0]})")
-                oscArgs[0].insert(0, oscPath)
+                try:
+                    self._workers[index].stdin.write(directiveInBinary)
+                    self._workers[index].stdin.flush()
+                    return  True
 
-            elif  not isinstance(oscArgs[0][0], str):
-                log.error(f"First candidate is missing path placeholder.  Inserting OSC Path.  ({oscArgs[0]})")
-                oscArgs[0].insert(0, oscPath)
+                except Exception as e:
+                    log.warning(f"CMIX worker {index} FAILED on write.  ({e})")
+                    self._stopWorker(self._workers[index], 0)
+                    self._workers[index] = None
 
-            else:
-                oscArgs[0][0] = oscPath
+        log.error(f"CMIX worker {index} IS UNAVAILABLE.  DROPPING directive...")
+        return  False
 
-        # Convert list of candidates.
-        #
-        isFirstToken  :bool  = True
 
-        mincList    = ""
-        commaSpace  = ""
+    #                                                                    -o-
+    def  healthCheck(self)  -> int:
+        """
+        Restart any CMIX process that has exited.
 
-        for  oscDataCandidate  in oscArgs:
-            candidateString  :str  = None
+        RETURNS  Number of processes restarted.
+        """
 
-            candidateString  = convertPythonOSCDataCandidate(oscDataCandidate)
-            if  candidateString:
-                mincList += commaSpace + candidateString
+        restarted  :int  = 0
 
-            if  isFirstToken:
-                commaSpace = ", "
-                isFirstToken = False
+        if  not self._isRunning:  return 0
 
-    #ENDIF -- Conversions to (list of) OSCData inputs
+        for index in range(self.poolSize):
+            with  self._workerLocks[index]:
+                if  not self._isRunning:  break
 
+                if  not self._isWorkerAlive(self._workers[index]):
+                    self._restartWorker(index)
+                    restarted += 1
 
-    #
-    return  "{ " + mincList + " }"
+        return  restarted
 
-#ENDDEF -- _convertOSCInputToMinCList
 
 
-#                                                                    -o-
-def  _mincFormatFromOSCArgs( oscPath  :str, 
-                             oscArgs  :List[Any]
-                          )  -> str:
-    """
-    Generate MinC version of OSC args per CMIX struct OSCData.  
-      (See cmix/cmixHelper.sco.)
-    """
+    #----------------------------------------------- -o--
+    # Protected methods.
 
-    mincFormat  :str  = None
+    #                                                                    -o-
+    def  _spawnWorker(self)  -> Union[Popen, None]:
+        cmixProcess  :Popen  = None
 
-    #
-    try:
-        mincFormat  = _convertOSCInputToMinCList(oscPath, oscArgs)
-        #log.debug(mincFormat)   #DEBUG
+        miniScore  :str  = f"""
+include  {self.cmixScore}
+                        """
 
-    except Exception as e:
-        log.error(e)
-        return  None
+        try:
+            cmixProcess  = Popen( self._cmixProcessArgs, 
+                                  stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL )
+            cmixProcess.stdin.write(miniScore.encode('ascii'))
+            cmixProcess.stdin.flush()
 
-    return  mincFormat
+        except Exception as e:
+            log.error(e)
+            self._stopWorker(cmixProcess, 0)
+            return  None
 
+        return  cmixProcess
 
 
+    #                                                                    -o-
+    # ASSUME  Calling environment holds lock for index.
+    #
+    def  _restartWorker(self, index:int)  -> None:
+        if  self._workers[index]:
+            log.warning(f"CMIX worker {index} EXITED.  ({self._workers[index].returncode})  Restarting...")
 
-#----------------------------------------------- -o--
-# Testing.
+        self._stopWorker(self._workers[index], 0)
+        self._workers[index] = self._spawnWorker()
+        self.restartCount += 1
 
-#                                                                    -o-
-def  testSendNormalOSCMessagesToScoreEnabledWithOSCData(oscClient:MOSRTcmix)  -> None:
-    """
-    Test how a list of OSC messages is handled by MinC struct OSCData shared conventions.
-    Test range of MOSOSC message, excluding bundles.
 
-    /resetScore is a useful OSC path for test because it provides access to
-      the score, makes no sound and performs a simple atomic action.
+    #                                                                    -o-
+    def  _stopWorker(self, cmixProcess:Popen, timeoutInSeconds:float)  -> None:
+        if  not cmixProcess:  return
 
-    NB  mosRTcmix.cmixBuildEnablesOSC MUST be False.
-    """
-    log.mark()
+        try:
+            cmixProcess.stdin.close()
+        except Exception:
+            pass
 
-    
-    # Simple messages.
-    #
-    oscClient.messageSend("/resetScore")
+        try:
+            cmixProcess.wait(timeout=timeoutInSeconds)
+        except subprocess.TimeoutExpired:
+            cmixProcess.kill()
+            cmixProcess.wait()
 
-    oscClient.messageSend("/resetScore", "two", 1, 2, 3)
 
-    msg = oscClient.message("/resetScore")
-    msg = oscClient.messageAdd(msg, "two2", 1, 2, 3)
-    oscClient.send(msg)
-                #NB  Same as previous message.
+    #                                                                    -o-
+    def  _isWorkerAlive(self, cmixProcess:Popen)  -> bool:
+        return  (cmixProcess is not None)  and  (None is cmixProcess.poll())
+
+
+    #                                                                    -o-
+    def  _healthCheckLoop(self)  -> None:
+        while  not self._healthCheckStop.wait(cmixWorkerPoolHealthCheckInSeconds):
+            self.healthCheck()
+
+#ENDCLASS -- CMIXWorkerPool()
+
+
+
+
+#----------------------------------------------- -o--
+class  MinCCache:
+    """
+    Least-recently-used cache of MinC text generated from OSC path and args.
+
+    Sequencer traffic is repetitive -- a scale has few distinct notes, 
+    ornaments come from a fixed table -- so repeated OSC events skip 
+    conversion entirely.
+
+    Keys are (oscPath, variant, marshal.dumps(oscArgs)).  marshal serializes 
+    exactly the OSC argument types -- int, float, str, bool, bytes, None 
+    and nested lists or tuples of these -- and records the type of each 
+    value, so 1, 1.0, True and "1" are distinct keys.  It runs in C, so a 
+    key costs far less than the conversion it replaces.  Events containing
+    any other type raise ValueError in marshal and are not cached.
+    variant holds settings that change the text generated for the same 
+    event, such as cmixHelperCompactMinC, so changing them never returns 
+    text generated under another setting.
+
+    When maximumSize is reached, the least recently used entry is evicted.
+    maximumSize of zero (0) disables the cache.
+
+    NB  Errors logged while converting a malformed event are logged only
+          when the event is first converted.
+
+
+    PUBLIC METHODS--
+        * get()
+        * resize()
+        * clear()
+        * statistics()
+
+    PUBLIC ATTRIBUTES--
+        * maximumSize
+        * hits
+        * misses
+        * evictions
+    """
+
+    _MARSHAL_VERSION  :int  = 2
+        # No object references, so equal values usually serialize equally.
+        #   (A difference costs only a duplicate entry.)
+
+
+    #                                                                    -o-
+    def  __init__(self, maximumSize:int=None):
+        if  None is maximumSize:  maximumSize = mincCacheSize
+
+        self.maximumSize  :int  = 0
+        self.hits         :int  = 0
+        self.misses       :int  = 0
+        self.evictions    :int  = 0
+
+        self._entries  :collections.OrderedDict  = collections.OrderedDict()
+        self._lock     :threading.Lock           = threading.Lock()
+
+        self.resize(maximumSize)
+
+
+    #                                                                    -o-
+    def  get(  self, 
+               oscPath   :str, 
+               oscArgs   :List[Any], 
+               generate  :Callable[[str, List[Any]], str],
+               variant   :Any  = None,
+            )  -> str:
+        """
+        RETURNS  Cached text for (oscPath, variant, oscArgs), or the result of 
+                   generate(oscPath, oscArgs), which is cached unless None.
+
+        variant MUST distinguish every setting read by generate() that 
+          changes its result.  It must be hashable.
+        """
+
+        if  self.maximumSize <= 0:
+            return  generate(oscPath, oscArgs)
+
+        try:
+            key = (oscPath, variant, marshal.dumps(oscArgs, self._MARSHAL_VERSION))
+        except  ValueError:
+            return  generate(oscPath, oscArgs)
+
+        #
+        with self._lock:
+            text = self._entries.get(key)
+
+            if  None is not text:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return  text
+
+            self.misses += 1
+
+        text = generate(oscPath, oscArgs)
+
+        if  None is not text:
+            with self._lock:
+                self._entries[key] = text
+                self._evict()
+
+        return  text
+
+
+    #                                                                    -o-
+    def  resize(self, maximumSize:int)  -> None:
+        if  not isinstance(maximumSize, int)  or  (maximumSize < 0):
+            log.critical(f"maximumSize MUST BE a non-negative integer.  ({maximumSize})")
+
+        with self._lock:
+            self.maximumSize = maximumSize
+            self._evict()
+
+
+    #                                                                    -o-
+    def  clear(self)  -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits       = 0
+            self.misses     = 0
+            self.evictions  = 0
+
+
+    #                                                                    -o-
+    def  statistics(self)  -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+
+            return  { "maximumSize"  : self.maximumSize,
+                      "size"         : len(self._entries),
+                      "hits"         : self.hits,
+                      "misses"       : self.misses,
+                      "evictions"    : self.evictions,
+                      "hitRate"      : (self.hits / lookups)  if lookups  else 0.0,
+                    }
+
+
+    #                                                                    -o-
+    # ASSUME  Caller holds _lock.
+    #
+    def  _evict(self)  -> None:
+        while  len(self._entries) > self.maximumSize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+#ENDCLASS -- MinCCache()
+
+
+#
+mincCache  :MinCCache  = MinCCache()
+
+
+
+
+#----------------------------------------------- -o--
+# Module protected functions.
+
+#                                                                    -o-
+def  _createCommonList(  start  :float  = _defaultCMIXUndefined,
+                         dur    :float  = _defaultCMIXUndefined,
+                         amp    :float  = _defaultCMIXUndefined,
+                         freq   :float  = _defaultCMIXUndefined,
+                         pan    :float  = _defaultCMIXUndefined,
+                      )  -> dict:
+    commonList  :dict  = { "start"  : start,
+                           "dur"    : dur,
+                           "amp"    : amp,
+                           "freq"   : freq,
+                           "pan"    : pan,
+                        }
+    return  commonList
+
+
+#                                                                    -o-
+def  _createOSCDataObject(  label           :str,
+                            freeListArgs    :Tuple[Any],
+                            commonListDict  :dict         = None,
+                         )  -> list:
+    """
+    NB  Removes instances of None from freeListArgs.
+
+    NB  commonListDict may be literal dictionary with a partial set of keys.
+        Unmentioned keys will be sent as defaults.
+    """
+
+    freeList    = []
+    oscData     = [ label ]
+
+    #
+    if  not isinstance(label, str):
+        log.critical(f"label IS NOT a String.  ({label})")
+
+    if       not isinstance(freeListArgs, (Tuple,List))   \
+        and  freeListArgs is not None:
+        log.critical(f"freeListArgs IS NOT a Tuple or List.  ({freeListArgs})")
+
+
+    #
+    if  freeListArgs is not None:
+        for arg in freeListArgs:
+            if  None is arg:  continue 
+            freeList.append(arg)
+
+    oscData.append(freeList)
+
+    if  commonListDict:
+        completeList = _createCommonList(**commonListDict)
+        oscData.append( list(completeList.values()) )
+
+
+    #
+    return  oscData
+
+
+#                                                                    -o-
+def  _convertOSCInputToMinCList(oscPath:str, oscArgs:List[Any])  -> str:
+    """
+    Convert incoming OSC message into CMIX MinC list format which is then
+    read (in CMIX) by parseOSCData() which, in turn, creates a list of
+    struct OSCData objects as defined by cmix/cmixHelper.sco.
+
+    If the first token is "cmix2", decode the compact form into "cmix1"
+    candidates, then continue as below.  See _decodeOSCDataCompact().
+
+    If the first token is "cmix1" (for cmixHelper, v1), then ASSUME
+    each following list represents a candidate MinC struct OSCData
+    object.  By design, the path token in the first object is left
+    blank, then overwritten with the OSC path.  All list objects must
+    have a form analogous to OSCData:
+
+        [ "path-or-label", [free_list], [common_list] ]
+
+    ...where the two lists are optional, per cmix/cmixHelper.sco.  If
+    free_list is empty, but common_list is not, then free_list must still
+    be given as an empty list to mark its place.
+
+    Otherwise, when cmixHelper token is not used, all items are
+    encapsulated into a single Free List within a single MinC struct
+    OSCData object.
+
+    For either method, encapsulate the final result in one more list,
+    delivering a single list to the score environment.
+
+    Be flexible with processing errors by tossing smallest broken
+    unit, in case adjacent elements can be salvaged.
+
+    NB  Handles limited types, a common subset of both OSC and
+          MinC types: float, string, list.  Lists may be nested.
+
+    NB  oscArgs is not modified.  Output is assembled from lists of 
+          parts with str.join(), in one pass over the input.
+          Output and logged errors are checked against fixed expected
+          values by testConvertOSCInputToMinCListEquivalence().
+    """
+
+    argsCount        :int   = len(oscArgs)
+    argsStart        :int   = 0
+    isOSCDataFormat  :bool  = False
+
+    if  (argsCount > 0)  and  (_cmixHelperVersion2 == oscArgs[0]):
+        if  cmixHelperCompactMinC:
+            return  _convertOSCDataCompactToMinCList(oscPath, oscArgs)
+
+        oscArgs    = [ _cmixHelperVersion1 ] + _decodeOSCDataCompact(oscArgs[1:])
+        argsCount  = len(oscArgs)
+
+    if  argsCount > 0:
+        isOSCDataFormat  = (_cmixHelperVersion1 == oscArgs[0])
+
+        if  isOSCDataFormat:
+            argsStart = 1
+
+
+    #
+    if  argsCount <= argsStart:                 # Partial OSCData -- path only.
+        return  "{ {'" + oscPath + "'} }"
+
+    if  not isOSCDataFormat:                    # Partial OSCData -- path + Free list.
+        return  "{ {'" + oscPath + "', " + _mincFreeList(oscArgs) + "} }"
+
+
+    # Candidates for list of OSCData objects.
+    # Assign oscPath to leading string value of first OSCData candidate
+    #   by way of a new list.  (By hook or by crook.)
+    #
+    firstCandidate  = oscArgs[argsStart]
+
+    if  not isinstance(firstCandidate, list):
+        log.error(f"First candidate is not a list.  Prepending new list with OSC Path only.  ({firstCandidate})")
+        firstCandidate  = [ oscPath ]
+
+    else:
+        if  len(firstCandidate) <= 0:
+            log.error(f"First candidate is empty list.  Inserting OSC Path.  ({firstCandidate})")
+            firstCandidate  = [ oscPath ]
+
+        elif  not isinstance(firstCandidate[0], str):
+            log.error(f"First candidate is missing path placeholder.  Inserting OSC Path.  ({firstCandidate})")
+            firstCandidate  = [ oscPath ] + firstCandidate
+
+        else:
+            firstCandidate  = [ oscPath ] + firstCandidate[1:]
+
+        argsStart += 1
+
+
+    # Convert list of candidates.
+    # NB  Separator follows the first candidate even when it is skipped.
+    #
+    parts  :List[str]  = [ "{ " ]
+
+    candidateString  = _mincOSCDataCandidate(firstCandidate)
+    if  candidateString:
+        parts.append(candidateString)
+
+    for index in range(argsStart, argsCount):
+        candidateString  = _mincOSCDataCandidate(oscArgs[index])
+        if  candidateString:
+            parts.append(", ")
+            parts.append(candidateString)
+
+    parts.append(" }")
+
+    return  "".join(parts)
+
+#ENDDEF -- _convertOSCInputToMinCList
+
+
+#                                                                    -o-
+def  _mincFreeList(pList:List)  -> str:
+    """
+    Free list elements: list (recursive), string (quoted), other (str()).
+    """
+
+    parts  :List[str]  = []
+
+    for elem in pList:
+        elemType = type(elem)
+
+        if  (float is elemType)  or  (int is elemType):
+            parts.append(str(elem))
+        elif  isinstance(elem, list):
+            parts.append(_mincFreeList(elem))
+        elif  isinstance(elem, str):
+            parts.append("'" + elem + "'")
+        else:
+            parts.append(f"{elem}")   #XXX
+
+    return  "{" + ", ".join(parts) + "}"
+
+
+#                                                                    -o-
+def  _mincCommonList(pList:List)  -> Union[str,None]:
+    if      not isinstance(pList, list)   \
+        or  len(pList) != _lengthOfOSCDataCommonList:
+
+        log.error(f"Common list candidate DOES NOT EXIST or IS WRONG LENGTH.  ({pList})")
+        return  None
+
+    for elem in pList:
+        if  not isinstance(elem, (int, float)):         # NB  Same as z.isNumber().
+            log.error(f"Common list candidate contains non-numeric values.  ({pList})")
+            return  None
+
+    return  "{" + ", ".join(map(str, pList)) + "}"
+
+
+#                                                                    -o-
+def  _mincOSCDataCandidate(pList:list)  -> Union[str,None]:
+    """
+    Candidate form: [ "path-or-label", [free_list], [common_list] ]
+
+    NB  A candidate that does not lead with a string is labeled with an
+          empty string, and its first element is considered as free list.
+    """
+
+    if  not isinstance(pList, list):            # Candidate is not a list.
+        log.error(f"Skipping candidate -- DOES NOT CONFORM to MinC struct OSCData.  ({pList})")
+        return  None
+
+    listLength  = len(pList)
+
+    if  listLength <= 0:                        # Candidate is empty list.
+        log.error("Skipping EMPTY LIST.")
+        return  None
+
+
+    #
+    if  not isinstance(pList[0], str):          # Required element: path or label.
+        log.error(f"Candidate DOES NOT LEAD with string.  Inserting empty string.  ({pList[0]})")
+        parts  = [ "{''" ]
+        index  = 0
+    else: 
+        parts  = [ "{'", pList[0], "'" ]
+        index  = 1
+
+
+    #                                           # First optional element: Free list.
+    if  (index >= listLength)  or  not isinstance(pList[index], list):
+        if  index < listLength:
+            log.error(f"Candidate DOES NOT CONTAIN Free List.  Ignore remaining elements.  ({pList[index:]})")
+
+        parts.append("}")
+        return  "".join(parts)
+
+    parts.append(", ")
+    parts.append(_mincFreeList(pList[index]))
+    index += 1
+
+
+    #                                           # Second optional element: Common list.
+    if  (index >= listLength)  or  not isinstance(pList[index], list):
+        if  index < listLength:
+            log.error(f"Candidate DOES NOT CONTAIN Common List.  Ignore remaining elements.  ({pList[index:]})")
+
+        parts.append("}")
+        return  "".join(parts)
+
+    candidateCommonString  = _mincCommonList(pList[index])
+    if  candidateCommonString:
+        parts.append(", ")
+        parts.append(candidateCommonString)
+    index += 1
+
+    if  index < listLength:
+        log.error(f"Candidate CONTAINS EXTRA DATA.  Ignore remaining elements.  ({pList[index:]})")
+
+    parts.append("}")
+    return  "".join(parts)
+
+
+#                                                                    -o-
+def  _mincFormatFromOSCArgs( oscPath  :str, 
+                             oscArgs  :List[Any]
+                          )  -> str:
+    """
+    Generate MinC version of OSC args per CMIX struct OSCData.  
+      (See cmix/cmixHelper.sco.)
+    """
+
+    mincFormat  :str  = None
+
+    #
+    try:
+        mincFormat  = _convertOSCInputToMinCList(oscPath, oscArgs)
+        #log.debug(mincFormat)   #DEBUG
+
+    except Exception as e:
+        log.error(e)
+        return  None
+
+    return  mincFormat
+
+
+#                                                                    -o-
+def  _mainDirectiveFromOSCArgs( oscPath  :str, 
+                                oscArgs  :List[Any]
+                             )  -> str:
+    """
+    RETURNS  "main( <MinC OSCData list> )", via mincCache.
+
+    NB  cmixHelperCompactMinC changes the MinC generated for cmix2 input, 
+          so it is part of the cache key.
+    """
+
+    return  mincCache.get(oscPath, oscArgs, _generateMainDirective, cmixHelperCompactMinC)
+
+
+def  _generateMainDirective(oscPath:str, oscArgs:List[Any])  -> str:
+    mincFormat  = _mincFormatFromOSCArgs(oscPath, oscArgs)
+
+    if  None is mincFormat:  
+        return  None
+
+    return  f"main( {mincFormat} )"
+
+
+
+
+#                                                                    -o-
+def  _encodeOSCDataCompact(oscDataList:List[list])  -> List[Any]:
+    """
+    RETURNS  OSC arguments for cmix2: three per OSCData object--
+
+        label        :str    -- Path or label.
+        free_list    :list   -- Sent as OSC array.  May be empty.
+        common_blob  :bytes  -- One byte mask then one float32 (big endian)
+                                per value marked by the mask.  
+                                Bit 7 is always set.  (OSC blobs may not
+                                be empty.)  Bit N (0-4) marks 
+                                _commonListCompactFields[N] as defined.
+                     or False -- OSCData has no common list.  
+                                (OSC False has no data, only a type tag.)
+
+    oscDataList contains objects as created by _createOSCDataObject():
+      [ label, [free_list], [common_list] ], with both lists optional.
+    Common values equal to _defaultCMIXUndefined are not sent.
+    """
+
+    oscArgs  :List[Any]  = []
+
+    for oscData in oscDataList:
+        if  (not isinstance(oscData, list))  or  (len(oscData) <= 0)  or  (not isinstance(oscData[0], str)):
+            log.critical(f"oscData DOES NOT CONFORM to MinC struct OSCData.  ({oscData})")
+
+        freeList    = oscData[1]  if len(oscData) > 1  else []
+        commonList  = oscData[2]  if len(oscData) > 2  else None
+        commonBlob  = False
+
+        if  None is not commonList:
+            if  len(commonList) != _lengthOfOSCDataCommonList:
+                log.critical(f"Common list IS WRONG LENGTH.  ({commonList})")
+
+            mask    = _commonBlobPresent
+            values  = []
+
+            for index, value in enumerate(commonList):
+                if  value != _defaultCMIXUndefined:
+                    mask |= (1 << index)
+                    values.append(value)
+
+            commonBlob = struct.pack(f">B{len(values)}f", mask, *values)
+
+        oscArgs.extend([ oscData[0], list(freeList), commonBlob ])
+
+    return  oscArgs
+
+
+#                                                                    -o-
+def  _decodeOSCDataCompact(oscArgs:List[Any])  -> List[list]:
+    """
+    RETURNS  List of OSCData objects in cmix1 form, decoded from cmix2 
+               arguments (following the cmix2 token).  
+               See _encodeOSCDataCompact().
+
+    Undefined common values are restored as _defaultCMIXUndefined.
+
+    NB  Common values are NOT restored exactly.  They travel as float32, 
+          so they are rounded to about seven significant digits, and 
+          integral values are restored as int.  So 440.0 is restored as 440
+          and 0.1 as 0.10000000149011612.  MinC text for common values 
+          therefore matches that of cmix1 only for ints, and for floats 
+          that are exact in float32 and not integral.  MinC numbers are 
+          double, so values read by the score differ only by float32 rounding.
+
+    Be flexible with processing errors by tossing smallest broken unit.
+    """
+
+    oscDataList  :List[list]  = []
+
+    if  len(oscArgs) % 3:
+        log.error(f"cmix2 arguments ARE NOT triples.  Ignoring trailing arguments.  ({oscArgs[-(len(oscArgs) % 3):]})")
+
+    for index in range(0, len(oscArgs) - 2, 3):
+        label, freeList, commonBlob = oscArgs[index : index + 3]
+
+        if      (not isinstance(label, str))        \
+            or  (not isinstance(freeList, list))    \
+            or  ((False is not commonBlob)  and  (not isinstance(commonBlob, bytes))):
+            log.error(f"Skipping cmix2 triple -- DOES NOT CONFORM to (label, list, blob).  ({oscArgs[index : index + 3]})")
+            continue
+
+        if  False is commonBlob:
+            oscDataList.append([ label, freeList ])
+            continue
+
+        #
+        mask        = commonBlob[0] ^ _commonBlobPresent  if len(commonBlob) > 0  else -1
+        valueCount  = bin(mask).count("1")
+
+        if      (mask < 0)                                      \
+            or  (mask >> _lengthOfOSCDataCommonList)            \
+            or  (len(commonBlob) != 1 + (4 * valueCount)):
+            log.error(f"Common list blob IS MALFORMED.  Ignoring common list.  ({commonBlob})")
+            oscDataList.append([ label, freeList ])
+            continue
+
+        values      = iter(struct.unpack(f">{valueCount}f", commonBlob[1:]))
+        commonList  = []
+
+        for bit in range(_lengthOfOSCDataCommonList):
+            if  mask & (1 << bit):
+                value = next(values)
+                commonList.append(int(value)  if value.is_integer()  else value)
+            else:
+                commonList.append(_defaultCMIXUndefined)
+
+        oscDataList.append([ label, freeList, commonList ])
+
+    return  oscDataList
+
+
+#                                                                    -o-
+def  _convertOSCDataCompactToMinCList(oscPath:str, oscArgs:List[Any])  -> str:
+    """
+    Convert cmix2 input into one flat MinC list of triples, read in CMIX 
+    by parseOSCDataCompact() (cmix/cmixHelper.sco):
+
+        { 'path', {free_list}, {common_list}, 'label', {free_list}, {}, ... }
+
+    Common list is empty when not sent.  Used when cmixHelperCompactMinC is True.
+    """
+
+    parts  :List[str]  = []
+
+    for index, oscData in enumerate(_decodeOSCDataCompact(oscArgs[1:])):
+        label       = oscPath  if (0 == index)  else oscData[0]
+        commonList  = _mincCommonList(oscData[2])  if (len(oscData) > 2)  else None
+
+        parts.append("'" + label + "', " + _mincFreeList(oscData[1]) + ", " + (commonList or "{}"))
+
+    if  not parts:
+        parts.append("'" + oscPath + "', {}, {}")
+
+    return  "{ " + ", ".join(parts) + " }"
+
+
+
+
+#----------------------------------------------- -o--
+# Testing.
+
+#                                                                    -o-
+def  testSendNormalOSCMessagesToScoreEnabledWithOSCData(oscClient:MOSRTcmix)  -> None:
+    """
+    Test how a list of OSC messages is handled by MinC struct OSCData shared conventions.
+    Test range of MOSOSC message, excluding bundles.
+
+    /resetScore is a useful OSC path for test because it provides access to
+      the score, makes no sound and performs a simple atomic action.
+
+    NB  mosRTcmix.cmixBuildEnablesOSC MUST be False.
+    """
+    log.mark()
+
+    
+    # Simple messages.
+    #
+    oscClient.messageSend("/resetScore")
+
+    oscClient.messageSend("/resetScore", "two", 1, 2, 3)
+
+    msg = oscClient.message("/resetScore")
+    msg = oscClient.messageAdd(msg, "two2", 1, 2, 3)
+    oscClient.send(msg)
+                #NB  Same as previous message.
 
 
 
@@ -1000,6 +1895,475 @@ def  testSendNormalAndCMIXMessages()  -> None:
 
 
 
+#                                                                    -o-
+def  _randomOSCDataPayload(rand:random.Random)  -> List[Any]:
+    """
+    Mostly well-formed cmix1 and plain payloads, with some broken parts.
+    """
+
+    def  randomAtom()  -> Any:
+        return  rand.choice([ rand.randint(-100, 100), rand.uniform(-10, 10), 
+                              rand.choice(["a", "freq", "", "x y"]), 
+                              True, None, ])
+
+    def  randomFreeList(depth:int=0)  -> list:
+        return  [ randomFreeList(depth+1)  if (depth < 2) and (rand.random() < 0.15)  else randomAtom()
+                      for _ in range(rand.randint(0, 5)) ]
+
+    def  randomCommonList()  -> list:
+        commonList = [ rand.uniform(0, 10)  for _ in range(_lengthOfOSCDataCommonList) ]
+        if  rand.random() < 0.15:  commonList.pop()
+        if  rand.random() < 0.15:  commonList[0] = "bad"
+        return  commonList
+
+    def  randomCandidate()  -> Any:
+        roll = rand.random()
+        if  roll < 0.05:  return  randomAtom()
+        if  roll < 0.10:  return  []
+
+        candidate = [ rand.choice(["", "label", "voice1"]) ]  if rand.random() > 0.1  else []
+        if  rand.random() < 0.8:  candidate.append(randomFreeList())
+        if  rand.random() < 0.6:  candidate.append(randomCommonList())
+        if  rand.random() < 0.05:  candidate.append(randomAtom())
+        return  candidate
+
+    #
+    if  rand.random() < 0.3:
+        return  randomFreeList()
+
+    return  [ _cmixHelperVersion1 ] + [ randomCandidate() for _ in range(rand.randint(0, 4)) ]
+
+
+#                                                                    -o-
+def  testConvertOSCInputToMinCListEquivalence(trialCount:int=20000, seed:int=1)  -> bool:
+    """
+    Compare output and logged errors of _convertOSCInputToMinCList() with
+    fixed expected values, recorded from the implementation before the 
+    str.join() rewrite.  Cases cover plain and cmix1 payloads, nested 
+    lists, and each kind of broken part.
+    Then check over random OSCData payloads that input is not modified.
+    """
+
+    expectedCases  :List[Tuple[List[Any], str, List[str]]]  = [
+        ( [],
+          "{ {'/path'} }",
+          [] ),
+        ( [ 60, 0.25, 0.8 ],
+          "{ {'/path', {60, 0.25, 0.8}} }",
+          [] ),
+        ( [ "a", "x y", 3, [1, ["b", 2.5]] ],
+          "{ {'/path', {'a', 'x y', 3, {1, {'b', 2.5}}}} }",
+          [] ),
+        ( [ True, None, -4 ],
+          "{ {'/path', {True, None, -4}} }",
+          [] ),
+        ( [ _cmixHelperVersion1 ],
+          "{ {'/path'} }",
+          [] ),
+        ( [ _cmixHelperVersion1, ["", [60, 0.25, 0.8]] ],
+          "{ {'/path', {60, 0.25, 0.8}} }",
+          [] ),
+        ( [ _cmixHelperVersion1, ["voice1", [], [0, 1, 2, 3, 4]] ],
+          "{ {'/path', {}, {0, 1, 2, 3, 4}} }",
+          [] ),
+        ( [ _cmixHelperVersion1, ["", [60, 62, 64], [0, 0.25, 0.8, 0.5, 1]], 
+                                 ["pluck", [440.0, "sine", [1, 2]], [1, 0.5, 0.5, 0.25, 2]] ],
+          "{ {'/path', {60, 62, 64}, {0, 0.25, 0.8, 0.5, 1}}, "
+              "{'pluck', {440.0, 'sine', {1, 2}}, {1, 0.5, 0.5, 0.25, 2}} }",
+          [] ),
+        ( [ _cmixHelperVersion1, ["", [1]], ["bad", [2], [1, 2]] ],
+          "{ {'/path', {1}}, {'bad', {2}} }",
+          [ "Common list candidate DOES NOT EXIST or IS WRONG LENGTH.  ([1, 2])" ] ),
+        ( [ _cmixHelperVersion1, ["", [1], ["bad", 1, 2, 3, 4]] ],
+          "{ {'/path', {1}} }",
+          [ "Common list candidate contains non-numeric values.  (['bad', 1, 2, 3, 4])" ] ),
+        ( [ _cmixHelperVersion1, ["", [1], [0, 1, 2, 3, 4], 9] ],
+          "{ {'/path', {1}, {0, 1, 2, 3, 4}} }",
+          [ "Candidate CONTAINS EXTRA DATA.  Ignore remaining elements.  ([9])" ] ),
+        ( [ _cmixHelperVersion1, 7, ["", [1]] ],
+          "{ {'/path'}, {'', {1}} }",
+          [ "First candidate is not a list.  Prepending new list with OSC Path only.  (7)",
+            "Skipping candidate -- DOES NOT CONFORM to MinC struct OSCData.  (7)" ] ),
+        ( [ _cmixHelperVersion1, [], ["", [2]] ],
+          "{ {'/path'}, {'', {2}} }",
+          [ "First candidate is empty list.  Inserting OSC Path.  ([])" ] ),
+        ( [ _cmixHelperVersion1, [[1, 2]] ],
+          "{ {'/path', {1, 2}} }",
+          [ "First candidate is missing path placeholder.  Inserting OSC Path.  ([[1, 2]])" ] ),
+    ]
+
+    rand        = random.Random(seed)
+    isAllEqual  = True
+    logError    = log.error
+
+    try:
+        for oscArgs, outputExpected, errorsExpected in expectedCases:
+            errors  :List[str]  = []
+            log.error = lambda message, *args: errors.append(str(message))
+            output = _convertOSCInputToMinCList("/path", oscArgs)
+
+            if  (output != outputExpected)  or  (errors != errorsExpected):
+                log.error = logError
+                log.error(f"MinC conversion MISMATCH for {oscArgs}:\n    {outputExpected} {errorsExpected}\n    {output} {errors}")
+                isAllEqual = False
+
+        for _ in range(trialCount):
+            oscArgs = _randomOSCDataPayload(rand)
+
+            log.error = lambda message, *args: None
+            oscArgsBefore = copy.deepcopy(oscArgs)
+            _convertOSCInputToMinCList("/path", oscArgs)
+
+            if  oscArgsBefore != oscArgs:
+                log.error = logError
+                log.error(f"MinC conversion MODIFIED input {oscArgsBefore}.")
+                isAllEqual = False
+    finally:
+        log.error = logError
+
+    log.info(f"MinC conversion equivalence: {'PASSED' if isAllEqual else 'FAILED'}  ({len(expectedCases)} cases, {trialCount} payloads)")
+
+    return  isAllEqual
+
+#ENDDEF -- testConvertOSCInputToMinCListEquivalence()
+
+
+#                                                                    -o-
+def  testConvertOSCInputToMinCListBenchmark(conversionCount:int=50000)  -> dict:
+    """
+    Time conversion of realistic OSCData payloads, as sent by 
+    MOSRTcmix.messageCMIXOSCData() and the demo sequencers.
+    """
+
+    commonList  = list(_createCommonList(start=0, dur=0.25, amp=0.8, pan=0.5).values())
+
+    payloads = [
+        [ 60, 0.25, 0.8 ],
+        [ _cmixHelperVersion1, ["", [60, 0.25, 0.8]] ],
+        [ _cmixHelperVersion1, ["", [60, 62, 64, 65, 67], commonList] ],
+        [ _cmixHelperVersion1, ["", [], commonList], ["pluck", [440.0, "sine", [1, 2, 3]], commonList] ],
+        [ _cmixHelperVersion1 ] + [ [f"voice{index}", [index, 0.5, 0.25], commonList] for index in range(8) ],
+    ]
+
+    timeStart = time.perf_counter()
+    for index in range(conversionCount):
+        _convertOSCInputToMinCList("/lowSequence", payloads[index % len(payloads)])
+    currentSeconds = time.perf_counter() - timeStart
+
+    results = { "conversionCount"           : conversionCount,
+                "currentUsecPerConversion"  : currentSeconds * 1e6 / conversionCount,
+              }
+
+    log.info(f"MinC conversion benchmark:  {results}")
+
+    return  results
+
+#ENDDEF -- testConvertOSCInputToMinCListBenchmark()
+
+
+
+
+
+#                                                                    -o-
+def  testMinCCache(eventCount:int=50000, seed:int=1)  -> dict:
+    """
+    Check cached main() directives against direct conversion, including
+    values that must not share keys (1, 1.0, True), then time a stream 
+    of repetitive sequencer events with and without the cache.
+    """
+
+    rand   = random.Random(seed)
+    cache  = MinCCache(64)
+
+    #
+    for oscArgs in [ [1], [1.0], [True], ["1"], [[1]], [(1,)] ]:
+        expected  = _generateMainDirective("/check", list(oscArgs))
+        found     = cache.get("/check", oscArgs, _generateMainDirective)
+        again     = cache.get("/check", oscArgs, _generateMainDirective)
+
+        if  (expected != found)  or  (found != again):
+            log.error(f"MinC cache MISMATCH for {oscArgs}:  {expected} != {found}")
+
+    for _ in range(2):
+        if  cache.get("/check", [object()], lambda p, a: "uncached")  != "uncached":
+            log.error("MinC cache DID NOT BYPASS uncacheable value.")
+
+    # NB  Changing cmixHelperCompactMinC changes the MinC for cmix2 input.
+    #
+    global cmixHelperCompactMinC
+
+    compactMinCSaved  = cmixHelperCompactMinC
+    oscArgs           = [ _cmixHelperVersion2 ] + _encodeOSCDataCompact([ [ "", [60, 0.5] ] ])
+
+    for isCompact in [ False, True, False ]:
+        cmixHelperCompactMinC = isCompact
+
+        if  _mainDirectiveFromOSCArgs("/check", oscArgs) != _generateMainDirective("/check", oscArgs):
+            log.error(f"MinC cache IGNORED cmixHelperCompactMinC={isCompact}.")
+
+    cmixHelperCompactMinC = compactMinCSaved
+
+
+    # Scale tones and ornaments: few distinct events.
+    #
+    commonList  = list(_createCommonList(dur=0.25, amp=0.8).values())
+    scale       = [ 60, 62, 64, 65, 67, 69, 71, 72 ]
+    events      = [ [ _cmixHelperVersion1, ["", [rand.choice(scale), rand.choice([0.25, 0.5])], commonList] ]
+                        for _ in range(eventCount) ]
+
+    cache = MinCCache(256)
+
+    timeStart = time.perf_counter()
+    for oscArgs in events:
+        _generateMainDirective("/lowSequence", oscArgs)
+    uncachedSeconds = time.perf_counter() - timeStart
+
+    timeStart = time.perf_counter()
+    for oscArgs in events:
+        cache.get("/lowSequence", oscArgs, _generateMainDirective)
+    cachedSeconds = time.perf_counter() - timeStart
+
+    results = { "eventCount"           : eventCount,
+                "uncachedUsecPerEvent" : uncachedSeconds * 1e6 / eventCount,
+                "cachedUsecPerEvent"   : cachedSeconds * 1e6 / eventCount,
+                "speedup"              : uncachedSeconds / cachedSeconds,
+                **cache.statistics(),
+              }
+
+    log.info(f"MinC cache:  {results}")
+
+    return  results
+
+#ENDDEF -- testMinCCache()
+
+
+
+
+#                                                                    -o-
+def  testOSCDataCompactRoundTrip()  -> bool:
+    """
+    Check that cmix2 encoding decodes to the same OSCData as was encoded,
+    both directly and through OSC message encoding and parsing, and that
+    the resulting MinC equals that of cmix1, for common values that are 
+    ints or exact in float32.  Check that other common values decode 
+    to float32 precision, integral values as int.  Post packet sizes.
+    """
+
+    isAllEqual  = True
+
+    commonFull     = list(_createCommonList(0, 0.25, 0.5, 440, 1).values())
+    commonPartial  = list(_createCommonList(dur=20, freq=30).values())
+    commonNone     = list(_createCommonList().values())
+
+    cases = [
+        [ [ "", [] ] ],
+        [ [ "", [60, 0.25, "sine"] ] ],
+        [ [ "", [60, [1, 2, [3]]], commonFull ] ],
+        [ [ "", [], commonPartial ] ],
+        [ [ "", [], commonNone ] ],
+        [ [ "", [1], commonFull ], [ "pluck", [440.0, "x"], commonPartial ], [ "bare", [] ] ],
+    ]
+
+    #
+    def  normalize(oscDataList:List[list])  -> List[list]:
+        return  [ [ oscData[0], oscData[1] ] + 
+                      ( [ [ struct.unpack(">f", struct.pack(">f", value))[0]  for value in oscData[2] ] ]
+                            if len(oscData) > 2  else [] )
+                    for oscData in oscDataList ]
+
+    for oscDataList in cases:
+        encoded  = _encodeOSCDataCompact(oscDataList)
+        decoded  = _decodeOSCDataCompact(encoded)
+
+        builder = OscMessageBuilder("/roundTrip")
+        for arg in [ _cmixHelperVersion2 ] + encoded:
+            builder.add_arg(arg)
+        parsedArgs = osc_message.OscMessage(builder.build().dgram).params
+
+        # NB  cmix1 sends OSC path as first label.  See MOSRTcmix.cmixMessage().
+        #
+        builder1 = OscMessageBuilder("/roundTrip")
+        for arg in [ _cmixHelperVersion1 ] + [ [ "/roundTrip" ] + oscDataList[0][1:] ] + oscDataList[1:]:
+            builder1.add_arg(arg)
+        parsedArgs1 = osc_message.OscMessage(builder1.build().dgram).params
+
+        mincCompact  = _convertOSCInputToMinCList("/roundTrip", parsedArgs)
+        mincV1       = _convertOSCInputToMinCList("/roundTrip", parsedArgs1)
+
+        if      (normalize(decoded) != normalize(oscDataList))                  \
+            or  (_decodeOSCDataCompact(parsedArgs[1:]) != decoded)              \
+            or  (mincCompact != mincV1):
+            log.error(f"cmix2 round trip MISMATCH:  {oscDataList}\n    {decoded}\n    {mincCompact}\n    {mincV1}")
+            isAllEqual = False
+
+        log.info(f"cmix1 {len(builder1.build().dgram)} bytes, cmix2 {len(builder.build().dgram)} bytes  :: {oscDataList}")
+
+    # NB  Common values are rounded to float32.  Integral values decode as int.
+    #
+    lossyCommonList  = list(_createCommonList(dur=0.1, freq=440.0).values())
+    expected         = [ _defaultCMIXUndefined, 0.10000000149011612, _defaultCMIXUndefined, 440, _defaultCMIXUndefined ]
+    decoded          = _decodeOSCDataCompact(_encodeOSCDataCompact([ [ "", [], lossyCommonList ] ]))[0][2]
+
+    if  (decoded != expected)  or  (not isinstance(decoded[3], int)):
+        log.error(f"cmix2 common list precision MISMATCH:  {decoded} != {expected}")
+        isAllEqual = False
+
+    log.info(f"cmix2 round trip: {'PASSED' if isAllEqual else 'FAILED'}  ({len(cases) + 1} cases)")
+
+    return  isAllEqual
+
+#ENDDEF -- testOSCDataCompactRoundTrip()
+
+
+#                                                                    -o-
+def  testBundleToCMIX(  messageCount        :int    = 64,
+                        delayTimeInSeconds  :float  = 0.25,
+                        port                :int    = 50557,
+                     )  -> bool:
+    """
+    Send a bundle of messageCount messages, plus a nested delayed bundle,
+    to a local UDP socket standing in for CMIX.  Confirm that each timetag 
+    arrives as one MinC script of main() directives, and that the delayed 
+    script arrives no earlier than delayTimeInSeconds.
+    """
+
+    global cmixBuildEnablesOSC
+
+    received                  :List[Tuple[float, osc_message.OscMessage]]  = []
+    isPassed                  :bool                                        = True
+    cmixBuildEnablesOSCSaved  :bool                                        = cmixBuildEnablesOSC
+
+    serverSocket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    serverSocket.bind(("127.0.0.1", port))
+    serverSocket.settimeout(delayTimeInSeconds + 1.0)
+
+    cmixBuildEnablesOSC = True
+
+    client = MOSRTcmix()
+    client.enablePathLogging = False
+    client.createClient("127.0.0.1", port)
+
+    # NB  Delay is measured from creation of delayedBundle.
+    #
+    timeStart      = time.monotonic()
+    delayedBundle  = client.bundle( client.cmixMessage("/lowSequence", [0], commonList={"dur": 2}), 
+                                    delayTimeInSeconds=delayTimeInSeconds )
+    bundle         = client.bundle( *[ client.cmixMessage("/lowSequence", [index], commonList={"amp": 0.5})  
+                                            for index in range(messageCount) ],
+                                    delayedBundle )
+
+    client.send(bundle)
+
+    try:
+        while  len(received) < 2:
+            datagram = serverSocket.recv(65536)
+            received.append((time.monotonic() - timeStart, osc_message.OscMessage(datagram)))
+    except  OSError:
+        pass
+
+    #
+    client.destroyClient()
+    serverSocket.close()
+    cmixBuildEnablesOSC = cmixBuildEnablesOSCSaved
+
+    if  len(received) != 2:
+        log.error(f"Expected 2 MinC scripts, received {len(received)}.")
+        isPassed = False
+    else:
+        immediateScript  = received[0][1].params[0]
+        delayedScript    = received[1][1].params[0]
+
+        if      (immediateScript.count("main(") != messageCount)  \
+            or  (delayedScript.count("main(") != 1)  \
+            or  (received[1][0] < delayTimeInSeconds)  \
+            or  (cmixOSCPath != received[0][1].address):
+            log.error(f"Bundle to CMIX MISMATCH:  {[ (_[0], _[1].params) for _ in received ]}")
+            isPassed = False
+
+        log.info(f"{messageCount + 1} bundled messages sent as 2 MinC scripts "
+                 f"({len(immediateScript)} + {len(delayedScript)} bytes), "
+                 f"delayed script after {received[1][0]:.3f} seconds.")
+
+    log.info(f"Bundle to CMIX: {'PASSED' if isPassed else 'FAILED'}")
+
+    return  isPassed
+
+#ENDDEF -- testBundleToCMIX()
+
+
+
+
+#                                                                    -o-
+def  testCMIXRunsDirectivesFromStdin(  cmixProcessArgs   :List   = None,
+                                       timeoutInSeconds  :float  = 5.0,
+                                    )  -> bool:
+    """
+    Start CMIX as CMIXWorkerPool starts a worker, write one MinC directive
+    to its stdin and, WITHOUT closing stdin, wait up to timeoutInSeconds 
+    for CMIX to run it.  The directive prints a marker, which is sought in
+    CMIX output.
+
+    RETURNS  True if CMIX runs directives as they arrive, in which case
+               enableCMIXWorkerPool may be set True.
+             False if CMIX waits for EOF, or cannot be started.
+    """
+
+    marker       :str              = "MOSRTcmixDirectiveIsLive"
+    output       :List[bytes]      = []
+    markerFound  :threading.Event  = threading.Event()
+    isPassed     :bool             = False
+
+    cmixProcess  :Popen  = None
+
+    if  not cmixProcessArgs:  cmixProcessArgs = ["CMIX"]
+
+
+    #
+    def  readOutput()  -> None:
+        for line in iter(cmixProcess.stdout.readline, b""):
+            output.append(line)
+            if  marker.encode('ascii') in line:
+                markerFound.set()
+
+    try:
+        cmixProcess = Popen(cmixProcessArgs, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    except  Exception as e:
+        log.error(f"CMIX CANNOT BE STARTED.  ({e})")
+        return  False
+
+    readerThread = threading.Thread(target=readOutput, daemon=True)
+    readerThread.start()
+
+    try:
+        cmixProcess.stdin.write(f'print("{marker}")\n'.encode('ascii'))
+        cmixProcess.stdin.flush()
+
+        isPassed = markerFound.wait(timeout=timeoutInSeconds)
+
+    except  Exception as e:
+        log.error(f"CMIX FAILED on write.  ({e})")
+
+    finally:
+        cmixProcess.kill()
+        cmixProcess.wait()
+        readerThread.join(timeout=1.0)
+
+
+    #
+    if  isPassed:
+        log.info("CMIX runs MinC directives as they arrive on stdin.  CMIXWorkerPool may be enabled.")
+    else:
+        log.error(  f"CMIX did NOT run a MinC directive within {timeoutInSeconds} seconds, "
+                    f"with stdin open.  DO NOT enable CMIXWorkerPool.  "
+                    f"(Output: {b''.join(output)[-200:]})" )
+
+    return  isPassed
+
+#ENDDEF -- testCMIXRunsDirectivesFromStdin()
+
+
+
+
 #-------------------------------------- -o--
 # Main, for testing.
 